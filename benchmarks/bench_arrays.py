@@ -0,0 +1,40 @@
+"""
+measure the validation of large homogeneous primitive arrays
+
+usage: python -m benchmarks.bench_arrays
+"""
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+
+
+def validate(name: str, schema: dict, values: list):
+    validator = Validator({"values": schema}, {cfg.enable_output_logs: False})
+    document = {"values": values}
+
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        validator.execute(document)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"{name:<28} {len(values):>9} items  {best * 1e3:>8.1f} ms")
+
+
+def main():
+    for size in [100_000, 1_000_000]:
+        integers = list(range(size))
+        floats = [i / 10 for i in range(size)]
+
+        validate("integer_array", {"__data_type__": "integer_array"}, integers)
+        validate("integer_array with range", {"__data_type__": "integer_array", "__min_value__": 0,
+                                              "__max_value__": size}, integers)
+        validate("float_array with range", {"__data_type__": "float_array", "__min_value__": 0.0,
+                                            "__max_value__": float(size)}, floats)
+        validate("string_array", {"__data_type__": "string_array"}, [str(i) for i in range(size)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+local load test of the async validations, many documents are validated concurrently while a ticker task measures
+how late the event loop runs it, a late ticker means the loop was blocked
+
+usage: python -m benchmarks.bench_async [documents]
+"""
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from benchmarks.bench_validator import build_schema
+
+
+def build_document(items: int) -> str:
+    document = {f"field_{i}": f"value {i}" for i in range(30)}
+    document["items"] = [{"sku": f"ABC-{i}", "quantity": i + 1, "price": 1.5} for i in range(items)]
+    return json.dumps(document)
+
+
+async def ticker(lags: list, stop: asyncio.Event, interval: float = 0.005):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run(name: str, validator: Validator, documents: list, validation):
+    lags = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    outputs = await validation(validator, documents)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker_task
+    lags.sort()
+
+    print(f"{name:<26} {len(outputs):>6} docs  {len(outputs) / elapsed:>8.0f} docs/s  "
+          f"loop lag p50 {lags[len(lags) // 2] * 1e3:>6.1f} ms  max {lags[-1] * 1e3:>7.1f} ms")
+
+
+async def blocking(validator: Validator, documents: list):
+    return [validator.execute(document) for document in documents]
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    validator = Validator(build_schema(30), {cfg.enable_output_logs: False})
+
+    for items in [10, 2_000]:
+        documents = [build_document(items) for _ in range(count if items == 10 else count // 50)]
+        print(f"documents of {len(documents[0]) / 1024:.1f} KB")
+
+        await run("execute on the loop", validator, documents, blocking)
+        await run("execute_many_async", validator, documents,
+                  lambda v, docs: v.execute_many_async(docs, limit=16))
+
+        with ProcessPoolExecutor(2) as executor:
+            await run("execute_many_async (2 proc)", validator, documents,
+                      lambda v, docs: v.execute_many_async(docs, limit=16, executor=executor))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+measure the cost of __bind__ lookups against large list binders and of comparing bound objects
+
+usage: python -m benchmarks.bench_binding
+"""
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.utils.util import is_same_value, has_number_values
+
+
+def validate(binder_size: int, items: int):
+    schema = {
+        "__data_type__": "object_array",
+        "__binder__": {
+            "skus": [f"SKU-{i:07d}" for i in range(binder_size)]
+        },
+        "sku*": {"__bind__": "skus"}
+    }
+    document = [{"sku": f"SKU-{(i * 7919) % binder_size:07d}"} for i in range(items)]
+
+    validator = Validator(schema, {cfg.enable_output_logs: False})
+
+    started = time.perf_counter()
+    output = validator.execute(document)
+    elapsed = time.perf_counter() - started
+    print(f"binder {binder_size:>7}  {items:>6} items  {elapsed / items * 1e6:>10.1f} us/item  "
+          f"{len(output.document_result)} results")
+
+
+def compare(options: int, items: int):
+    numbers = {f"option_{i}": {"enabled": i % 2 == 0, "limits": [i, i * 2]} for i in range(options)}
+    strings = {f"option_{i}": {"mode": f"mode_{i}", "tags": ["a", "b"]} for i in range(options)}
+
+    for kind, expected in [("numbers", numbers), ("strings", strings)]:
+        has_numbers = has_number_values(expected)
+        # the bound config object is repeated on every item, equal but with its keys in reverse order
+        equal = dict(reversed(expected.items()))
+        different = dict(expected, option_0={})
+
+        for name, value in [("equal", equal), ("different", different)]:
+            started = time.perf_counter()
+            for _ in range(items):
+                str(expected) != str(value)
+            by_string = time.perf_counter() - started
+
+            # same check as ValidateDocBinding
+            started = time.perf_counter()
+            for _ in range(items):
+                expected == value and (not has_numbers or is_same_value(expected, value))
+            by_structure = time.perf_counter() - started
+
+            print(f"object {options:>6} {kind:<8} {name:<10} str() {by_string / items * 1e6:>9.1f} us/item  "
+                  f"structural {by_structure / items * 1e6:>9.1f} us/item")
+
+
+def main():
+    for binder_size in [5_000, 50_000, 200_000]:
+        validate(binder_size, 1_000)
+
+    for options in [50, 500, 2_000]:
+        compare(options, 1_000)
+
+
+if __name__ == '__main__':
+    main()
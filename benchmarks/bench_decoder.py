@@ -0,0 +1,62 @@
+"""
+compare the installed json decoders on a large document file, parsing alone and the whole file validation
+
+usage: python -m benchmarks.bench_decoder [items]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.utils import json_decoder
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    schema = {
+        "__data_type__": "object_array",
+        "id*": {"__data_type__": "integer"},
+        "name*": {"__data_type__": "string", "__max_length__": 64},
+        "price": {"__data_type__": "float"},
+        "tags": {"__data_type__": "string_array"}
+    }
+    document = [{"id": i, "name": f"product {i} ünïcode", "price": i / 100, "tags": ["a", "b"]} for i in range(items)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        doc_file = os.path.join(tmp_dir, "products.json")
+        with open(doc_file, "w", encoding="utf-8") as file:
+            json.dump(document, file, ensure_ascii=False)
+
+        print(f"{items} items, {os.path.getsize(doc_file) / 2 ** 20:.1f} MB")
+
+        with open(doc_file, "rb") as file:
+            content = file.read()
+        text = content.decode()
+
+        for name in json_decoder.available_decoders():
+            from_text = best_of(lambda: json_decoder.loads(text, name))
+            from_bytes = best_of(lambda: json_decoder.loads(content, name))
+
+            validator = Validator(schema, {cfg.enable_output_logs: False, cfg.json_decoder: name})
+            validation = best_of(lambda: validator.execute(doc_file), 1)
+
+            print(f"{name:<8} parse str {from_text * 1e3:>8.1f} ms  parse bytes {from_bytes * 1e3:>8.1f} ms  "
+                  f"validate file {validation * 1e3:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+measure the wall clock time of a directory validation with different number of jobs
+
+usage: python -m benchmarks.bench_jobs [documents] [max jobs]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import execute
+from benchmarks.bench_validator import build_schema, build_document
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schema_file = os.path.join(tmp_dir, "schema.json")
+        doc_dir = os.path.join(tmp_dir, "docs")
+        os.mkdir(doc_dir)
+
+        with open(schema_file, "w") as file:
+            json.dump(build_schema(30), file)
+
+        document = json.dumps(build_document(30))
+        for i in range(documents):
+            with open(os.path.join(doc_dir, f"doc_{i}.json"), "w") as file:
+                file.write(document)
+
+        jobs = 1
+        while jobs <= max_jobs:
+            cfg.configs[cfg.jobs] = jobs
+            started = time.perf_counter()
+            execute(schema_file, doc_dir, [])
+            elapsed = time.perf_counter() - started
+            print(f"jobs={jobs:<4}{documents:>8} docs  {elapsed:>8.2f} s")
+            jobs *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+compare the peak resident memory of reading a json file into a str against util.parse_file with memory_map (memory
+mapped for orjson) and of reading ndjson lines from a text file against the mapped file lines, every reader runs in a fresh
+process so the peaks don't mix
+
+usage: python -m benchmarks.bench_memory [json size in MB] [ndjson size in MB]
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from jsvl.utils import json_decoder
+from jsvl.utils.mapped_file import MappedFile
+from jsvl.utils.util import read_file, parse_file
+
+
+def write_file(file_path: str, size: int, ndjson: bool):
+    record = json.dumps({"id": 123456, "name": "product name ünïcode", "price": 12.5, "tags": ["a", "b", "c"]},
+                        ensure_ascii=False)
+    records = size // (len(record.encode()) + 2)
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        if ndjson:
+            file.writelines(f"{record}\n" for _ in range(records))
+        else:
+            file.write(f"[{record}")
+            file.writelines(f",\n{record}" for _ in range(records - 1))
+            file.write("]")
+
+
+def peak_rss() -> float:
+    """
+    :return: peak resident memory of the process in MB, ru_maxrss is the fallback as it keeps the peak of the
+    parent process on linux
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_reader(reader: str, decoder: str, file_path: str):
+    started = time.perf_counter()
+
+    if reader == "str":
+        json_decoder.loads(read_file(file_path), decoder)
+
+    elif reader == "parse_file":
+        parse_file(file_path, decoder, True)
+
+    elif reader == "str-lines":
+        with open(file_path, "r") as file:
+            for line in file:
+                json_decoder.loads(line, decoder)
+
+    elif reader == "mapped-lines":
+        with MappedFile(file_path) as mapped_file:
+            for _, line in mapped_file.lines(decoder == "json"):
+                json_decoder.loads(line, decoder)
+
+    elapsed = time.perf_counter() - started
+    print(f"{reader:<12} {decoder:<7} {elapsed:>7.2f} s  peak rss {peak_rss():>8.0f} MB")
+
+
+def main():
+    if len(sys.argv) == 4:
+        return run_reader(*sys.argv[1:])
+
+    json_size = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    ndjson_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size, ndjson, readers in [(json_size, False, ["str", "parse_file"]),
+                                      (ndjson_size, True, ["str-lines", "mapped-lines"])]:
+            file_path = os.path.join(tmp_dir, "document.ndjson" if ndjson else "document.json")
+            write_file(file_path, size << 20, ndjson)
+            print(f"{os.path.basename(file_path)} {os.path.getsize(file_path) >> 20} MB")
+
+            for decoder in json_decoder.available_decoders():
+                for reader in readers:
+                    subprocess.run([sys.executable, "-m", "benchmarks.bench_memory", reader, decoder, file_path],
+                                   check=True)
+
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+measure the time of recording results in ObjectSet and through a full document validation
+
+usage: python -m benchmarks.bench_object_set
+"""
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.models.object_set import ObjectSet
+from jsvl.models.result import Error
+
+
+def record(results: int):
+    object_set = ObjectSet()
+    errors = [Error(f"field_{i} key is missing.") for i in range(results)]
+
+    started = time.perf_counter()
+    for error in errors:
+        object_set.add(error)
+
+    # every message added twice, duplicates are skipped
+    for error in errors:
+        object_set.add(error)
+
+    elapsed = time.perf_counter() - started
+    print(f"ObjectSet.add       {results:>9} results  {elapsed:>8.3f} s")
+
+
+def validate(results: int):
+    validator = Validator({"__data_type__": "object_array", "id*": {}}, {cfg.enable_output_logs: False})
+    document = [{} for _ in range(results)]
+
+    started = time.perf_counter()
+    output = validator.execute(document)
+    elapsed = time.perf_counter() - started
+    print(f"Validator.execute   {len(output.document_result):>9} results  {elapsed:>8.3f} s")
+
+
+def main():
+    for results in [10_000, 100_000, 1_000_000]:
+        record(results)
+
+    for results in [10_000, 100_000]:
+        validate(results)
+
+
+if __name__ == '__main__':
+    main()
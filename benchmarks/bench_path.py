@@ -0,0 +1,116 @@
+"""
+measure the time and the memory of validating a deep and wide valid document, and the allocations of the document
+paths of the traversal, built as dotted strings like before or as linked path segments
+
+usage: python -m benchmarks.bench_path
+"""
+import time
+import tracemalloc
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.models.path import Path, root_path
+
+
+def build(depth: int, width: int):
+    schema = {f"field_{i}": {} for i in range(width)}
+    document = {f"field_{i}": f"value {i}" for i in range(width)}
+
+    for _ in range(depth):
+        schema = {**{f"field_{i}": {} for i in range(width)},
+                  "items": {"__data_type__": "object_array", **schema}}
+        document = {**{f"field_{i}": f"value {i}" for i in range(width)}, "items": [document] * 5}
+
+    return schema, document
+
+
+def count_keys(document) -> int:
+    if type(document) is list:
+        return sum(count_keys(item) for item in document)
+    if type(document) is dict:
+        return len(document) + sum(count_keys(value) for value in document.values())
+    return 0
+
+
+def string_paths(document: dict, path: str, paths: list):
+    """
+    the dotted strings of the former traversal, the full path of every key and the path of every list item once per
+    child key
+    """
+    for key, value in document.items():
+        paths.append(f"{path}.{key}")
+
+        if type(value) is dict:
+            string_paths(value, f"{path}.{key}", paths)
+
+        if type(value) is list:
+            for child_key in value[0]:
+                for i, item in enumerate(value):
+                    item_path = f"{path}.{key}[{i}]"
+                    paths.append(item_path)
+                    string_paths({child_key: item[child_key]}, item_path, paths)
+
+
+def segment_paths(document: dict, path: Path, paths: list):
+    """
+    the path segments of the traversal, a segment per key and per list item
+    """
+    for key, value in document.items():
+        key_path = path.child(key)
+        paths.append(key_path)
+
+        if type(value) is dict:
+            segment_paths(value, key_path, paths)
+
+        if type(value) is list:
+            items = [(key_path.item(i), item) for i, item in enumerate(value)]
+            paths.extend(item_path for item_path, _ in items)
+            for child_key in value[0]:
+                for item_path, item in items:
+                    segment_paths({child_key: item[child_key]}, item_path, paths)
+
+
+def collect(walk, document: dict, path) -> list:
+    paths = []
+    walk(document, path, paths)
+    return paths
+
+
+def traced(name: str, call):
+    """
+    prints the allocated blocks and bytes which are still held after the call and the peak of the call
+    """
+    tracemalloc.start()
+    result = call()
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in stats)
+    size = sum(stat.size for stat in stats)
+    print(f"{name:<24} blocks={blocks:>8}  size={size / 1024:>8.1f} KiB  peak={peak / 1024:>8.1f} KiB")
+    return result
+
+
+def main():
+    schema, document = build(depth=4, width=20)
+    validator = Validator(schema, {cfg.enable_output_logs: False})
+
+    started = time.perf_counter()
+    for _ in range(5):
+        validator.execute(document)
+    elapsed = (time.perf_counter() - started) / 5
+    print(f"keys={count_keys(document)}  time={elapsed:.3f} s")
+
+    # the created paths are held so each allocation is counted
+    strings = traced("string paths", lambda: collect(string_paths, document, "root[0]"))
+    segments = traced("path segments", lambda: collect(segment_paths, document, root_path(0, True)))
+    print(f"paths: strings={len(strings)}  segments={len(segments)}")
+    del strings, segments
+
+    traced("validation", lambda: validator.execute(document))
+
+
+if __name__ == '__main__':
+    main()
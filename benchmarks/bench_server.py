@@ -0,0 +1,78 @@
+"""
+per call latency of a validation through the jsvl command, which starts python and compiles the schema every time,
+and through jsvlc talking to a running jsvl serve over a Unix socket and over HTTP; the round trip is the request
+alone, without starting the client process
+
+usage: python -m benchmarks.bench_server [calls]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from jsvl.core.client import request_validation
+from benchmarks.bench_async import build_document
+from benchmarks.bench_validator import build_schema
+
+
+def measure(name: str, call, calls: int):
+    timings = []
+
+    for _ in range(calls):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    print(f"{name:<22} p50 {timings[len(timings) // 2] * 1e3:>7.1f} ms  max {timings[-1] * 1e3:>7.1f} ms")
+
+
+def run(command: list):
+    return lambda: subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_for(process: subprocess.Popen):
+    # the server prints its address once it's listening
+    process.stdout.readline()
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schema_file = os.path.join(tmp_dir, "order_schema.json")
+        doc_file = os.path.join(tmp_dir, "order.json")
+        socket_path = os.path.join(tmp_dir, "jsvl.sock")
+
+        with open(schema_file, "w") as file:
+            json.dump(build_schema(30), file)
+
+        with open(doc_file, "w") as file:
+            file.write(build_document(10))
+
+        measure("python startup", run([sys.executable, "-c", "pass"]), calls)
+        measure("jsvl", run([sys.executable, "-m", "jsvl.cli", "-s", schema_file, "-d", doc_file]), calls)
+
+        servers = [
+            ("jsvlc unix socket", ["--socket", socket_path], f"unix:{socket_path}"),
+            ("jsvlc http", ["--port", "8799"], "http://127.0.0.1:8799"),
+        ]
+
+        for name, server_args, address in servers:
+            process = subprocess.Popen([sys.executable, "-m", "jsvl.cli", "serve", *server_args],
+                                       stdout=subprocess.PIPE, text=True)
+            try:
+                wait_for(process)
+                client = [sys.executable, "-m", "jsvl.core.client", "--server", address, "-s", schema_file,
+                          "-d", doc_file]
+                measure(name, run(client), calls)
+                measure(f"{name} round trip", lambda: request_validation(address, schema_file, doc_file), calls * 10)
+            finally:
+                process.terminate()
+                process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+compare the per document latency of validate() against a compiled Validator
+
+usage: python -m benchmarks.bench_validator [documents]
+"""
+import sys
+import time
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator, validate
+
+
+def build_schema(fields: int) -> dict:
+    schema = {
+        f"field_{i}*": {"__data_type__": "string", "__min_length__": 1, "__max_length__": 64} for i in range(fields)
+    }
+    schema["items"] = {
+        "__data_type__": "object_array",
+        "sku*": {"__bind_regex__": "^[A-Z]{3}-[0-9]+$"},
+        "quantity*": {"__data_type__": "integer", "__min_value__": 1},
+        "price": {"__data_type__": "float"},
+    }
+    return schema
+
+
+def build_document(fields: int) -> dict:
+    document = {f"field_{i}": f"value {i}" for i in range(fields)}
+    document["items"] = [{"sku": f"ABC-{i}", "quantity": i + 1, "price": 1.5} for i in range(10)]
+    return document
+
+
+def measure(name: str, documents: int, run):
+    started = time.perf_counter()
+    for _ in range(documents):
+        run()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<24}{documents:>8} docs  {elapsed * 1e6 / documents:>10.1f} us/doc")
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cfg.configs[cfg.enable_output_logs] = False
+
+    schema = build_schema(30)
+    document = build_document(30)
+
+    measure("validate()", documents, lambda: validate(schema, document))
+
+    validator = Validator(schema)
+    measure("Validator.validate()", documents, lambda: validator.validate(document))
+
+
+if __name__ == '__main__':
+    main()
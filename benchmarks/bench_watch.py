@@ -0,0 +1,69 @@
+"""
+cost of a watch poll on a large document tree, the first poll hashes every file, an unchanged tree costs a stat per
+directory and per file, a change costs its hash and the listing of its directory; the glob of a plain run is shown
+for comparison
+
+usage: python -m benchmarks.bench_watch [files]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from glob import glob
+
+from jsvl.utils.file_tracker import FileTracker
+
+
+def timed(name: str, call):
+    started = time.perf_counter()
+    result = call()
+    print(f"{name:<28} {(time.perf_counter() - started) * 1e3:>8.1f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    per_dir = 100
+    document = json.dumps({"id": 1, "name": "x" * 200})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for i in range(count):
+            dir_path = os.path.join(tmp_dir, f"dir_{i // per_dir // per_dir}", f"dir_{i // per_dir}")
+            if i % per_dir == 0:
+                os.makedirs(dir_path)
+            paths.append(os.path.join(dir_path, f"order_{i}.json"))
+            with open(paths[-1], "w") as file:
+                file.write(document)
+
+        # out of the racy window, like files which weren't just written
+        past = time.time() - 60
+        for root, dirs, files in os.walk(tmp_dir):
+            os.utime(root, (past, past))
+            for file in files:
+                os.utime(os.path.join(root, file), (past, past))
+
+        print(f"{count} files in {count // per_dir} directories")
+        timed("glob of a plain run", lambda: glob(f"{tmp_dir}/**/*.json", recursive=True))
+
+        tracker = FileTracker(tmp_dir)
+        timed("first poll", tracker.poll)
+        timed("unchanged poll", tracker.poll)
+
+        for path in paths[::count // 10]:
+            with open(path, "w") as file:
+                file.write(document.replace("x", "y", 1))
+
+        changed, _ = timed("poll with 10 changed files", tracker.poll)
+        assert len(changed) == 10
+
+        for path in paths[::count // 10]:
+            os.utime(path)
+
+        changed, _ = timed("poll with 10 touched files", tracker.poll)
+        assert len(changed) == 0
+
+
+if __name__ == '__main__':
+    main()
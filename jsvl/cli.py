@@ -1,3 +1,4 @@
+import sys
 
 from jsvl.core import validator
 from jsvl.core.arg_parser import setup_arg_parser, parse
@@ -5,9 +6,20 @@ from jsvl.core.arg_parser import setup_arg_parser, parse
 
 def run_validation():
 
+    if sys.argv[1:2] == ["serve"]:
+        from jsvl.core import server
+        server.run_server(sys.argv[2:])
+        return
+
     parser = setup_arg_parser()
     args = parse(parser)
-    if args.doc is not None:
+    if args.watch:
+        from jsvl.core import watcher
+        try:
+            watcher.watch(args.schema, args.doc, args.watch_interval)
+        except KeyboardInterrupt:
+            pass
+    elif args.doc is not None:
         validator.validate(args.schema, args.doc)
     else:
         out = []
@@ -1,3 +1,5 @@
+import os
+
 
 root_object_path = "root_object_path"
 schema_file_postfix = "schema_file_postfix"
@@ -11,6 +13,19 @@ max_length = "max_length"
 min_value = "min_value"
 max_value = "max_value"
 case = "case"
+jobs = "jobs"
+ndjson = "ndjson"
+stream = "stream"
+fail_fast = "fail_fast"
+max_errors = "max_errors"
+schema_cache_size = "schema_cache_size"
+json_decoder = "json_decoder"
+url_cache_dir = "url_cache_dir"
+url_cache_ttl = "url_cache_ttl"
+offline = "offline"
+async_concurrency = "async_concurrency"
+async_offload_size = "async_offload_size"
+memory_map = "memory_map"
 
 configs = {
 
@@ -48,5 +63,51 @@ configs = {
     max_value: None,
 
     # set default uppercase constraint
-    case: None
+    case: None,
+
+    # number of processes used to validate a directory of documents, 0 uses all the cores
+    jobs: 1,
+
+    # read the document files as newline delimited json, every line is validated as a separate record
+    ndjson: False,
+
+    # parse the root array of the document files item by item instead of loading the whole file
+    stream: False,
+
+    # stop validating the document at the first error
+    fail_fast: False,
+
+    # stop validating the document once this number of errors is found, None means no limit
+    max_errors: None,
+
+    # number of compiled schema files kept in memory by the process
+    schema_cache_size: 128,
+
+    # json decoder used to parse the schemas and documents: json, auto, orjson or ujson, auto picks the fastest
+    # installed one and json of the standard library is used when the chosen decoder is not installed; the fast
+    # decoders are opt-in since they read some documents differently, e.g. orjson reads an integer beyond 64 bits
+    # as a float and rejects NaN and Infinity
+    json_decoder: "json",
+
+    # directory of the schemas fetched from URLs, None disables the on-disk cache
+    url_cache_dir: os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                                "jsvl", "urls"),
+
+    # number of seconds a cached URL schema is used before it's revalidated with the server
+    url_cache_ttl: 300,
+
+    # load URL schemas only from the cache, no request is made
+    offline: False,
+
+    # number of documents validated at the same time by validate_many_async
+    async_concurrency: 16,
+
+    # json text or bytes documents larger than this number of bytes are validated in the executor by the async
+    # validations instead of the event loop, files, streams and parsed documents are always validated in the executor,
+    # None validates everything but files and streams on the event loop
+    async_offload_size: 1 << 16,
+
+    # read the json files with orjson and the ndjson files through a memory map instead of a copy, it's opt-in since
+    # a file truncated while it's mapped (e.g. rewritten in place by an editor) kills the process with SIGBUS
+    memory_map: False
 }
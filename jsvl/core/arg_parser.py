@@ -1,6 +1,7 @@
 import argparse
 
 import jsvl.config as cfg
+from jsvl.utils import json_decoder
 from jsvl.utils.util import reserved_key
 
 
@@ -24,6 +25,77 @@ def setup_arg_parser() -> argparse.ArgumentParser:
         type=str,
         help="Provide a document json, file or a directory path for validation."
     )
+    parser.add_argument(
+        "--watch",
+        dest="watch",
+        action="store_true",
+        help="Pass this flag to keep watching the schema and document files, only the changed documents and the "
+             "documents of a changed schema are validated again."
+    )
+    parser.add_argument(
+        "--watch-interval",
+        dest="watch_interval",
+        type=float,
+        default=1.0,
+        help="Set the number of seconds between two checks of the watched files, default is 1."
+    )
+    add_config_arguments(parser)
+    parser.add_argument(
+        "-v", "--version",
+        action="version",
+        version="%(prog)s 1.1.0"
+    )
+
+    return parser
+
+
+def setup_server_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jsvl serve",
+        description="Keep the compiled schemas in memory and validate the documents sent by jsvlc.",
+    )
+
+    parser.add_argument(
+        "--socket",
+        dest="socket",
+        type=str,
+        default=None,
+        help="Listen on the given Unix socket path instead of the localhost HTTP port."
+    )
+    parser.add_argument(
+        "--host",
+        dest="host",
+        type=str,
+        default="127.0.0.1",
+        help="Set the HTTP host, default is 127.0.0.1."
+    )
+    parser.add_argument(
+        "--port",
+        dest="port",
+        type=int,
+        default=8765,
+        help="Set the HTTP port, default is 8765."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Set the number of worker processes validating the requests, 0 uses all the cores, default is 1 which "
+             "validates in the request threads."
+    )
+    add_config_arguments(parser)
+
+    return parser
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """
+    adds the arguments of the control configs, shared by the validation and the server commands
+    :param parser: command parser
+    :return: None
+    """
+
     parser.add_argument(
         "-csfp", "--change-schema-file-postfix",
         dest="schema_file_postfix",
@@ -98,16 +170,76 @@ def setup_arg_parser() -> argparse.ArgumentParser:
         help="Set the text constraints globally, default is None."
     )
     parser.add_argument(
-        "-v", "--version",
-        action="version",
-        version="%(prog)s 1.1.0"
+        "-j", "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Set the number of processes used to validate a directory of documents, 0 uses all the cores, default is 1."
+    )
+    parser.add_argument(
+        "--ndjson",
+        dest="ndjson",
+        action="store_true",
+        help="Pass this flag to read the document files as newline delimited json, every line is validated as a record."
+    )
+    parser.add_argument(
+        "--stream",
+        dest="stream",
+        action="store_true",
+        help="Pass this flag to parse and validate the root array of the document files item by item."
+    )
+    parser.add_argument(
+        "--fail-fast",
+        dest="fail_fast",
+        action="store_true",
+        help="Pass this flag to stop validating the document at the first error."
+    )
+    parser.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        type=int,
+        default=None,
+        help="Stop validating the document once the given number of errors is found, default is None."
+    )
+    parser.add_argument(
+        "--json-decoder",
+        dest="json_decoder",
+        type=str,
+        choices=[json_decoder.auto, *json_decoder.decoder_names],
+        default="json",
+        help="Set the json decoder, auto picks the fastest installed one and falls back to json, default is json."
+    )
+    parser.add_argument(
+        "--url-cache-dir",
+        dest="url_cache_dir",
+        type=str,
+        default=cfg.configs.get(cfg.url_cache_dir),
+        help="Set the directory of the schemas fetched from URLs, default is ~/.cache/jsvl/urls."
+    )
+    parser.add_argument(
+        "--url-cache-ttl",
+        dest="url_cache_ttl",
+        type=float,
+        default=300,
+        help="Set the number of seconds a cached URL schema is used before it's revalidated, default is 300."
+    )
+    parser.add_argument(
+        "--offline",
+        dest="offline",
+        action="store_true",
+        help="Pass this flag to load the URL schemas only from the cache without any request."
+    )
+    parser.add_argument(
+        "--memory-map",
+        dest="memory_map",
+        action="store_true",
+        help="Pass this flag to read the json files with orjson and the ndjson files through a memory map instead of "
+             "a copy, a file truncated while it's mapped kills the process."
     )
-
-    return parser
 
 
-def parse(parser) -> argparse.Namespace:
-    args = parser.parse_args()
+def parse(parser, arguments: list = None) -> argparse.Namespace:
+    args = parser.parse_args(arguments)
     cfg.configs[cfg.schema_file_postfix] = args.schema_file_postfix
     cfg.configs[cfg.enable_output_tags] = args.enable_output_tags
     cfg.configs[cfg.formatted_output] = args.formatted_output
@@ -119,5 +251,15 @@ def parse(parser) -> argparse.Namespace:
     cfg.configs[cfg.min_value] = args.min_value
     cfg.configs[cfg.max_value] = args.max_value
     cfg.configs[cfg.case] = args.case
+    cfg.configs[cfg.jobs] = args.jobs
+    cfg.configs[cfg.ndjson] = args.ndjson
+    cfg.configs[cfg.stream] = args.stream
+    cfg.configs[cfg.fail_fast] = args.fail_fast
+    cfg.configs[cfg.max_errors] = args.max_errors
+    cfg.configs[cfg.json_decoder] = args.json_decoder
+    cfg.configs[cfg.url_cache_dir] = args.url_cache_dir
+    cfg.configs[cfg.url_cache_ttl] = args.url_cache_ttl
+    cfg.configs[cfg.offline] = args.offline
+    cfg.configs[cfg.memory_map] = args.memory_map
 
     return args
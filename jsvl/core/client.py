@@ -0,0 +1,185 @@
+import argparse
+import json
+import os
+import socket
+import sys
+
+import jsvl.config as cfg
+from jsvl.utils.logger import logger
+
+# address of the server when neither --server nor JSVL_SERVER is given
+default_address = "http://127.0.0.1:8765"
+
+
+def connect(address: str, timeout: float = None) -> socket.socket:
+    """
+    :param address: unix:/path/to/socket or http://host:port
+    :param timeout: seconds to wait for the server
+    :return: socket connected to the server
+    """
+
+    if address.startswith("unix:"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address[len("unix:"):])
+        return sock
+
+    host, _, port = address.split("://", 1)[-1].rstrip("/").rpartition(":")
+    return socket.create_connection((host, int(port)), timeout)
+
+
+def host_header(address: str) -> str:
+    """
+    :param address: unix:/path/to/socket or http://host:port
+    :return: Host header of the request, the server answers only to its own host
+    """
+
+    if address.startswith("unix:"):
+        return "localhost"
+
+    return address.split("://", 1)[-1].rstrip("/")
+
+
+def resolve_input(value):
+    """
+    paths are sent as absolute paths since the server could run in another directory, anything else (json text,
+    URL) is sent as it is
+    """
+    return os.path.abspath(value) if value is not None and os.path.exists(value) else value
+
+
+def request_validation(address: str, schema, document=None, timeout: float = None) -> dict:
+    """
+    this method is responsible to send a validation request to the server, the request is written by hand since
+    importing http.client costs more than the validation itself
+    :param address: unix:/path/to/socket or http://host:port
+    :param schema: schema json, json text, file or directory path or URL, as seen by the server
+    :param document: document json, json text, file or directory path, None validates the schema only
+    :param timeout: seconds to wait for the server
+    :return: {"valid": True or False, "outputs": [{"schema_result": [...], "document_result": [...]}]}
+    """
+
+    body = json.dumps({"schema": schema, "document": document}).encode()
+    head = (f"POST /validate HTTP/1.1\r\nHost: {host_header(address)}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode()
+    chunks = []
+
+    with connect(address, timeout) as sock:
+        sock.sendall(head + body)
+
+        # the server closes the connection after the response
+        while True:
+            chunk = sock.recv(1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    status_line, _, rest = b"".join(chunks).partition(b"\r\n")
+    content = json.loads(rest.partition(b"\r\n\r\n")[2])
+
+    if status_line.split()[1] != b"200":
+        raise ValueError(content.get("error"))
+
+    return content
+
+
+def dump_results(response: dict):
+    """
+    prints the results of the response in the same format as the validation command
+    """
+
+    log = {"success": logger.success, "info": logger.info, "warn": logger.warn, "error": logger.error}
+
+    if response.get("error") is not None:
+        logger.error(response.get("error"))
+
+    for output in response.get("outputs"):
+        print()
+
+        for result in output.get("schema_result") + output.get("document_result"):
+            log.get(result.get("type"), logger.info)(result.get("message"))
+
+        print()
+        print("=-" * 50)
+
+
+def setup_client_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="jsvlc",
+        description="Send the validation to a running jsvl serve, the schemas stay compiled in the server.",
+    )
+
+    parser.add_argument(
+        "-s", "--schema",
+        dest="schema",
+        required=True,
+        type=str,
+        help="Provide a schema json, file, directory path or URL for validating the documents."
+    )
+    parser.add_argument(
+        "-d", "--doc",
+        dest="doc",
+        type=str,
+        help="Provide a document json, file or a directory path for validation."
+    )
+    parser.add_argument(
+        "--server",
+        dest="server",
+        type=str,
+        default=os.environ.get("JSVL_SERVER", default_address),
+        help=f"Address of the server, unix:/path/to/socket or http://host:port, default is JSVL_SERVER or "
+             f"{default_address}."
+    )
+    parser.add_argument(
+        "--timeout",
+        dest="timeout",
+        type=float,
+        default=None,
+        help="Set the number of seconds to wait for the server, default is None."
+    )
+    parser.add_argument(
+        "--disable-tags",
+        dest="enable_output_tags",
+        action="store_false",
+        help="Pass this flag to disable the output tags from logs."
+    )
+    parser.add_argument(
+        "--plain-output",
+        dest="formatted_output",
+        action="store_false",
+        help="Pass this flag to remove the formatting from logs."
+    )
+    parser.add_argument(
+        "--disable-logs",
+        dest="enable_output_logs",
+        action="store_false",
+        help="Pass this flag to disable all the logs."
+    )
+
+    return parser
+
+
+def main(arguments: list = None) -> int:
+    """
+    entry of the jsvlc command
+    :return: 0 when everything is valid, 1 when any error is found, 2 when the server can't be reached
+    """
+
+    args = setup_client_arg_parser().parse_args(arguments)
+    cfg.configs[cfg.enable_output_tags] = args.enable_output_tags
+    cfg.configs[cfg.formatted_output] = args.formatted_output
+
+    try:
+        response = request_validation(args.server, resolve_input(args.schema), resolve_input(args.doc), args.timeout)
+    except (OSError, ValueError) as err:
+        print(f"jsvlc: {args.server}: {err}", file=sys.stderr)
+        return 2
+
+    if args.enable_output_logs:
+        dump_results(response)
+
+    return 0 if response.get("valid") else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import json
+import os
+import signal
+import socketserver
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jsvl.config as cfg
+from jsvl.core.arg_parser import setup_server_arg_parser, parse
+from jsvl.core.validator import Validator, execute, apply_only_validation, has_error, registered_validations, \
+    register_validations
+from jsvl.models.lru_cache import LRUCache
+from jsvl.models.result import Output
+import jsvl.utils.util as util
+
+# validators of the json and URL schemas by their text, schema files are cached by the validator itself
+server_validators = LRUCache(cfg.configs.get(cfg.schema_cache_size))
+
+# hosts a request may be sent to besides the bind address, any other Host is a page rebinding its name to the server
+local_hosts = frozenset(["127.0.0.1", "localhost"])
+
+
+def cached_validator(schema) -> Validator:
+    """
+    this method is responsible to find the compiled validator of the schema, a URL schema is read through the URL
+    cache and compiled again only when its content changes
+    :param schema: schema json, json text, file path or URL
+    :return: validator of the schema
+    """
+
+    schema_source = util.source_type(schema)
+
+    if schema_source == util.source_type_cls.file:
+        return Validator(schema)
+
+    if schema_source == util.source_type_cls.url:
+        schema = util.read_content_from_url(schema)
+
+    # the key order is kept, the errors of a schema are reported in the order of its keys
+    key = json.dumps(schema) if schema_source == util.source_type_cls.inline else schema
+    validator = server_validators.get(key)
+
+    if validator is None:
+        validator = Validator(schema)
+        server_validators.max_size = cfg.configs.get(cfg.schema_cache_size)
+        server_validators.put(key, validator)
+
+    return validator
+
+
+def result_as_dict(result) -> dict:
+    message = str(result.message)
+    if cfg.configs.get(cfg.enable_validation_source) is True:
+        message = f"{message} (bold)(black){type(result.validation).__name__}(end)"
+
+    return {"type": type(result).__name__.lower(), "message": message}
+
+
+def output_as_dict(output: Output) -> dict:
+    return {"schema_result": [result_as_dict(result) for result in output.schema_result],
+            "document_result": [result_as_dict(result) for result in output.document_result]}
+
+
+def handle_request(request: dict) -> dict:
+    """
+    this method is responsible to validate a request, it runs in the request thread or in a worker process
+    :param request: {"schema": schema, "document": document}, document is optional to validate the schema only
+    :return: {"valid": True or False, "outputs": [{"schema_result": [...], "document_result": [...]}]}
+    """
+
+    schema = request.get("schema")
+    document = request.get("document")
+    out = []
+
+    try:
+        if document is None:
+            apply_only_validation(schema, out)
+
+        elif util.source_type(schema) == util.source_type_cls.dir or \
+                util.source_type(document) == util.source_type_cls.dir:
+            execute(schema, document, out)
+
+        else:
+            out.append(cached_validator(schema).execute(document))
+
+    except Exception as err:
+        return {"valid": False, "error": str(err), "outputs": []}
+
+    valid = all(not has_error(output.schema_result) and not has_error(output.document_result) for output in out)
+    return {"valid": valid, "outputs": [output_as_dict(output) for output in out]}
+
+
+def host_name(host: str) -> str:
+    """
+    :param host: value of the Host header, e.g. localhost:8765 or [::1]:8765
+    :return: the host without the port and the brackets of an IPv6 address
+    """
+
+    host = host.strip().lower()
+
+    if host.startswith("["):
+        return host[1:].partition("]")[0]
+
+    return host.rpartition(":")[0] if host.count(":") == 1 else host
+
+
+def init_server_worker(configs: dict, validations: tuple):
+    cfg.configs.update(configs)
+    register_validations(validations)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": f"{self.path} is not found"})
+
+    def do_POST(self):
+        if host_name(self.headers.get("Host", "")) not in self.server.allowed_hosts:
+            # the body isn't read, the connection can't take another request
+            self.close_connection = True
+            self.send_json(403, {"error": f"{self.headers.get('Host')} is not an allowed host"})
+            return
+
+        if self.path != "/validate":
+            self.send_json(404, {"error": f"{self.path} is not found"})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as err:
+            self.send_json(400, {"error": f"request is not a valid json, {err}"})
+            return
+
+        if type(request) is not dict or request.get("schema") is None:
+            self.send_json(400, {"error": "request should be an object with a schema"})
+            return
+
+        executor = self.server.executor
+
+        try:
+            if executor is None:
+                response = handle_request(request)
+            else:
+                response = executor.submit(handle_request, request).result()
+        except Exception as err:
+            # e.g. a worker process died, the client still gets an answer
+            self.send_json(500, {"valid": False, "error": str(err), "outputs": []})
+            return
+
+        self.send_json(200, response)
+
+    def send_json(self, status: int, body: dict):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self) -> str:
+        # a Unix socket client has no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(socket_path: str = None, host: str = "127.0.0.1", port: int = 8765, workers: int = 1):
+    """
+    this method is responsible to create the validation server, requests are validated in their own thread or in
+    a pool of worker processes, every process keeps its compiled schemas for the next requests
+    :param socket_path: Unix socket path, None listens on the HTTP host and port
+    :param host: HTTP host
+    :param port: HTTP port, 0 picks a free port
+    :param workers: number of worker processes, 0 uses all the cores, 1 validates in the request threads
+    :return: server, call serve_forever to start it
+    """
+
+    allowed_hosts = local_hosts
+
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RequestHandler)
+        allowed_hosts = local_hosts | {host_name(host)}
+
+    server.allowed_hosts = allowed_hosts
+
+    workers = (os.cpu_count() or 1) if workers is None or workers <= 0 else workers
+    server.executor = None if workers == 1 else ProcessPoolExecutor(
+        max_workers=workers, initializer=init_server_worker, initargs=(dict(cfg.configs), registered_validations()))
+
+    return server
+
+
+def run_server(arguments: list = None):
+    args = parse(setup_server_arg_parser(), arguments)
+
+    # results are returned to the client, nothing is logged by the server
+    cfg.configs[cfg.enable_output_logs] = False
+
+    server = create_server(args.socket, args.host, args.port, args.workers)
+    address = args.socket if args.socket is not None else f"http://{args.host}:{server.server_address[1]}"
+    print(f"Serving on {address}", flush=True)
+
+    # a terminated server removes its socket as well
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+        if server.executor is not None:
+            server.executor.shutdown()
+
+        if args.socket is not None and os.path.exists(args.socket):
+            os.unlink(args.socket)
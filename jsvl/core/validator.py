@@ -1,5 +1,7 @@
-import json
+import asyncio
+import inspect
 import os.path
+from concurrent.futures import Executor, ProcessPoolExecutor
 from glob import iglob
 from typing import List
 
@@ -9,8 +11,13 @@ from jsvl.models.result import Output, Info, Error, Success, Warn
 
 import jsvl.config as cfg
 import jsvl.models.schema as schema_model
+from jsvl.models.context import ValidationContext, StopValidation
+from jsvl.models.lru_cache import LRUCache
+from jsvl.models.path import root_path
 from jsvl.utils.message_list import ml
 import jsvl.utils.util as util
+from jsvl.utils import json_stream, json_decoder
+from jsvl.utils.mapped_file import file_lines
 from jsvl.validations.doc_validations import doc_validation_set, validate_unknown_keys
 from jsvl.validations.schema_validations import schema_validation_set
 
@@ -28,96 +35,97 @@ def normalize_path(path: str, index: int = 0, doc_is_dynamic: bool = False) -> s
     return f"root[{index}]{path}" if doc_is_dynamic and "root" not in path else path
 
 
-def apply_doc_unknown_keys_validation(key, schema, doc, path, index, doc_is_dynamic, output: OrderedSet):
+def apply_doc_unknown_keys_validation(schema, known_keys, doc: dict, path, index, doc_is_dynamic,
+                                      ctx: ValidationContext):
     """
-    this is a special method that is responsible for recursively detecting the unknown keys in schema i.e. keys
-    are defined in document but not defined in schema
-    :param key: current key
-    :param schema: schema json that will be used for validation
-    :param doc: document json
-    :param path: location of document which is currently being validated
+    this method is responsible for detecting the unknown keys of a document object i.e. keys are defined in
+    document but not defined in schema, they are found by a set difference against the keys of the schema object
+    :param schema: schema of the document object
+    :param known_keys: set of the keys defined in the schema object
+    :param doc: document object
+    :param path: location of the document object, see models.path.Path
     :param index: when document is dynamic index will be used to segregate root path
     :param doc_is_dynamic: indicating that the document is a json object array
-    :param output: will be used to store the validation output
+    :param ctx: context of the current validation call, the output is stored in it
     :return: None
     """
 
-    path = normalize_path(path, index, doc_is_dynamic)
-    doc_value = doc.get(key)
-    sch_value = schema.get(key) if schema is not None else None
-
-    if key is None:
-        for tgt_key in doc.keys():
-            apply_doc_unknown_keys_validation(tgt_key, schema, doc, path, index, doc_is_dynamic, output)
+    if doc.keys() <= known_keys:
         return
 
-    if schema is not None and validate_unknown_keys.validate(key, schema, doc,
-                                                  normalize_path(f"{path}.{key}", index, doc_is_dynamic), index,
-                                                  doc_is_dynamic) is not None:
-        return
-    output.update(validate_unknown_keys.get_set())
+    for key in doc:
+        if key not in known_keys:
+            validate_unknown_keys.validate(key, schema, doc, path.child(key), index, doc_is_dynamic)
 
-    if type(doc_value) is dict:
-        for child_key in doc_value.keys():
-            apply_doc_unknown_keys_validation(child_key, sch_value, doc_value,
-                                 normalize_path(f"{path}.{key}", index, doc_is_dynamic), index, doc_is_dynamic,
-                                 output)
+            ctx.document_result.update(validate_unknown_keys.get_new_set())
+            if ctx.is_limit_reached():
+                raise StopValidation()
 
-    if type(doc_value) is list:
-        for i, item in enumerate(doc_value):
-            if type(item) is dict:
-                for child_key in item.keys():
-                    apply_doc_unknown_keys_validation(child_key, sch_value, item, f"{path}.{key}[{i}]", index, doc_is_dynamic,
-                                         output)
 
-def apply_doc_validation(key, schema, doc, path, index, doc_is_dynamic, output: OrderedSet):
+def apply_doc_validation(key, schema, doc, path, index, doc_is_dynamic, ctx: ValidationContext,
+                         check_unknown_keys=True):
     """
-    this method will take core of validating the document by the given validation filter set
+    this method will take core of validating the document by the given validation filter set, the unknown keys
+    are detected in the same traversal so each document object is visited once
     :param key: current json key
     :param schema: schema json that will be used for validation
     :param doc: document json that will be validated from schema
-    :param path: current location where the validation is being performed
+    :param path: current location where the validation is being performed, see models.path.Path
     :param index: when document is dynamic then index will be used to segregate the root path
     :param doc_is_dynamic: indicating that the document is json object array
-    :param output: will be used to store the validation output
+    :param ctx: context of the current validation call, the output is stored in it
+    :param check_unknown_keys: False below a bypassed key, the unknown keys are not reported there
     :return: None
     """
-    path = f"root[{index}]{path}" if doc_is_dynamic and "root" not in path else path
-    obj = schema.get(key)
 
     if key is None:
-        for child_key in util.remove_reserved_keys(schema):
-            apply_doc_validation(child_key, schema, doc, path, index, doc_is_dynamic, output)
+        apply_doc_unknown_keys_validation(schema, schema.keys(), doc, path, index, doc_is_dynamic, ctx)
+        for child_key in schema.child_keys:
+            apply_doc_validation(child_key, schema, doc, path, index, doc_is_dynamic, ctx)
         return
 
+    obj = schema.get(key)
+
     for validation in doc_validation_set:
         if validation.run(key, schema, doc,
                           path, index,
                           doc_is_dynamic) is not None:
             return
-        output.update(validation.get_set())
+        ctx.document_result.update(validation.get_new_set())
+        if ctx.is_limit_reached():
+            raise StopValidation()
 
-    if type(doc) is dict and obj.val_is_dict:
+    check_unknown_keys = check_unknown_keys and not obj.can_bypass
+    key_path = path.child(key)
+    doc_obj = doc.get(key)
 
-        for child_key in util.remove_reserved_keys(obj.val):
+    if type(doc_obj) is dict:
+        if check_unknown_keys:
+            apply_doc_unknown_keys_validation(obj, obj.child_key_set, doc_obj, key_path, index, doc_is_dynamic, ctx)
+
+        for child_key in obj.child_keys:
+            apply_doc_validation(child_key, obj, doc_obj, key_path, index, doc_is_dynamic, ctx, check_unknown_keys)
 
-            doc_obj = doc.get(key)
-            if type(doc_obj) is dict:
-                apply_doc_validation(child_key, obj, doc_obj, f"{path}.{key}", index, doc_is_dynamic, output)
+    # the type was already classified by the validations, arrays of scalars have no object to descend into
+    elif type(doc_obj) is list and ctx.value_type(doc_obj) not in util.scalar_array_data_types:
+        items = [(key_path.item(i), item) for i, item in enumerate(doc_obj) if type(item) is dict]
 
-            if type(doc_obj) is list:
-                for i, item in enumerate(doc_obj):
-                    if type(item) is dict:
-                        apply_doc_validation(child_key, obj, item, f"{path}.{key}[{i}]", index, doc_is_dynamic, output)
+        if check_unknown_keys:
+            for item_path, item in items:
+                apply_doc_unknown_keys_validation(obj, obj.child_key_set, item, item_path, index, doc_is_dynamic, ctx)
 
+        for child_key in obj.child_keys:
+            for item_path, item in items:
+                apply_doc_validation(child_key, obj, item, item_path, index, doc_is_dynamic, ctx, check_unknown_keys)
 
-def apply_schema_validation(key, schema, path, output: OrderedSet):
+
+def apply_schema_validation(key, schema, path, ctx: ValidationContext):
     """
     this method will be used to validate the schema json by the given schema-validation set
     :param key: current key
     :param schema: this is the main schema object where all the validation will be performed
     :param path: current location where the validation is being performed
-    :param output: will be used to store the validation output
+    :param ctx: context of the current validation call, the output is stored in it
     :return: None
     """
 
@@ -127,27 +135,28 @@ def apply_schema_validation(key, schema, path, output: OrderedSet):
     if key is None:
         for child_key in schema.keys():
             if child_key != util.reserved_key.binder:
-                apply_schema_validation(child_key, schema, path, output)
+                apply_schema_validation(child_key, schema, path, ctx)
         return
 
     for validation in schema_validation_set:
         if validation.validate(key, schema, normalize_path(f"{path}.{key}")) is not None:
             return
 
-        output.update(validation.get_set())
+        ctx.schema_result.update(validation.get_new_set())
 
     if type(obj.val) is dict:
         for child_key in util.remove_reserved_keys(obj.val):
-            apply_schema_validation(child_key, obj.child_schema, f"{path}.{key}", output)
+            apply_schema_validation(child_key, obj.child_schema, f"{path}.{key}", ctx)
 
 
-def prepare_schema(schema: dict, updated_schema: dict, key=None, defaults=None):
+def prepare_schema(schema: dict, updated_schema: dict, key=None, defaults=None, configs: dict = None):
     """
     this method is responsible to convert the schema json to schema object
     :param schema: actual schema json
     :param updated_schema: hold all the converted schema json as object
     :param key: current key
     :param defaults: this is responsible to add default keys in schema object if not defined
+    :param configs: configs used to fill the missing defaults, global configs are used when not provided
     :return: None
     """
 
@@ -155,38 +164,40 @@ def prepare_schema(schema: dict, updated_schema: dict, key=None, defaults=None):
 
     if key is None:
 
+        configs = cfg.configs if configs is None else configs
+
         if util.reserved_key.data_type not in schema.keys():
             schema[util.reserved_key.data_type] = dt.object
 
         if util.reserved_key.defaults not in schema.keys():
             schema[util.reserved_key.defaults] = {
-                util.reserved_key.allow_space: cfg.configs.get(cfg.allow_space),
-                util.reserved_key.min_length: cfg.configs.get(cfg.min_length),
-                util.reserved_key.max_length: cfg.configs.get(cfg.max_length),
-                util.reserved_key.min_value: cfg.configs.get(cfg.min_value),
-                util.reserved_key.max_value: cfg.configs.get(cfg.max_value),
-                util.reserved_key.case: cfg.configs.get(cfg.case),
+                util.reserved_key.allow_space: configs.get(cfg.allow_space),
+                util.reserved_key.min_length: configs.get(cfg.min_length),
+                util.reserved_key.max_length: configs.get(cfg.max_length),
+                util.reserved_key.min_value: configs.get(cfg.min_value),
+                util.reserved_key.max_value: configs.get(cfg.max_value),
+                util.reserved_key.case: configs.get(cfg.case),
             }
 
         defaults = schema.get(util.reserved_key.defaults)
 
         if util.reserved_key.allow_space not in defaults:
-            defaults[util.reserved_key.allow_space] = cfg.configs.get(cfg.allow_space)
+            defaults[util.reserved_key.allow_space] = configs.get(cfg.allow_space)
 
         if util.reserved_key.min_length not in defaults:
-            defaults[util.reserved_key.min_length] = cfg.configs.get(cfg.min_length)
+            defaults[util.reserved_key.min_length] = configs.get(cfg.min_length)
 
         if util.reserved_key.max_length not in defaults:
-            defaults[util.reserved_key.max_length] = cfg.configs.get(cfg.max_length)
+            defaults[util.reserved_key.max_length] = configs.get(cfg.max_length)
 
         if util.reserved_key.min_value not in defaults:
-            defaults[util.reserved_key.min_value] = cfg.configs.get(cfg.min_value)
+            defaults[util.reserved_key.min_value] = configs.get(cfg.min_value)
 
         if util.reserved_key.max_value not in defaults:
-            defaults[util.reserved_key.max_value] = cfg.configs.get(cfg.max_value)
+            defaults[util.reserved_key.max_value] = configs.get(cfg.max_value)
 
         if util.reserved_key.case not in defaults:
-            defaults[util.reserved_key.case] = cfg.configs.get(cfg.case)
+            defaults[util.reserved_key.case] = configs.get(cfg.case)
 
         for s_key in schema.keys():
             prepare_schema(schema, updated_schema, s_key, defaults)
@@ -218,11 +229,11 @@ def prepare_schema(schema: dict, updated_schema: dict, key=None, defaults=None):
             field[util.reserved_key.allow_space] = allow_space
             field[util.reserved_key.case] = case
 
-        if data_type in [dt.string, dt.object_array,  dt.string_array, dt.integer_array, dt.float_array, dt.bool_array, dt.array]:
+        if data_type in util.length_data_types:
             field[util.reserved_key.min_length] = min_length
             field[util.reserved_key.max_length] = max_length
 
-        if data_type in [dt.integer, dt.float]:
+        if data_type in util.value_data_types:
             min_value = defaults.get(util.reserved_key.min_value) if field.get(
                 util.reserved_key.min_value) is None else field.get(util.reserved_key.min_value)
             max_value = defaults.get(util.reserved_key.max_value) if field.get(
@@ -303,23 +314,21 @@ def validate_max_length(schema: dict, document: list, output_validation: Ordered
         output_validation.add(Error(ml.max_length_item(max_length)))
 
 
-def run_doc_validations(schema: dict, document, doc_validation_output: OrderedSet):
+def run_doc_validations(schema: dict, document, ctx: ValidationContext):
     """
     this is responsible to analyze the document and perform some check based on the result
     and then perform the validation based on the document type
     :param schema: scheme json which will be used for validation
     :param document: document json that will be analyzed
-    :param doc_validation_output: store the validation output result
+    :param ctx: context of the current validation call, holds the compiled schema and the output
     :return: None
     """
 
+    doc_validation_output = ctx.document_result
+
     # target document comprises on a single object
     if type(document) is dict and len(document.keys()) > 0:
-        apply_doc_validation(None, schema_model.schema_doc, document, "", 0, False,
-                             doc_validation_output)
-
-        apply_doc_unknown_keys_validation(None, schema_model.schema_doc, document, "", 0, False,
-                             doc_validation_output)
+        apply_doc_validation(None, ctx.schema_doc, document, root_path(), 0, False, ctx)
 
     # target document comprises on a array
     elif len(document) > 0:
@@ -331,10 +340,7 @@ def run_doc_validations(schema: dict, document, doc_validation_output: OrderedSe
         # when document is not dynamic
         elif type(document[0]) is dict:
             for index, doc in enumerate(document):
-                apply_doc_validation(None, schema_model.schema_doc, doc, "", index, True,
-                                     doc_validation_output)
-                apply_doc_unknown_keys_validation(None, schema_model.schema_doc, doc, "", index, True,
-                                     doc_validation_output)
+                apply_doc_validation(None, ctx.schema_doc, doc, root_path(index, True), index, True, ctx)
 
         elif type(document[0]) is str:
             check_root_data_type(schema, util.data_type_cls.string_array, doc_validation_output)
@@ -355,44 +361,360 @@ def run_doc_validations(schema: dict, document, doc_validation_output: OrderedSe
         doc_validation_output.add(Error(ml.empty_document_object()))
 
 
-def start_validation_process(schema: dict, document, schema_validation_output: OrderedSet,
-                             doc_validation_output: OrderedSet):
+def run_ndjson_validations(file_path: str, ctx: ValidationContext):
     """
-    this method is a starter for performing some pre-checks before the actual
-    validation process
-    :param schema: schema json object
-    :param document: unidentified document json
-    :param schema_validation_output: store the schema validation output result
-    :param doc_validation_output: store the document validation output result
+    this is responsible to validate a newline delimited json file, the file is read line by line and
+    every line is validated as a separate document, so the memory doesn't grow with the file size
+    :param file_path: path of the ndjson document file
+    :param ctx: context of the current validation call, holds the compiled schema and the output
     :return: None
     """
 
+    has_record = False
+    decoder = ctx.configs.get(cfg.json_decoder)
+
+    # json of the standard library decodes bytes to str anyway, the others read the bytes lines directly
+    text = json_decoder.resolve(decoder)[0] == "json"
+
+    for line_number, line in file_lines(file_path, text, ctx.configs.get(cfg.memory_map)):
+        if len(line.strip()) == 0:
+            continue
+
+        has_record = True
+
+        try:
+            record = json_decoder.loads(line, decoder)
+        except ValueError as err:
+            # a line which isn't json counts towards the error limit like the errors of a record
+            ctx.document_result.add(Error(ml.invalid_ndjson_line(line_number, err)))
+            ctx.error_count += 1
+            if ctx.is_limit_reached():
+                raise StopValidation()
+            continue
+
+        line_ctx = ValidationContext(ctx.configs, ctx.schema, ctx.schema_doc)
+        if ctx.max_errors is not None:
+            line_ctx.max_errors = ctx.max_errors - ctx.error_count
+
+        with line_ctx:
+            try:
+                run_doc_validations(ctx.schema, record, line_ctx)
+            except StopValidation:
+                pass
+
+        for result in line_ctx.document_result:
+            ctx.document_result.add(type(result)(ml.ndjson_line(line_number, result.message), result.validation))
+
+        ctx.error_count += line_ctx.error_count
+        if ctx.is_limit_reached():
+            raise StopValidation()
+
+    if not has_record:
+        ctx.document_result.add(Error(ml.empty_document_object()))
+
+
+def run_stream_validations(file_path: str, ctx: ValidationContext):
+    """
+    this is responsible to validate a document file whose root is an array without loading the whole array,
+    items are parsed and validated one by one and the root checks are done on running counters
+    :param file_path: path of the document file
+    :param ctx: context of the current validation call, holds the compiled schema and the output
+    :return: None
+    """
+
+    with open(file_path, "r", encoding="utf-8") as file:
+
+        # the first read decodes a whole block of the file, it fails on a document which isn't utf-8
+        try:
+            is_array_root = json_stream.is_array_root(file)
+        except ValueError as doc_error:
+            ctx.document_result.add(Error(ml.invalid_doc_file(file_path, doc_error)))
+            return
+
+        # only root arrays could be streamed, any other document is validated as a whole
+        if not is_array_root:
+            document, doc_error = util.parse_file(file_path, ctx.configs.get(cfg.json_decoder),
+                                                  ctx.configs.get(cfg.memory_map))
+            if doc_error is not None:
+                ctx.document_result.add(Error(ml.invalid_doc_file(file_path, doc_error)))
+                return
+
+            run_doc_validations(ctx.schema, document, ctx)
+            return
+
+        # item results are kept aside, they are dropped when the array turns out to be dynamic
+        items_ctx = ValidationContext(ctx.configs, ctx.schema, ctx.schema_doc)
+        items_ctx.max_errors = ctx.max_errors
+        first_item_type = None
+        is_dynamic = False
+        is_stopped = False
+        length = 0
+
+        try:
+            with items_ctx:
+                for index, item in enumerate(json_stream.iter_array_items(file)):
+                    length += 1
+
+                    if first_item_type is None:
+                        first_item_type = type(item)
+
+                    elif type(item) is not first_item_type:
+                        is_dynamic = True
+
+                    if not is_dynamic and not is_stopped and first_item_type is dict:
+                        try:
+                            apply_doc_validation(None, ctx.schema_doc, item, root_path(index, True), index, True,
+                                                 items_ctx)
+                        except StopValidation:
+                            # the items are no longer validated, but the array is read to the end since a later
+                            # item could still make it dynamic and drop these results
+                            is_stopped = True
+
+        except ValueError as doc_error:
+            ctx.document_result.add(Error(ml.invalid_doc_file(file_path, doc_error)))
+            return
+
+        if is_stopped and not is_dynamic:
+            ctx.document_result.update(items_ctx.document_result)
+            ctx.error_count += items_ctx.error_count
+            raise StopValidation()
+
+    doc_validation_output = ctx.document_result
+
+    if length == 0:
+        doc_validation_output.add(Error(ml.empty_document_object()))
+        return
+
+    if is_dynamic:
+        check_root_data_type(ctx.schema, "array", doc_validation_output)
+
+    elif first_item_type is dict:
+        doc_validation_output.update(items_ctx.document_result)
+
+    elif first_item_type is str:
+        check_root_data_type(ctx.schema, util.data_type_cls.string_array, doc_validation_output)
+
+    elif first_item_type is int:
+        check_root_data_type(ctx.schema, util.data_type_cls.integer_array, doc_validation_output)
+
+    elif first_item_type is float:
+        check_root_data_type(ctx.schema, util.data_type_cls.float_array, doc_validation_output)
+
+    elif first_item_type is bool:
+        check_root_data_type(ctx.schema, util.data_type_cls.bool_array, doc_validation_output)
+
+    min_length = ctx.schema.get(util.reserved_key.min_length)
+    if min_length is not None and length < int(min_length):
+        doc_validation_output.add(Error(ml.min_length_item(min_length)))
+
+    max_length = ctx.schema.get(util.reserved_key.max_length)
+    if max_length is not None and length > int(max_length):
+        doc_validation_output.add(Error(ml.max_length_item(max_length)))
+
+
+def validate_document(document, ctx: ValidationContext):
+    """
+    this is responsible to validate the document with the compiled schema, a document file path is read
+    while validating when ndjson or stream mode is enabled
+    :param document: parsed document json, or document file path in ndjson and stream mode
+    :param ctx: context of the current validation call, holds the compiled schema and the output
+    :return: None
+    """
+
+    try:
+        if ctx.configs.get(cfg.ndjson) and type(document) is str:
+            run_ndjson_validations(document, ctx)
+
+        elif ctx.configs.get(cfg.stream) and type(document) is str:
+            run_stream_validations(document, ctx)
+
+        else:
+            run_doc_validations(ctx.schema, document, ctx)
+
+    except StopValidation:
+        ctx.document_result.add(Info(ml.validation_stopped(ctx.error_count)))
+
+    if not has_error(ctx.document_result):
+        ctx.document_result.add(Success(ml.document_successfully_validated()))
+
+
+def has_error(output: OrderedSet) -> bool:
+    """
+    this method is responsible to check the given output contains any error
+    :param output: stored validation output
+    :return: True or False
+    """
+    return any(type(result) is Error for result in output)
+
+
+def compile_schema(schema: dict, ctx: ValidationContext) -> dict:
+    """
+    this method is responsible to prepare the schema json, convert it to schema objects and validate it
+    :param schema: schema json object
+    :param ctx: context of the current validation call, the compiled schema and output are stored in it
+    :return: compiled schema objects by root key
+    """
+
+    # root defaults are added while preparing, so the caller's schema is kept untouched
+    schema = dict(schema)
+    if type(schema.get(util.reserved_key.defaults)) is dict:
+        schema[util.reserved_key.defaults] = dict(schema[util.reserved_key.defaults])
+
+    ctx.schema = schema
     updated_schema = {}
 
     # remove * from keys and add __required__ key in field object
     # remove ~ from keys and add __bypass__ key in field object
-    prepare_schema(schema, updated_schema)
+    prepare_schema(schema, updated_schema, configs=ctx.configs)
 
-    schema_model.schema_doc = {}
-    for key in {key: val for (key, val) in updated_schema.items()}:
-        schema_model.schema_doc[key] = schema_model.Schema(key, updated_schema[key])
+    ctx.schema_doc = schema_model.SchemaDoc({key: schema_model.Schema(key, val) for key, val in updated_schema.items()})
 
     # adding separator and initial info
-    schema_validation_output.add(Info(ml.validating_schema()))
+    ctx.schema_result.add(Info(ml.validating_schema()))
 
     # validating schema first then document
-    apply_schema_validation(None, schema_model.schema_doc, cfg.root_object_path, schema_validation_output)
+    apply_schema_validation(None, ctx.schema_doc, cfg.root_object_path, ctx)
+
+    if not has_error(ctx.schema_result):
+        ctx.schema_result.add(Success(ml.schema_successfully_validated()))
+
+    return ctx.schema_doc
+
+
+def start_validation_process(schema: dict, document, ctx: ValidationContext):
+    """
+    this method is a starter for performing some pre-checks before the actual
+    validation process
+    :param schema: schema json object
+    :param document: unidentified document json
+    :param ctx: context of the current validation call, the output is stored in it
+    :return: None
+    """
+
+    compile_schema(schema, ctx)
 
     # if schema has no error then validate the target document with schema
-    if len([result for result in schema_validation_output if type(result) is Error]) == 0:
+    if not has_error(ctx.schema_result):
+
+        ctx.schema_result.add(Info(ml.validating_document()))
+
+        validate_document(document, ctx)
+
+
+worker_validators = {}
+worker_configs = {}
 
-        schema_validation_output.add(Success(ml.schema_successfully_validated()))
-        schema_validation_output.add(Info(ml.validating_document()))
 
-        run_doc_validations(schema, document, doc_validation_output)
+def validate_pair(validators: dict, configs: dict, pair: tuple) -> Output:
+    """
+    this method is responsible to validate a document with its compiled schema, schema is compiled on first use
+    :param validators: compiled validators by schema file, None key holds the provided schema
+    :param configs: configs used to compile the schema
+    :param pair: schema file and the document file
+    :return: stored output result
+    """
+
+    schema_file, document = pair
+    validator = validators.get(schema_file)
+
+    if validator is None:
+        validator = Validator(schema_file, configs)
+        validators[schema_file] = validator
+
+    return validator.execute(document)
+
+
+def registered_validations() -> tuple:
+    """
+    the registered validation filters are handed to the worker processes, a spawned worker (the default on macOS
+    and Windows) only has the built-in ones, filters are pickled by reference to their class so a custom filter
+    class should be defined at the top level of an importable module
+    :return: (schema validation filters, document validation filters)
+    """
+    return list(schema_validation_set), list(doc_validation_set)
+
+
+def register_validations(validations: tuple):
+    """
+    replaces the validation filters of this process with the ones of the main process
+    :param validations: see registered_validations
+    :return: None
+    """
+
+    schema_validations, doc_validations = validations
+    schema_validation_set.clear()
+    schema_validation_set.update(schema_validations)
+    doc_validation_set.clear()
+    doc_validation_set.update(doc_validations)
+
+
+def init_worker(configs: dict, schema, validations: tuple):
+    """
+    this method is used as process pool initializer, it compiles the provided schema once per worker
+    :param configs: configs snapshot of the main process
+    :param schema: schema json shared by all the documents, or None when every document has its own schema file
+    :param validations: validation filters of the main process, see registered_validations
+    :return: None
+    """
+
+    cfg.configs.update(configs)
+    register_validations(validations)
+    worker_configs.clear()
+    worker_configs.update(configs)
+    worker_validators.clear()
+
+    if schema is not None:
+        worker_validators[None] = Validator(schema, configs)
+
+
+def run_worker(pair: tuple) -> Output:
+    return validate_pair(worker_validators, worker_configs, pair)
 
-        if len([result for result in doc_validation_output if type(result) is Error]) == 0:
-            doc_validation_output.add(Success(ml.document_successfully_validated()))
+
+def validate_documents(schema, list_of_pair: list, configs: dict) -> List[Output]:
+    """
+    this method is responsible to validate the paired documents, documents are spread across a process pool
+    when more than one job is configured
+    :param schema: schema json shared by all the documents, or None when every document has its own schema file
+    :param list_of_pair: schema file and document file pairs
+    :param configs: configs snapshot
+    :return: list of the stored output result in the same order as pairs
+    """
+
+    jobs = configs.get(cfg.jobs)
+    jobs = (os.cpu_count() or 1) if jobs is None or jobs <= 0 else jobs
+
+    if jobs == 1 or len(list_of_pair) < 2:
+        validators = {None: Validator(schema, configs)} if schema is not None else {}
+        return [validate_pair(validators, configs, pair) for pair in list_of_pair]
+
+    jobs = min(jobs, len(list_of_pair))
+    chunk_size = max(1, min(256, len(list_of_pair) // (jobs * 4)))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(configs, schema, registered_validations())) as executor:
+        return list(executor.map(run_worker, list_of_pair, chunksize=chunk_size))
+
+
+def index_schema_files(list_of_schema: list, output: OrderedSet) -> dict:
+    """
+    this method is responsible to index the schema files by their name without the extension, when more than
+    one file has the same name the first one in the sorted order is used and the others are reported
+    :param list_of_schema: sorted schema file paths
+    :param output: schema validation output where the ignored files are reported
+    :return: schema file path by name
+    """
+
+    schema_index = {}
+
+    for schema_file in list_of_schema:
+        schema_file_name = os.path.splitext(os.path.basename(schema_file))[0]
+        used_schema_file = schema_index.setdefault(schema_file_name, schema_file)
+
+        if used_schema_file != schema_file:
+            output.add(Warn(ml.duplicate_schema_file(schema_file, used_schema_file)))
+
+    return schema_index
 
 
 def execute(schema, document, out: list):
@@ -405,38 +727,50 @@ def execute(schema, document, out: list):
     :return: None
     """
 
-    for validation in schema_validation_set:
-        validation.init_log_set()
-
-    for validation in doc_validation_set:
-        validation.init_log_set()
-
-    schema_validation_output = OrderedSet()
-    doc_validation_output = OrderedSet()
+    ctx = ValidationContext()
+    schema_validation_output = ctx.schema_result
+    doc_validation_output = ctx.document_result
 
-    out.append(Output(schema_validation_output, doc_validation_output))
+    output_index = len(out)
+    out.append(ctx.output())
 
-    schema_is_json = util.is_valid_json(schema)
-    schema_is_file = util.is_valid_file(schema)
-    schema_is_dir = util.is_valid_dir(schema)
-    schema_is_url = util.is_valid_url(schema)
+    # the kind of every input is resolved once, json inputs are parsed once and the parsed value is used from here on
+    schema_source = util.source_type(schema)
+    schema_json, schema_error = util.parse_source(schema, schema_source, ctx.configs.get(cfg.json_decoder))
+    schema_is_json = schema_error is None
+    schema_is_file = schema_source == util.source_type_cls.file
+    schema_is_dir = schema_source == util.source_type_cls.dir
+    schema_is_url = schema_source == util.source_type_cls.url
 
     if not schema_is_json and not schema_is_file and not schema_is_dir and not schema_is_url:
         schema_validation_output.add(Error(ml.invalid_provided_schema()))
         return
 
-    doc_is_valid_json = util.is_valid_json(document)
-    doc_is_file = util.is_valid_file(document)
-    doc_is_dir = util.is_valid_dir(document)
+    if schema_is_file or schema_is_dir:
+        schema = os.fspath(schema)
+
+    doc_source = util.source_type(document)
+    doc_json, doc_error = util.parse_source(document, doc_source, ctx.configs.get(cfg.json_decoder))
+    doc_is_valid_json = doc_error is None
+    doc_is_file = doc_source == util.source_type_cls.file
+    doc_is_dir = doc_source == util.source_type_cls.dir
 
     if not doc_is_valid_json and not doc_is_file and not doc_is_dir:
         doc_validation_output.add(Error(ml.invalid_provided_document()))
         return
 
+    if doc_is_file or doc_is_dir:
+        document = os.fspath(document)
+
+    # a schema file is compiled once per process, see Validator
+    if schema_is_file and not doc_is_dir:
+        out[output_index] = Validator(schema, ctx.configs).execute(doc_json if doc_is_valid_json else document)
+        return
+
     list_of_schema = []
 
     if schema_is_json:
-        schema = util.get_as_json(schema)
+        schema = schema_json
         if type(schema) is not dict:
             schema_validation_output.add(Error(ml.schema_root_object()))
             return
@@ -444,51 +778,66 @@ def execute(schema, document, out: list):
 
     if schema_is_file:
         schema_validation_output.add(Info(ml.schema_file_loaded(schema)))
-        file_content = util.read_file(schema)
-        if not util.is_valid_json(file_content):
-            schema_validation_output.add(Error(ml.invalid_schema_file(schema)))
+        schema_json, schema_error = util.parse_file(schema, ctx.configs.get(cfg.json_decoder),
+                                                    ctx.configs.get(cfg.memory_map))
+        if schema_error is not None:
+            schema_validation_output.add(Error(ml.invalid_schema_file(schema, schema_error)))
             return
 
-        schema = json.loads(file_content)
+        schema = schema_json
+        if type(schema) is not dict:
+            schema_validation_output.add(Error(ml.schema_root_object()))
+            return
         list_of_schema.append(schema)
 
     if schema_is_dir:
         list_of_schema.clear()
         schema = schema if schema.endswith("/") else f"{schema}/"
 
-        for file in iglob(f"{schema}**/*.json", recursive=True):
-            list_of_schema.append(file)
+        list_of_schema.extend(sorted(iglob(f"{schema}**/*.json", recursive=True)))
 
     if schema_is_url:
         schema_validation_output.add(Info(ml.loading_schema_from_url(schema)))
         try:
-            content = util.read_content_from_url(schema)
+            content = util.read_content_from_url(schema, ctx.configs)
             return execute(content, document, out)
         except Exception as err:
             schema_validation_output.add(Error(err))
 
     list_of_doc = []
     if doc_is_valid_json:
-        document = util.get_as_json(document)
+        document = doc_json
+        list_of_doc.append(document)
+
+    if doc_is_file and (ctx.configs.get(cfg.ndjson) or ctx.configs.get(cfg.stream)):
+        # records are read from the file while validating
+        schema_validation_output.add(Info(ml.doc_file_loaded(document)))
         list_of_doc.append(document)
 
-    if doc_is_file:
+    elif doc_is_file:
         schema_validation_output.add(Info(ml.doc_file_loaded(document)))
-        file_content = util.read_file(document)
+        doc_json, doc_error = util.parse_file(document, ctx.configs.get(cfg.json_decoder),
+                                              ctx.configs.get(cfg.memory_map))
 
-        if not util.is_valid_json(file_content):
-            doc_validation_output.add(Error(ml.invalid_doc_file(document)))
+        if doc_error is not None:
+            doc_validation_output.add(Error(ml.invalid_doc_file(document, doc_error)))
             return
 
-        document = json.loads(file_content)
+        document = doc_json
         list_of_doc.append(document)
 
     if doc_is_dir:
         list_of_doc.clear()
         document = document if document.endswith("/") else f"{document}/"
 
-        for file in iglob(f"{document}**/*.json", recursive=True):
-            list_of_doc.append(file)
+        list_of_doc.extend(iglob(f"{document}**/*.json", recursive=True))
+
+        if ctx.configs.get(cfg.ndjson):
+            list_of_doc.extend(iglob(f"{document}**/*.ndjson", recursive=True))
+            list_of_doc.extend(iglob(f"{document}**/*.jsonl", recursive=True))
+
+        # sorted so the output always comes in the same file order
+        list_of_doc.sort()
 
         if len(list_of_doc) == 0:
             doc_validation_output.add(Info(ml.file_not_found(document)))
@@ -498,27 +847,25 @@ def execute(schema, document, out: list):
             schema_validation_output.add(Error(ml.file_not_found(schema)))
             return
 
-        for target_doc in list_of_doc:
+        # schema files by name, built once so every document finds its schema file in constant time
+        schema_index = index_schema_files(list_of_schema, schema_validation_output) if schema_is_dir else {}
 
-            if type(schema) is dict:
-                execute(schema, target_doc, out)
+        # pair every document with its schema file, None means the provided schema
+        list_of_pair = []
+        for target_doc in list_of_doc:
 
-            elif schema == list_of_schema[0]:
-                execute(schema, target_doc, out)
+            if not schema_is_dir:
+                list_of_pair.append((None, target_doc))
             else:
-                schema_file_name = f"{os.path.splitext(os.path.basename(target_doc))[0]}{cfg.configs.get(cfg.schema_file_postfix)}"
-
-                found_schema_file = None
-                for schema_file_path in list_of_schema:
-                    if f"/{schema_file_name}.json" in schema_file_path:
-                        found_schema_file = schema_file_path
-                        break
+                schema_file_name = f"{os.path.splitext(os.path.basename(target_doc))[0]}{ctx.configs.get(cfg.schema_file_postfix)}"
+                found_schema_file = schema_index.get(schema_file_name)
 
                 if found_schema_file is not None:
-                    execute(found_schema_file, target_doc, out)
+                    list_of_pair.append((found_schema_file, target_doc))
                 else:
                     schema_validation_output.add(Warn(ml.no_schema_found(schema_file_name)))
 
+        out.extend(validate_documents(schema if type(schema) is dict else None, list_of_pair, ctx.configs))
         return
 
     if type(document) is dict and (not schema_is_json and not schema_is_file):
@@ -529,7 +876,8 @@ def execute(schema, document, out: list):
         schema_validation_output.add(Error(ml.empty_schema()))
         return
 
-    start_validation_process(schema, document, schema_validation_output, doc_validation_output)
+    with ctx:
+        start_validation_process(schema, document, ctx)
 
 
 def validate(schema, document) -> List[Output]:
@@ -557,29 +905,30 @@ def apply_only_validation(schema, out: list) -> List[Output]:
     :return: None
     """
 
-    for validation in schema_validation_set:
-        validation.init_log_set()
-
-    for validation in doc_validation_set:
-        validation.init_log_set()
-
-    schema_validation_output = OrderedSet()
+    ctx = ValidationContext()
+    schema_validation_output = ctx.schema_result
 
-    out.append(Output(schema_validation_output,  OrderedSet()))
+    out.append(ctx.output())
 
-    schema_is_json = util.is_valid_json(schema)
-    schema_is_file = util.is_valid_file(schema)
-    schema_is_dir = util.is_valid_dir(schema)
-    schema_is_url = util.is_valid_url(schema)
+    # the kind of the input is resolved once, a json input is parsed once and the parsed value is used from here on
+    schema_source = util.source_type(schema)
+    schema_json, schema_error = util.parse_source(schema, schema_source, ctx.configs.get(cfg.json_decoder))
+    schema_is_json = schema_error is None
+    schema_is_file = schema_source == util.source_type_cls.file
+    schema_is_dir = schema_source == util.source_type_cls.dir
+    schema_is_url = schema_source == util.source_type_cls.url
 
     if not schema_is_json and not schema_is_file and not schema_is_dir and not schema_is_url:
         schema_validation_output.add(Error(ml.invalid_provided_schema()))
         return out
 
+    if schema_is_file or schema_is_dir:
+        schema = os.fspath(schema)
+
     dict_of_schema = {}
 
     if schema_is_json:
-        schema = util.get_as_json(schema)
+        schema = schema_json
         if type(schema) is not dict:
             schema_validation_output.add(Error(ml.schema_root_object()))
             return out
@@ -587,12 +936,13 @@ def apply_only_validation(schema, out: list) -> List[Output]:
 
     if schema_is_file:
         schema_validation_output.add(Info(ml.schema_file_loaded(schema)))
-        file_content = util.read_file(schema)
-        if not util.is_valid_json(file_content):
-            schema_validation_output.add(Error(ml.invalid_schema_file(schema)))
+        schema_json, schema_error = util.parse_file(schema, ctx.configs.get(cfg.json_decoder),
+                                                    ctx.configs.get(cfg.memory_map))
+        if schema_error is not None:
+            schema_validation_output.add(Error(ml.invalid_schema_file(schema, schema_error)))
             return out
 
-        schema = json.loads(file_content)
+        schema = schema_json
         dict_of_schema[None] = schema
 
     if schema_is_dir:
@@ -600,12 +950,12 @@ def apply_only_validation(schema, out: list) -> List[Output]:
         schema = schema if schema.endswith("/") else f"{schema}/"
 
         for file in iglob(f"{schema}**/*.json", recursive=True):
-            file_content = util.read_file(file)
-            if not util.is_valid_json(file_content):
-                schema_validation_output.add(Error(ml.invalid_schema_file(schema)))
+            schema_content, schema_error = util.parse_file(file, ctx.configs.get(cfg.json_decoder),
+                                                           ctx.configs.get(cfg.memory_map))
+            if schema_error is not None:
+                schema_validation_output.add(Error(ml.invalid_schema_file(file, schema_error)))
                 return out
 
-            schema_content = json.loads(file_content)
             dict_of_schema[file] = schema_content
 
     if len(dict_of_schema) == 0:
@@ -617,27 +967,340 @@ def apply_only_validation(schema, out: list) -> List[Output]:
         if schema_key is not None:
             schema_validation_output.append(Info(f"File: {schema_key}"))
 
-        updated_schema = {}
+        with ctx:
+            compile_schema(schema_content, ctx)
+
+    if cfg.configs.get(cfg.enable_output_logs):
+        util.dump_log(out)
+
+    return out
+
+
+# compiled schema files shared by all the validators of the process, see Validator
+compiled_schemas = LRUCache(cfg.configs.get(cfg.schema_cache_size))
+
+# configs applied while compiling a schema, a schema file is compiled separately for every combination of them
+compile_configs = (cfg.allow_space, cfg.min_length, cfg.max_length, cfg.min_value, cfg.max_value, cfg.case)
+
+
+def compiled_schema_key(schema, configs: dict):
+    """
+    this method is responsible to identify a schema file by its resolved path, modification time and size, so
+    the file is compiled again only when it changes
+    :param schema: unidentified schema
+    :param configs: configs used to compile the schema
+    :return: cache key or None when the schema is not a file
+    """
+
+    if not util.is_valid_file(schema):
+        return None
+
+    path = os.path.realpath(schema)
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return path, stat.st_mtime_ns, stat.st_size, tuple(configs.get(key) for key in compile_configs)
+
+
+def evict_compiled_schema(schema_file):
+    """
+    this method is responsible to drop the compiled versions of the schema file, for a file whose content is known
+    to be changed while its modification time and size are the same
+    :param schema_file: schema file path
+    :return: None
+    """
+
+    path = os.path.realpath(schema_file)
+    compiled_schemas.remove_if(lambda key: key[0] == path)
+
+
+class Validator:
+    """
+    this class is responsible to resolve, prepare and validate the schema only once so the compiled
+    schema could be reused for validating any number of documents
+    """
+
+    def __init__(self, schema, options: dict = None):
+        """
+        :param schema: schema json, json text, file path or URL
+        :param options: configs that override the global configs for this validator
+        """
+
+        self.configs = {**cfg.configs, **(options if options is not None else {})}
+        self.schema = None
+        self.schema_doc = schema_model.SchemaDoc()
+        self.schema_result = OrderedSet()
+
+        # a schema file is loaded, validated and compiled once per process
+        cache_key = compiled_schema_key(schema, self.configs)
+        compiled = compiled_schemas.get(cache_key) if cache_key is not None else None
+
+        if compiled is not None:
+            self.schema, self.schema_doc, schema_result = compiled
+            self.schema_result.add(Info(ml.schema_file_loaded(schema)))
+            self.schema_result.update(schema_result)
+            return
+
+        schema_file = schema
+        schema = self.__load_schema(schema)
+
+        if schema is not None:
+            ctx = ValidationContext(self.configs)
+            ctx.schema_result = self.schema_result
+
+            with ctx:
+                self.schema_doc = compile_schema(schema, ctx)
 
-        # remove * from keys and add __required__ key in field object
-        # remove ~ from keys and add __bypass__ key in field object
-        prepare_schema(schema_content, updated_schema)
+            self.schema = ctx.schema
 
-        schema_model.schema_doc = {}
-        for key in {key: val for (key, val) in updated_schema.items()}:
-            schema_model.schema_doc[key] = schema_model.Schema(key, updated_schema[key])
+        if cache_key is not None:
+            # the loaded message is left out, it's added with the path the schema file is referred by
+            schema_result = [result for result in self.schema_result
+                             if result.message != ml.schema_file_loaded(schema_file)]
+            compiled_schemas.max_size = self.configs.get(cfg.schema_cache_size)
+            compiled_schemas.put(cache_key, (self.schema, self.schema_doc, schema_result))
 
-        # adding separator and initial info
-        schema_validation_output.add(Info(ml.validating_schema()))
+    def __load_schema(self, schema):
 
-        # validating schema first then document
-        apply_schema_validation(None, schema_model.schema_doc, cfg.root_object_path, schema_validation_output)
+        schema_source = util.source_type(schema)
 
-        # if schema has no error then validate the target document with schema
-        if len([result for result in schema_validation_output if type(result) is Error]) == 0:
-            schema_validation_output.add(Success(ml.schema_successfully_validated()))
+        if schema_source == util.source_type_cls.url:
+            self.schema_result.add(Info(ml.loading_schema_from_url(schema)))
+            try:
+                schema = util.read_content_from_url(schema, self.configs)
+            except Exception as err:
+                self.schema_result.add(Error(err))
+                return None
+
+            schema_source = util.source_type_cls.json_text
+
+        elif schema_source == util.source_type_cls.file:
+            self.schema_result.add(Info(ml.schema_file_loaded(schema)))
+            schema_json, schema_error = util.parse_file(schema, self.configs.get(cfg.json_decoder),
+                                                        self.configs.get(cfg.memory_map))
+            if schema_error is not None:
+                self.schema_result.add(Error(ml.invalid_schema_file(schema, schema_error)))
+                return None
+
+            schema, schema_source = schema_json, util.source_type_cls.inline
+
+        schema, schema_error = util.parse_source(schema, schema_source, self.configs.get(cfg.json_decoder))
+
+        if schema_error is not None:
+            self.schema_result.add(Error(ml.invalid_provided_schema()))
+            return None
+
+        if type(schema) is not dict:
+            self.schema_result.add(Error(ml.schema_root_object()))
+            return None
+
+        if len(schema) == 0:
+            self.schema_result.add(Error(ml.empty_schema()))
+            return None
+
+        return schema
+
+    def is_schema_valid(self) -> bool:
+        return self.schema is not None and not has_error(self.schema_result)
+
+    def validate(self, document) -> Output:
+        """
+        this method is responsible to validate the document with the compiled schema and dump the logs
+        :param document: document json, json text or file path
+        :return: stored output result
+        """
+
+        output = self.execute(document)
+
+        if self.configs.get(cfg.enable_output_logs):
+            util.dump_log([output])
+
+        return output
+
+    def execute(self, document) -> Output:
+        """
+        this method is responsible to validate the document with the compiled schema
+        :param document: document json, json text or file path
+        :return: stored output result
+        """
+
+        ctx = ValidationContext(self.configs, self.schema, self.schema_doc)
+        return self.__execute(document, ctx)
+
+    @classmethod
+    async def load_async(cls, schema, options: dict = None) -> "Validator":
+        """
+        this method is responsible to load and compile the schema without blocking the event loop, the schema
+        file is read and the URL is fetched in the default executor of the loop
+        :param schema: schema json, json text, file path or URL
+        :param options: configs that override the global configs for this validator
+        :return: validator of the schema
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(None, cls, schema, options)
+
+    async def execute_async(self, document, executor: Executor = None) -> Output:
+        """
+        this method is responsible to validate the document without blocking the event loop, a file, a parsed
+        document and a json text larger than async_offload_size are validated in the executor, a stream is read
+        in the default executor of the loop unless its read is a coroutine
+        :param document: document json, json text, bytes, file path, readable stream or an object with an async read
+        :param executor: executor of the validations, None uses the default executor of the loop, a process pool
+        could be used for CPU heavy documents
+        :return: stored output result
+        """
+
+        loop = asyncio.get_running_loop()
+        read = getattr(document, "read", None)
+
+        # a stream is read before the validation so a process pool never receives the stream object
+        if callable(read):
+            document = await read() if inspect.iscoroutinefunction(read) else await loop.run_in_executor(None, read)
+
+        doc_source = util.source_type(document)
+        offload_size = self.configs.get(cfg.async_offload_size)
+
+        if doc_source == util.source_type_cls.file:
+            offload = True
+        elif doc_source == util.source_type_cls.json_text or doc_source == util.source_type_cls.bytes:
+            offload = offload_size is not None and len(document) > offload_size
+        else:
+            # the size of a parsed document isn't known without walking it
+            offload = offload_size is not None and doc_source == util.source_type_cls.inline
+
+        if not offload:
+            return self.execute(document)
+
+        return await loop.run_in_executor(executor, self.execute, document)
+
+    async def execute_many_async(self, documents, limit: int = None, executor: Executor = None) -> List[Output]:
+        """
+        this method is responsible to validate the documents concurrently, at most limit documents are validated
+        at the same time
+        :param documents: iterable of documents, see execute_async
+        :param limit: maximum number of documents validated at the same time, None uses async_concurrency config
+        :param executor: executor of the validations, see execute_async
+        :return: list of the stored output result in the same order as the documents
+        """
+
+        semaphore = asyncio.Semaphore(limit or self.configs.get(cfg.async_concurrency) or 1)
+
+        async def execute_limited(document):
+            async with semaphore:
+                # a small document is validated on the loop, the loop gets its turn before every validation
+                await asyncio.sleep(0)
+                return await self.execute_async(document, executor)
+
+        return list(await asyncio.gather(*[execute_limited(document) for document in documents]))
+
+    def is_valid(self, document) -> bool:
+        """
+        this method is responsible to check the document is valid, validation stops at the first error
+        :param document: document json, json text or file path
+        :return: True or False
+        """
+
+        ctx = ValidationContext(self.configs, self.schema, self.schema_doc)
+        ctx.max_errors = 1
+        self.__execute(document, ctx)
+
+        return self.is_schema_valid() and not has_error(ctx.document_result)
+
+    def __execute(self, document, ctx: ValidationContext) -> Output:
+
+        ctx.schema_result.update(self.schema_result)
+
+        schema_validation_output = ctx.schema_result
+        doc_validation_output = ctx.document_result
+
+        if not self.is_schema_valid():
+            return ctx.output()
+
+        doc_source = util.source_type(document)
+        document_is_file = doc_source == util.source_type_cls.file
+
+        if document_is_file:
+            document = os.fspath(document)
+
+        if document_is_file and (self.configs.get(cfg.ndjson) or self.configs.get(cfg.stream)):
+            schema_validation_output.add(Info(ml.doc_file_loaded(document)))
+            schema_validation_output.add(Info(ml.validating_document()))
+
+            with ctx:
+                validate_document(document, ctx)
+
+            return ctx.output()
+
+        if document_is_file:
+            schema_validation_output.add(Info(ml.doc_file_loaded(document)))
+            doc_json, doc_error = util.parse_file(document, self.configs.get(cfg.json_decoder),
+                                                  self.configs.get(cfg.memory_map))
+
+            if doc_error is not None:
+                doc_validation_output.add(Error(ml.invalid_doc_file(document, doc_error)))
+                return ctx.output()
+
+            document = doc_json
+
+        else:
+            document, doc_error = util.parse_source(document, doc_source, self.configs.get(cfg.json_decoder))
+
+            if doc_error is not None:
+                doc_validation_output.add(Error(ml.invalid_provided_document()))
+                return ctx.output()
+
+        schema_validation_output.add(Info(ml.validating_document()))
+
+        with ctx:
+            validate_document(document, ctx)
+
+        return ctx.output()
+
+
+async def validate_async(schema, document, executor: Executor = None) -> List[Output]:
+    """
+    this is the async entry of the validation process, the event loop isn't blocked by reading files, fetching
+    URLs or validating large documents, see Validator.execute_async
+    :param schema: unidentified schema
+    :param document: unidentified document
+    :param executor: executor of the validations, None uses the default executor of the loop
+    :return: list of the stored output result
+    """
+
+    loop = asyncio.get_running_loop()
+
+    # directories are validated by a process pool of their own, see execute
+    if util.source_type(schema) == util.source_type_cls.dir or util.source_type(document) == util.source_type_cls.dir:
+        output = []
+        await loop.run_in_executor(None, execute, schema, document, output)
+    else:
+        validator = await Validator.load_async(schema)
+        output = [await validator.execute_async(document, executor)]
 
     if cfg.configs.get(cfg.enable_output_logs):
-        util.dump_log(out)
+        util.dump_log(output)
 
-    return out
+    return output
+
+
+async def validate_many_async(schema, documents, limit: int = None, executor: Executor = None) -> List[Output]:
+    """
+    this is the async entry to validate many documents with a single schema, the schema is compiled once and at
+    most limit documents are validated at the same time
+    :param schema: unidentified schema
+    :param documents: iterable of documents, see Validator.execute_async
+    :param limit: maximum number of documents validated at the same time, None uses async_concurrency config
+    :param executor: executor of the validations, None uses the default executor of the loop
+    :return: list of the stored output result in the same order as the documents
+    """
+
+    validator = await Validator.load_async(schema)
+    output = await validator.execute_many_async(documents, limit, executor)
+
+    if cfg.configs.get(cfg.enable_output_logs):
+        util.dump_log(output)
+
+    return output
@@ -0,0 +1,156 @@
+import os
+import time
+from typing import List
+
+from ordered_set import OrderedSet
+
+import jsvl.config as cfg
+from jsvl.core.validator import validate_documents, index_schema_files, evict_compiled_schema
+from jsvl.models.result import Output, Info, Warn
+from jsvl.utils.file_tracker import FileTracker
+from jsvl.utils.logger import logger
+from jsvl.utils.message_list import ml
+import jsvl.utils.util as util
+
+
+class Watcher:
+    """
+    re-validates the documents as they change, only a changed document and the documents paired with a changed
+    schema file are validated again; the first poll validates every document
+    """
+
+    def __init__(self, schema, document, options: dict = None):
+        """
+        :param schema: schema json, json text, file, directory path or URL, a URL is fetched once
+        :param document: document file or directory path
+        :param options: configs that override the global configs for this watcher only
+        """
+
+        self.configs = dict(cfg.configs)
+        self.configs.update(options or {})
+
+        doc_source = util.source_type(document)
+        if doc_source != util.source_type_cls.file and doc_source != util.source_type_cls.dir:
+            raise ValueError(ml.invalid_watch_document())
+
+        extensions = (".json", ".ndjson", ".jsonl") if self.configs.get(cfg.ndjson) else (".json",)
+        self.doc_tracker = FileTracker(document, extensions)
+        self.schema_tracker = None
+        self.schema_is_dir = False
+        self.schema = None
+        # seconds the last poll took to find the changed files
+        self.scan_time = 0
+
+        schema_source = util.source_type(schema)
+
+        if schema_source == util.source_type_cls.url:
+            schema = util.read_content_from_url(schema, self.configs)
+            schema_source = util.source_type(schema)
+
+        if schema_source == util.source_type_cls.dir:
+            self.schema_tracker = FileTracker(schema)
+            self.schema_is_dir = True
+
+        elif schema_source == util.source_type_cls.file:
+            self.schema_tracker = FileTracker(schema)
+            self.schema = os.fspath(schema)
+
+        else:
+            # the provided schema never changes, the validator reports an invalid one
+            schema_json, schema_error = util.parse_source(schema, schema_source, self.configs.get(cfg.json_decoder))
+            self.schema = schema if schema_error is not None else schema_json
+
+    def paths(self) -> list:
+        return [tracker.root for tracker in [self.schema_tracker, self.doc_tracker] if tracker is not None]
+
+    def schema_name(self, document: str) -> str:
+        return f"{os.path.splitext(os.path.basename(document))[0]}{self.configs.get(cfg.schema_file_postfix)}"
+
+    def poll(self) -> List[Output]:
+        """
+        this method is responsible to find the changed files since the last poll and validate the affected documents
+        :return: list of the stored output result, empty when nothing changed
+        """
+
+        started = time.perf_counter()
+        changed_docs, removed_docs = self.doc_tracker.poll()
+        changed_schemas = set()
+
+        if self.schema_tracker is not None:
+            changed_schemas, removed_schemas = self.schema_tracker.poll()
+            changed_schemas |= removed_schemas
+
+        # the tracker tells a change by the content, the compiled schemas are known by the mtime and size only
+        for schema_file in changed_schemas:
+            evict_compiled_schema(schema_file)
+
+        self.scan_time = time.perf_counter() - started
+        targets = set(changed_docs)
+
+        if len(changed_schemas) > 0 and self.schema_is_dir:
+            names = {os.path.splitext(os.path.basename(schema_file))[0] for schema_file in changed_schemas}
+            targets.update(doc for doc in self.doc_tracker.files if self.schema_name(doc) in names)
+
+        elif len(changed_schemas) > 0:
+            targets.update(self.doc_tracker.files)
+
+        schema_result = OrderedSet()
+
+        for removed_doc in sorted(removed_docs):
+            schema_result.add(Info(ml.file_removed(removed_doc)))
+
+        list_of_pair = []
+
+        if self.schema_is_dir:
+            schema_index = index_schema_files(sorted(self.schema_tracker.files), schema_result) if targets else {}
+
+            for target_doc in sorted(targets):
+                found_schema_file = schema_index.get(self.schema_name(target_doc))
+
+                if found_schema_file is not None:
+                    list_of_pair.append((found_schema_file, target_doc))
+                else:
+                    schema_result.add(Warn(ml.no_schema_found(self.schema_name(target_doc))))
+
+        else:
+            list_of_pair.extend((None, target_doc) for target_doc in sorted(targets))
+
+        out = [Output(schema_result, OrderedSet())] if len(schema_result) > 0 else []
+
+        if len(list_of_pair) > 0:
+            out.extend(validate_documents(self.schema, list_of_pair, self.configs))
+
+        return out
+
+
+def watch(schema, document, interval: float = 1.0, options: dict = None):
+    """
+    this is the entry of the watch mode, it validates every document once and then polls the files every interval
+    seconds until it's interrupted, the interval grows on a tree where a poll takes long
+    :param schema: schema json, json text, file, directory path or URL
+    :param document: document file or directory path
+    :param interval: number of seconds between two polls
+    :param options: configs that override the global configs for this watch only
+    :return: None
+    """
+
+    enable_output_logs = dict(cfg.configs, **(options or {})).get(cfg.enable_output_logs)
+
+    try:
+        watcher = Watcher(schema, document, options)
+    except Exception as err:
+        if enable_output_logs:
+            logger.error(str(err))
+        return
+
+    if enable_output_logs:
+        logger.info(ml.watching(", ".join(watcher.paths())))
+
+    while True:
+        out = watcher.poll()
+
+        if len(out) > 0 and enable_output_logs:
+            util.dump_log(out)
+
+        # on a tree where finding the changes is slow, it never takes more than a fifth of the time
+        time.sleep(max(interval, watcher.scan_time * 4))
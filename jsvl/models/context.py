@@ -0,0 +1,90 @@
+from contextvars import ContextVar
+
+from ordered_set import OrderedSet
+
+import jsvl.config as cfg
+from jsvl.models.object_set import ObjectSet
+from jsvl.models.result import Output
+from jsvl.models.schema import SchemaDoc
+from jsvl.utils.util import combine, converted_type
+
+
+class StopValidation(Exception):
+    """
+    raised to unwind the document traversal once the maximum number of errors is reached
+    """
+
+
+class ValidationContext:
+    """
+    this class holds everything a single validation call needs i.e. the compiled schema, a snapshot of configs
+    and the results, so any number of validations could run at the same time in different threads
+    """
+
+    def __init__(self, configs: dict = None, schema: dict = None, schema_doc: dict = None):
+        self.configs = dict(cfg.configs if configs is None else configs)
+        self.schema = schema
+        self.schema_doc = SchemaDoc() if schema_doc is None else schema_doc
+        self.schema_result = OrderedSet()
+        self.document_result = OrderedSet()
+        self.path = None
+        self.key = None
+        self.error_count = 0
+        self.max_errors = 1 if self.configs.get(cfg.fail_fast) else self.configs.get(cfg.max_errors)
+        self.__result_sets = {}
+        self.__tokens = []
+        self.__typed_value = None
+        self.__value_type = None
+
+    def result_set(self, validation) -> ObjectSet:
+        result_set = self.__result_sets.get(validation)
+
+        if result_set is None:
+            result_set = ObjectSet()
+            self.__result_sets[validation] = result_set
+
+        return result_set
+
+    def value_type(self, value):
+        """
+        converted type of a document value, the last classified value is remembered so the validations running on
+        the same value (e.g. a long array) don't scan it again
+        :param value: document value
+        :return: data type name, see util.converted_type
+        """
+        if value is not self.__typed_value or self.__value_type is None:
+            self.__typed_value = value
+            self.__value_type = converted_type(value)
+
+        return self.__value_type
+
+    @property
+    def full_path(self) -> str:
+        """
+        :return: dotted path of the key currently being validated, built only on access
+        """
+        return combine(str(self.path), self.key)
+
+    def is_limit_reached(self) -> bool:
+        return self.max_errors is not None and self.error_count >= self.max_errors
+
+    def output(self) -> Output:
+        return Output(self.schema_result, self.document_result)
+
+    def __enter__(self):
+        self.__tokens.append(current_context.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        current_context.reset(self.__tokens.pop())
+
+
+current_context = ContextVar("current_context", default=None)
+
+# used when a validation is invoked outside of any validation call
+default_context = ValidationContext()
+
+
+def active_context() -> ValidationContext:
+    context = current_context.get()
+    return default_context if context is None else context
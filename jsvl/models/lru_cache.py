@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache:
+    """
+    thread safe mapping that keeps at most max_size items, the least recently used item is dropped first,
+    None max_size keeps all the items
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.items.get(key)
+
+            if value is not None:
+                self.items.move_to_end(key)
+
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+
+            while self.max_size is not None and len(self.items) > max(self.max_size, 0):
+                self.items.popitem(last=False)
+
+    def remove_if(self, predicate):
+        """
+        drops the items whose key matches the predicate
+        """
+        with self.lock:
+            for key in [key for key in self.items if predicate(key)]:
+                del self.items[key]
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
@@ -7,14 +7,29 @@ class ObjectSet:
 
     def __init__(self):
         self.ordered_set = OrderedSet()
+        self.messages = set()
+        self.taken = 0
 
-    def add(self, val: Result):
-        messages = [result.message for result in self.ordered_set]
-        if val.message not in messages:
-            self.ordered_set.add(val)
+    def add(self, val: Result) -> bool:
+        if val.message in self.messages:
+            return False
+
+        self.messages.add(val.message)
+        self.ordered_set.add(val)
+        return True
 
     def item_set(self):
         return self.ordered_set
 
+    def take_new_items(self):
+        """
+        :return: items added since the last call
+        """
+        items = self.ordered_set[self.taken:] if self.taken > 0 else self.ordered_set
+        self.taken = len(self.ordered_set)
+        return items
+
     def ini(self):
         self.ordered_set = OrderedSet()
+        self.messages = set()
+        self.taken = 0
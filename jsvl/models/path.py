@@ -0,0 +1,46 @@
+class Path:
+    """
+    location of a document value kept as linked segments, the dotted path string is only built
+    when it's needed for a message
+    """
+
+    __slots__ = ("parent", "key", "index")
+
+    def __init__(self, parent=None, key=None, index=None):
+        self.parent = parent
+        self.key = key
+        self.index = index
+
+    def child(self, key) -> "Path":
+        return Path(self, key)
+
+    def item(self, index: int) -> "Path":
+        return Path(self, index=index)
+
+    def __str__(self):
+        segments = []
+        path = self
+        while path is not None:
+            segments.append(path)
+            path = path.parent
+
+        full_path = ""
+        for segment in reversed(segments):
+            if segment.index is not None:
+                full_path = f"{full_path}[{segment.index}]"
+            elif segment.key is not None:
+                full_path = f"{full_path}.{segment.key}" if len(full_path) > 0 else str(segment.key)
+
+        return full_path
+
+    def __repr__(self):
+        return f"Path({str(self)!r})"
+
+
+def root_path(index: int = 0, doc_is_dynamic: bool = False) -> Path:
+    """
+    :param index: index of the document when the document is a json object array
+    :param doc_is_dynamic: indicating that the document is json object array
+    :return: path of the document root
+    """
+    return Path().child("root").item(index) if doc_is_dynamic else Path()
@@ -1,9 +1,20 @@
-from jsvl.utils.util import reserved_key
+import json
+import re
+
+from jsvl.utils.util import reserved_key, length_data_types, value_data_types, value_array_data_types, compile_regex, \
+    has_number_values, remove_reserved_keys, binding_key
 
 
 class Schema:
 
-    def __init__(self, key, val):
+    __slots__ = ("child_schema", "val", "key", "is_required", "data_type", "allow_space", "min_value", "max_value",
+                 "min_length", "max_length", "case", "can_bypass", "binding", "regex_binding", "regex_error_message",
+                 "data_types", "has_length_constraint", "has_value_constraint",
+                 "has_item_value_constraint", "child_keys", "child_key_set",
+                 "regex_pattern", "regex_compile_error", "binding_index", "binding_has_numbers", "binding_object_text",
+                 "binding_array_text")
+
+    def __init__(self, key, val, is_binder: bool = False):
         self.child_schema = {}
         self.val = val
         self.key = key
@@ -35,9 +46,41 @@ class Schema:
             self.regex_binding = val.get(reserved_key.bind_regex)
             self.regex_error_message = val.get(reserved_key.regex_error_message)
 
-            keys = {k: v for (k, v) in val.items() if k not in reserved_key.all_keys().keys()}
-            for new_key in keys:
-                self.child_schema[new_key] = Schema(new_key, val.get(new_key))
+            all_keys = reserved_key.all_keys()
+            for new_key in val:
+                if new_key not in all_keys:
+                    self.child_schema[new_key] = Schema(new_key, val.get(new_key), key == reserved_key.binder)
+
+        # precomputed once so the document validations don't parse the schema for every value
+        is_valid_data_type = type(self.data_type) is str
+        self.data_types = frozenset(self.data_type.split("|")) if is_valid_data_type else frozenset()
+        self.has_length_constraint = is_valid_data_type and self.data_type in length_data_types
+        self.has_value_constraint = is_valid_data_type and self.data_type in value_data_types
+        self.has_item_value_constraint = is_valid_data_type and self.data_type in value_array_data_types and (
+                self.min_value is not None or self.max_value is not None)
+        self.child_keys = list(self.child_schema)
+        self.child_key_set = frozenset(self.child_schema)
+
+        # the children of __binder__ are the binders, everything the document validations need from them is computed
+        # here so a compiled schema is never written while it's shared by the validations
+        is_object_binder = is_binder and type(val) is dict
+        is_array_binder = is_binder and type(val) is list
+        # whether an object binder holds numbers or booleans, which == doesn't tell apart
+        self.binding_has_numbers = is_object_binder and has_number_values(val)
+        # renderings of the binders for the error messages
+        self.binding_object_text = str(val) if is_object_binder else None
+        self.binding_array_text = json.dumps(val, indent=4) if is_array_binder else None
+        # list binders are indexed once, so a bound document value is looked up in constant time
+        self.binding_index = frozenset(binding_key(item) for item in val) if is_array_binder else None
+
+        # __bind_regex__ is compiled once here and shared by the schema and document validations
+        self.regex_pattern = None
+        self.regex_compile_error = None
+        if self.regex_binding is not None:
+            try:
+                self.regex_pattern = compile_regex(str(self.regex_binding))
+            except re.error as e:
+                self.regex_compile_error = e
 
     def get(self, key):
         return self.child_schema.get(key)
@@ -46,4 +89,14 @@ class Schema:
         return type(self.val) is dict
 
 
-schema_doc = {}
+class SchemaDoc(dict):
+    """
+    compiled schema objects by root key, the document keys of the root are found once like the child keys of a
+    schema object
+    """
+
+    __slots__ = ("child_keys",)
+
+    def __init__(self, nodes: dict = None):
+        super().__init__(nodes or {})
+        self.child_keys = remove_reserved_keys(self)
@@ -0,0 +1,134 @@
+import hashlib
+import os
+import time
+
+
+class FileTracker:
+    """
+    tracks the files of a directory tree, or a single file, between polls; a file whose stat signature (mtime, size,
+    inode) changed is hashed and reported only when its content changed, so a touch or a checkout writing the same
+    content doesn't count; the listing of a directory is read again only when the directory's mtime changes, an
+    unchanged tree costs one stat per directory and per file
+    """
+
+    # a file modified this close to its scan could be modified again within the same mtime, it's hashed again
+    racy_window_ns = 2_000_000_000
+
+    def __init__(self, root: str, extensions: tuple = (".json",)):
+        """
+        :param root: directory or file path
+        :param extensions: tracked file extensions in a directory, like the glob of the validation
+        """
+
+        self.root = os.fspath(root)
+        self.extensions = extensions
+        self.files = {}
+        self.dirs = {}
+
+    def poll(self) -> tuple:
+        """
+        :return: (changed, removed) sets of file paths since the last poll, the first poll reports every file
+        """
+
+        scan_started_ns = time.time_ns()
+        batches = []
+        dirs = {}
+
+        if os.path.isdir(self.root):
+            self.__scan_dir(self.root, batches, dirs)
+        elif os.path.isfile(self.root):
+            batches.append([self.root])
+
+        tracked_files = self.files
+        files = {}
+        changed = set()
+        stat = os.stat
+        racy_after_ns = scan_started_ns - self.racy_window_ns
+
+        for batch in batches:
+            for path in batch:
+                try:
+                    file_stat = stat(path)
+                except OSError:
+                    continue
+
+                signature = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+                tracked = tracked_files.get(path)
+
+                if tracked is not None and tracked[0] == signature:
+                    files[path] = tracked
+                    continue
+
+                digest = self.__hash(path)
+                if digest is None:
+                    continue
+
+                if tracked is None or tracked[1] != digest:
+                    changed.add(path)
+
+                # a racily clean file keeps no signature so its content is checked again on the next poll
+                files[path] = (None if file_stat.st_mtime_ns >= racy_after_ns else signature, digest)
+
+        removed = tracked_files.keys() - files.keys()
+        self.files = files
+        self.dirs = dirs
+
+        return changed, removed
+
+    def __scan_dir(self, dir_path: str, batches: list, dirs: dict):
+        """
+        collects the tracked files under the directory, hidden entries are skipped like the glob of the validation
+        :param batches: tracked files found so far, a list per directory
+        :param dirs: listings of the directories found so far, the listings of removed directories are dropped
+        """
+
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return
+
+        listing = self.dirs.get(dir_path)
+
+        if listing is None or listing[0] != mtime_ns:
+            files, sub_dirs = [], []
+
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+
+                        if entry.is_dir():
+                            sub_dirs.append(entry.path)
+                        elif entry.name.endswith(self.extensions):
+                            files.append(entry.path)
+            except OSError:
+                return
+
+            # same as the files, an entry added within the mtime of a racily clean listing would be missed
+            is_racy = mtime_ns >= time.time_ns() - self.racy_window_ns
+            listing = (None if is_racy else mtime_ns, files, sub_dirs)
+
+        dirs[dir_path] = listing
+
+        batches.append(listing[1])
+
+        for sub_dir in listing[2]:
+            self.__scan_dir(sub_dir, batches, dirs)
+
+    @staticmethod
+    def __hash(path: str, chunk_size: int = 1 << 20):
+        """
+        :return: digest of the file content, None when it can't be read
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+
+        try:
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(chunk_size), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+
+        return digest.digest()
@@ -0,0 +1,64 @@
+import functools
+import importlib
+import json
+
+auto = "auto"
+
+# supported decoders, fastest first, json of the standard library is always available
+decoder_names = ("orjson", "ujson", "json")
+
+# decoders that read a buffer (e.g. a memory mapped file) in place
+buffer_decoders = frozenset({"orjson"})
+
+
+@functools.lru_cache(maxsize=None)
+def resolve(name: str = auto) -> tuple:
+    """
+    this method is responsible to find the json decoder for the given name, auto picks the fastest installed
+    decoder, an unknown or not installed decoder falls back to json of the standard library
+    :param name: auto, orjson, ujson or json
+    :return: (decoder name, loads function)
+    """
+
+    names = decoder_names if name == auto else (name,)
+
+    for decoder_name in names:
+        if decoder_name not in decoder_names:
+            continue
+
+        try:
+            module = importlib.import_module(decoder_name)
+        except ImportError:
+            continue
+
+        return decoder_name, module.loads
+
+    return "json", json.loads
+
+
+def available_decoders() -> list:
+    """
+    :return: names of the installed decoders, fastest first
+    """
+    return [name for name in decoder_names if resolve(name)[0] == name]
+
+
+def loads(source, name: str = "json"):
+    """
+    parses the given json text with the chosen decoder, bytes are handed to the decoder as they are so the
+    decoders reading utf-8 directly (orjson, ujson) don't need a decoded str copy of the input, a memoryview
+    (e.g. of a mapped file) is copied only when the decoder can't read it
+    :param source: json text as str, bytes, bytearray or memoryview
+    :param name: decoder name, see resolve
+    :return: json value, raises ValueError when the text is not a valid json
+    """
+    decoder_name, decoder = resolve(name)
+
+    # ujson needs bytes and json of the standard library reads the text decoded straight from the view
+    if type(source) is memoryview and decoder_name == "ujson":
+        source = source.tobytes()
+
+    elif type(source) is memoryview and decoder_name == "json":
+        source = str(source, json.detect_encoding(source[:4].tobytes()), "surrogatepass")
+
+    return decoder(source)
@@ -0,0 +1,111 @@
+import json
+
+decoder = json.JSONDecoder()
+whitespace = " \t\n\r"
+number_chars = frozenset("0123456789.eE+-")
+
+
+def is_array_root(file) -> bool:
+    """
+    this method is responsible to check the root value of the json file is an array, file is rewound after check
+    :param file: text file object
+    :return: True or False
+    """
+
+    is_array = False
+    while True:
+        char = file.read(1)
+        if char == "" or char not in whitespace:
+            is_array = char == "["
+            break
+
+    file.seek(0)
+    return is_array
+
+
+def iter_array_items(file, chunk_size: int = 1 << 16):
+    """
+    this method is responsible to parse the root array of a json file incrementally, only the unparsed part of
+    the file and the current item are kept in memory
+    :param file: text file object, positioned at the start of the document
+    :param chunk_size: number of characters read at once
+    :return: generator of the array items
+    """
+
+    buffer = ""
+    pos = 0
+    eof = False
+    read_size = chunk_size
+
+    def skip_whitespace():
+        nonlocal buffer, pos, eof
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in whitespace:
+                pos += 1
+
+            if pos < len(buffer) or eof:
+                return
+
+            buffer = file.read(chunk_size)
+            pos = 0
+            eof = len(buffer) == 0
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Expecting '[' at the start of the document")
+
+    pos += 1
+    expect_item = None
+
+    while True:
+        skip_whitespace()
+
+        if pos >= len(buffer):
+            raise ValueError("Unterminated array at the end of the document")
+
+        if buffer[pos] == "]" and expect_item is not True:
+            pos += 1
+            skip_whitespace()
+
+            # the document ends with the root array, like a whole document parse
+            if pos < len(buffer):
+                raise ValueError(f"Unexpected content after the document: {buffer[pos]!r}")
+            return
+
+        if expect_item is False:
+            if buffer[pos] != ",":
+                raise ValueError(f"Expecting ',' delimiter but found {buffer[pos]!r}")
+            pos += 1
+            expect_item = True
+            continue
+
+        # drop the consumed part so the buffer never holds more than the current item
+        if pos > 0:
+            buffer = buffer[pos:]
+            pos = 0
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+
+                # a number cut at the end of the buffer is decoded as its first part e.g. 123 of "123." + "5", it's
+                # accepted once something other than a number character follows it
+                if eof or (end < len(buffer) and not (type(item) in (int, float) and buffer[end] in number_chars)):
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+            chunk = file.read(read_size)
+            eof = len(chunk) == 0
+            buffer += chunk
+
+            # read bigger chunks for large items so an item is never rescanned too many times
+            read_size = min(read_size * 2, 1 << 24)
+
+        read_size = chunk_size
+        pos = end
+        expect_item = False
+
+        yield item
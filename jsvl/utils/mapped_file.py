@@ -0,0 +1,139 @@
+import mmap
+import os
+
+# pages of the consumed part of the file are handed back to the os once this many bytes are read
+release_size = 1 << 23
+
+
+class MappedFile:
+    """
+    read only memory map of a file, the content is exposed as a memoryview so the parser reads the mapped
+    pages directly instead of a bytes or str copy of the file, pages already parsed could be released
+    to keep the resident memory close to the part being parsed
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.map = None
+        self.view = memoryview(b"")
+        self.released = 0
+
+    def __enter__(self):
+        with open(self.file_path, "rb") as file:
+            # an empty file can't be mapped
+            if os.fstat(file.fileno()).st_size > 0:
+                self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.view = memoryview(self.map)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def release(self, end: int):
+        """
+        drops the mapped pages before the given position from the resident memory, they are read from the file
+        again if accessed later
+        :param end: position of the first byte still in use
+        :return: None
+        """
+
+        if self.map is None or end - self.released < release_size or not hasattr(self.map, "madvise"):
+            return
+
+        end -= end % mmap.PAGESIZE
+        self.map.madvise(mmap.MADV_DONTNEED, self.released, end - self.released)
+        self.released = end
+
+    def lines(self, text: bool = False, chunk_size: int = 1 << 20):
+        """
+        this method is responsible to split the mapped file into lines, the file is copied and split a chunk at
+        a time so only one chunk is held in memory, slicing the view for every line measured slower than this
+        :param text: decode the lines to str, for the decoders that read str faster than bytes
+        :param chunk_size: number of bytes split at once, a longer line is read as a whole
+        :return: generator of (line number, line without the line break)
+        """
+
+        if self.map is None:
+            return
+
+        size = len(self.map)
+        start = 0
+        line_number = 0
+
+        while start < size:
+            end = min(start + chunk_size, size)
+
+            # the chunk ends at a line break
+            if end < size:
+                line_break = self.map.rfind(b"\n", start, end)
+
+                if line_break == -1:
+                    line_break = self.map.find(b"\n", end)
+
+                end = size if line_break == -1 else line_break + 1
+
+            chunk = self.map[start:end]
+
+            if not text:
+                lines = chunk.split(b"\n")
+            else:
+                try:
+                    lines = chunk.decode().split("\n")
+                except UnicodeDecodeError:
+                    lines = [decode_line(line) for line in chunk.split(b"\n")]
+
+            if chunk.endswith(b"\n"):
+                lines.pop()
+
+            for line in lines:
+                line_number += 1
+                yield line_number, line
+
+            start = end
+            self.release(start)
+
+    def close(self):
+        if self.map is None:
+            return
+
+        try:
+            self.view.release()
+            self.map.close()
+        except BufferError:
+            # a slice of the view is still referenced, the map is closed once it's collected
+            pass
+
+
+def decode_line(line: bytes):
+    """
+    :return: the line as str, a line which isn't utf-8 is kept as bytes so the decoder reports it as an invalid line
+    """
+
+    try:
+        return line.decode()
+    except UnicodeDecodeError:
+        return line
+
+
+def file_lines(file_path, text: bool = False, use_memory_map: bool = False):
+    """
+    this method is responsible to read the lines of a file, through a memory map when it's enabled (see memory_map
+    config) otherwise through a buffered read of the file
+    :param file_path: path of the file
+    :param text: decode the lines to str, for the decoders that read str faster than bytes
+    :param use_memory_map: read the lines from a memory map of the file
+    :return: generator of (line number, line without the line break)
+    """
+
+    if use_memory_map:
+        with MappedFile(file_path) as mapped_file:
+            yield from mapped_file.lines(text)
+        return
+
+    with open(file_path, "rb") as file:
+        for line_number, line in enumerate(file, 1):
+            if line.endswith(b"\n"):
+                line = line[:-1]
+
+            yield line_number, decode_line(line) if text else line
@@ -41,13 +41,17 @@ class MessageList:
     def schema_file_loaded(self, schema_file):
         return f"Loaded schema from: {schema_file}"
 
-    def invalid_schema_file(self, schema_file):
+    def invalid_schema_file(self, schema_file, error=None):
+        if error is not None:
+            return f"Schema: {schema_file} is not a valid json file, {error}."
         return f"Schema: {schema_file} is not a valid json file."
 
     def doc_file_loaded(self, doc_file):
         return f"Loaded document from: {doc_file}."
 
-    def invalid_doc_file(self, doc_file):
+    def invalid_doc_file(self, doc_file, error=None):
+        if error is not None:
+            return f"Document: {doc_file} is not a valid json file, {error}."
         return f"Document: {doc_file} is not a valid json file."
 
     def file_not_found(self, dir):
@@ -56,6 +60,18 @@ class MessageList:
     def no_schema_found(self, schema_file_name):
         return f"{schema_file_name}.json not found."
 
+    def duplicate_schema_file(self, schema_file, used_schema_file):
+        return f"{schema_file} is ignored, a schema file with the same name is used: {used_schema_file}."
+
+    def watching(self, paths):
+        return f"Watching {paths} for changes, press Ctrl+C to stop."
+
+    def file_removed(self, file):
+        return f"{file} is removed."
+
+    def invalid_watch_document(self):
+        return "Provide a document file or a directory path to watch."
+
     def unmatch_provided_schema_and_doc(self):
         return "if the provided document is a json content then the provided schema should also be json content or a single schema file."
 
@@ -87,7 +103,7 @@ class MessageList:
         return f"{path} can be used only with string data type."
 
     def key_support_with_number(self, path):
-        return f"{path} can be used only with integer or float data type."
+        return f"{path} can be used only with integer, float, integer_array or float_array data type."
 
     def key_support_with_object_and_array(self, path):
         return f"{path} can be used only with object or object_array data type."
@@ -110,6 +126,9 @@ class MessageList:
     def loading_schema_from_url(self, url):
         return f"Loading schema from URL: {url}"
 
+    def url_not_cached(self, url):
+        return f"Schema: {url} is not cached, it can't be loaded in offline mode."
+
     # ----------------------------------------------------------------------
     # document validation errors, warnings, info, success
     # ----------------------------------------------------------------------
@@ -117,6 +136,15 @@ class MessageList:
     def empty_document_object(self):
         return "document shouldn't be empty."
 
+    def invalid_ndjson_line(self, line, error):
+        return f"Line {line}: is not a valid json, {error}."
+
+    def ndjson_line(self, line, message):
+        return f"Line {line}: {message}"
+
+    def validation_stopped(self, max_errors):
+        return f"Validation stopped after {max_errors} error(s)."
+
     def unknown_key(self, path):
         return f"{path} is unknown key, remove it or add it in schema."
 
@@ -171,4 +199,10 @@ class MessageList:
     def max_value_error(self, path, expected, actual):
         return f"{path} can have maximum {expected} value, but found {actual}."
 
+    def min_item_value_error(self, path, expected, actual):
+        return f"{path} items should have minimum {expected} value, but found {actual}."
+
+    def max_item_value_error(self, path, expected, actual):
+        return f"{path} items can have maximum {expected} value, but found {actual}."
+
 ml = MessageList()
\ No newline at end of file
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import Future
+from threading import Lock
+from urllib import request
+from urllib.error import HTTPError, URLError
+
+from jsvl.utils.message_list import ml
+
+
+class UrlNotCached(Exception):
+    """
+    raised in offline mode when the URL was never fetched
+    """
+
+
+class UrlCache:
+    """
+    on-disk cache of the content fetched from URLs, a cached content is used as it is until its ttl expires and then
+    revalidated with a conditional request (ETag / Last-Modified) so an unchanged content isn't downloaded again;
+    concurrent fetches of the same URL in the process share a single request
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.in_flight = {}
+
+    def fetch(self, url: str, cache_dir: str = None, ttl: float = 0, offline: bool = False) -> bytes:
+        """
+        :param url: URL of the content
+        :param cache_dir: directory of the cached contents, None disables the on-disk cache
+        :param ttl: number of seconds a cached content is used without revalidation
+        :param offline: use only the cached content, whatever its age, no request is made
+        :return: content of the URL
+        """
+
+        key = (url, cache_dir, ttl, offline)
+
+        with self.lock:
+            future = self.in_flight.get(key)
+            is_owner = future is None
+
+            if is_owner:
+                future = Future()
+                self.in_flight[key] = future
+
+        # another thread is already fetching the same URL, its result is shared
+        if not is_owner:
+            return future.result()
+
+        try:
+            content = self.__load(url, cache_dir, ttl, offline)
+            future.set_result(content)
+            return content
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+
+    def __load(self, url: str, cache_dir: str, ttl: float, offline: bool) -> bytes:
+
+        if cache_dir is None:
+            if offline:
+                raise UrlNotCached(ml.url_not_cached(url))
+
+            with request.urlopen(url) as response:
+                return response.read()
+
+        entry_path = os.path.join(cache_dir, hashlib.sha256(url.encode()).hexdigest())
+        meta, content = self.__read_entry(entry_path, url)
+
+        if content is not None and (offline or time.time() - meta.get("fetched_at", 0) < ttl):
+            return content
+
+        if offline:
+            raise UrlNotCached(ml.url_not_cached(url))
+
+        headers = {}
+        if content is not None and meta.get("etag") is not None:
+            headers["If-None-Match"] = meta["etag"]
+        if content is not None and meta.get("last_modified") is not None:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with request.urlopen(request.Request(url, headers=headers)) as response:
+                content = response.read()
+                meta = {"url": url, "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified")}
+
+        except HTTPError as err:
+            # the server is failing, a stale content is better than none
+            if err.code >= 500 and content is not None:
+                return content
+
+            # not modified, the cached content is still valid
+            if err.code != 304 or content is None:
+                raise
+
+            meta["etag"] = err.headers.get("ETag") or meta.get("etag")
+            meta["last_modified"] = err.headers.get("Last-Modified") or meta.get("last_modified")
+
+        except (URLError, OSError):
+            # the network is down, a stale content is better than none
+            if content is None:
+                raise
+
+            return content
+
+        meta["fetched_at"] = time.time()
+        self.__write_entry(entry_path, meta, content)
+
+        return content
+
+    @staticmethod
+    def __read_entry(entry_path: str, url: str) -> tuple:
+        """
+        :return: (meta, content) of the cached URL, (None, None) when it's not cached or the entry is unreadable
+        """
+
+        try:
+            with open(f"{entry_path}.meta", "r") as file:
+                meta = json.load(file)
+
+            with open(f"{entry_path}.body", "rb") as file:
+                content = file.read()
+
+        except (OSError, ValueError):
+            return None, None
+
+        if type(meta) is not dict or meta.get("url") != url or meta.get("size") != len(content):
+            return None, None
+
+        return meta, content
+
+    @staticmethod
+    def __write_entry(entry_path: str, meta: dict, content: bytes):
+        """
+        writes the content and then its meta, both are replaced atomically so a reader never sees a partial entry,
+        the content size in the meta tells a content not matching its meta
+        """
+
+        meta["size"] = len(content)
+        cache_dir = os.path.dirname(entry_path)
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+
+            for path, data in [(f"{entry_path}.body", content), (f"{entry_path}.meta", json.dumps(meta).encode())]:
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+                try:
+                    with os.fdopen(fd, "wb") as file:
+                        file.write(data)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+
+        except OSError:
+            # the cache is an optimization, a read only or full disk shouldn't fail the validation
+            pass
+
+
+url_cache = UrlCache()
@@ -1,11 +1,15 @@
+import functools
 import json
 import os.path
 import re
-from urllib import request
 
-from jsvl.config import enable_validation_source, configs
+from jsvl.config import enable_validation_source, json_decoder, url_cache_dir, url_cache_ttl, offline, memory_map, \
+    configs
 from jsvl.models.result import Success, Info, Warn, Error
+from jsvl.utils import json_decoder as decoders
 from jsvl.utils.logger import logger
+from jsvl.utils.mapped_file import MappedFile
+from jsvl.utils.url_cache import url_cache
 
 
 class __DataType:
@@ -39,6 +43,39 @@ class __DataType:
 data_type_cls = __DataType()
 
 
+class __SourceType:
+    def __init__(self):
+        self.inline = "inline"
+        self.json_text = "json_text"
+        self.bytes = "bytes"
+        self.file = "file"
+        self.dir = "dir"
+        self.url = "url"
+        self.stream = "stream"
+        self.unknown = "unknown"
+
+    def json_types(self) -> set:
+        return {self.inline, self.json_text, self.bytes, self.stream}
+
+
+source_type_cls = __SourceType()
+
+# data types that support __min_length__ and __max_length__
+length_data_types = frozenset({data_type_cls.string, data_type_cls.object_array, data_type_cls.string_array,
+                               data_type_cls.integer_array, data_type_cls.float_array, data_type_cls.bool_array,
+                               data_type_cls.array})
+
+# data types that support __min_value__ and __max_value__
+value_data_types = frozenset({data_type_cls.integer, data_type_cls.float})
+
+# array data types that support __min_value__ and __max_value__ for every item
+value_array_data_types = frozenset({data_type_cls.integer_array, data_type_cls.float_array})
+
+# array data types that can't hold an object
+scalar_array_data_types = frozenset({data_type_cls.string_array, data_type_cls.integer_array,
+                                     data_type_cls.float_array, data_type_cls.bool_array})
+
+
 class ReservedKey:
 
     def __init__(self):
@@ -60,21 +97,23 @@ class ReservedKey:
         self.binder = "__binder__"
         self.defaults = "__defaults__"
 
+        self.__all_keys = {self.required: bool,
+                           self.data_type: str,
+                           self.bind: str,
+                           self.bind_regex: str,
+                           self.regex_error_message: str,
+                           self.allow_space: bool,
+                           self.min_length: int,
+                           self.max_length: int,
+                           self.min_value: float,
+                           self.max_value: float,
+                           self.case: str,
+                           self.bypass: bool,
+                           self.binder: dict,
+                           self.defaults: dict}
+
     def all_keys(self) -> dict:
-        return {self.required: bool,
-                self.data_type: str,
-                self.bind: str,
-                self.bind_regex: str,
-                self.regex_error_message: str,
-                self.allow_space: bool,
-                self.min_length: int,
-                self.max_length: int,
-                self.min_value: float,
-                self.max_value: float,
-                self.case: str,
-                self.bypass: bool,
-                self.binder: dict,
-                self.defaults: dict}
+        return self.__all_keys
 
 
 reserved_key = ReservedKey()
@@ -125,7 +164,8 @@ def converted_type(field):
 
 
 def remove_reserved_keys(obj):
-    return [k for k in obj.keys() if k not in reserved_key.all_keys().keys()]
+    all_keys = reserved_key.all_keys()
+    return [k for k in obj.keys() if k not in all_keys]
 
 
 def is_find_data_type(source: str, target: list) -> bool:
@@ -149,6 +189,68 @@ def is_exact_match_data_type(source: str, target: list) -> bool:
     return True
 
 
+def binding_key(value) -> str:
+    """
+    encodes a json value for the index of a list binder, the encoding keeps the types apart (1, 1.0, True and "1"
+    are different keys) and ignores the order of object keys
+    :param value: json value
+    :return: json text of the value
+    """
+    return json.dumps(value, sort_keys=True)
+
+
+def is_same_value(expected, actual) -> bool:
+    """
+    structural comparison of two json values, the order of object keys is ignored while types must match exactly
+    (1, 1.0 and True are different values), it stops on the first difference
+    :param expected: bound value from the __binder__
+    :param actual: document value
+    :return: True when both values are the same
+    """
+    if type(expected) is not type(actual):
+        return False
+
+    if type(expected) is dict:
+        if len(expected) != len(actual):
+            return False
+
+        for key, value in expected.items():
+            if key not in actual or not is_same_value(value, actual[key]):
+                return False
+
+        return True
+
+    if type(expected) is list:
+        if len(expected) != len(actual):
+            return False
+
+        for expected_item, actual_item in zip(expected, actual):
+            if not is_same_value(expected_item, actual_item):
+                return False
+
+        return True
+
+    return expected == actual
+
+
+def has_number_values(value) -> bool:
+    """
+    checks if the given json value holds any integer, float or bool, those are the only values python's == treats
+    as equal across types (1 == 1.0 == True)
+    :param value: json value
+    :return: True when a number or bool is found
+    """
+    value_type = type(value)
+
+    if value_type is dict:
+        return any(has_number_values(item) for item in value.values())
+
+    if value_type is list:
+        return any(has_number_values(item) for item in value)
+
+    return value_type in (int, float, bool)
+
+
 def is_valid_regex(value: str):
     try:
         re.compile(value)
@@ -156,6 +258,16 @@ def is_valid_regex(value: str):
     except re.error as e:
         return e
 
+@functools.lru_cache(maxsize=512)
+def compile_regex(value: str) -> re.Pattern:
+    """
+    compiles the given __bind_regex__ value, built-in regex keys (e.g. __email__) are resolved first;
+    compiled patterns are kept in a bounded LRU so schemas sharing a pattern compile it only once per process
+    :param value: regex pattern or one of the regex_keys
+    :return: compiled pattern, raises re.error when the pattern is invalid
+    """
+    return re.compile(regex_keys.get(value, value))
+
 def matching_data_type(key, dt, target):
     return dt == data_type_cls.array and dt in converted_type(target[key]) or {
         converted_type(target[key])}.intersection(dt.split("|"))
@@ -168,44 +280,131 @@ def read_file(file_path):
     with open(file_path, "r") as file:
         return file.read()
 
-def read_content_from_url(url: str) -> str:
+def parse_file(file_path, decoder: str = None, use_memory_map: bool = None) -> tuple:
+    """
+    parses the given json file, json of the standard library reads the file as str and the others as bytes, with
+    memory_map a decoder reading buffers (orjson) parses the memory mapped file in place so no copy is made
+    :param file_path: json file path
+    :param decoder: json decoder name, see json_decoder config, None uses the global config
+    :param use_memory_map: see memory_map config, None uses the global config
+    :return: (json value, None) when the file is valid otherwise (None, error)
+    """
+    decoder_name = decoders.resolve(configs.get(json_decoder) if decoder is None else decoder)[0]
+    use_memory_map = configs.get(memory_map) if use_memory_map is None else use_memory_map
+
+    if use_memory_map and decoder_name in decoders.buffer_decoders:
+        with MappedFile(file_path) as mapped_file:
+            return parse_json(mapped_file.view, decoder_name)
+
+    if decoder_name == "json":
+        with open(file_path, "r", encoding="utf-8") as file:
+            try:
+                source = file.read()
+            except UnicodeDecodeError as error:
+                return None, error
+
+            return parse_json(source, decoder_name)
+
+    with open(file_path, "rb") as file:
+        return parse_json(file.read(), decoder_name)
+
+def read_content_from_url(url: str, options: dict = None) -> str:
+    """
+    reads the content of the URL through the on-disk URL cache, see url_cache_dir, url_cache_ttl and offline configs
+    :param url: URL of the schema
+    :param options: configs of the validation, None uses the global configs
+    :return: content of the URL
+    """
+    options = configs if options is None else options
+    content = url_cache.fetch(url, options.get(url_cache_dir), options.get(url_cache_ttl), options.get(offline))
+    return content.decode()
+
+url_regex = re.compile(
+    r'^(?:http|ftp)s?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
 
-    with request.urlopen(url) as f:
-        return f.read().decode()
 
-def is_valid_url(path: str) -> bool:
-    regex = re.compile(
-        r'^(?:http|ftp)s?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+def is_valid_file(file_path: str) -> bool:
+    return isinstance(file_path, (str, os.PathLike)) and os.path.isfile(file_path)
 
-    return re.match(regex, path) is not None
 
-def is_valid_file(file_path: str) -> bool:
-    return os.path.isfile(str(file_path))
+# start of a json object or array text, matched in place so a large text isn't copied to skip its whitespace
+json_text_regex = re.compile(r"\s*[{\[]")
 
 
-def is_valid_dir(dir_path: str) -> bool:
-    return os.path.isdir(str(dir_path))
+def source_type(source) -> str:
+    """
+    identifies the kind of the given schema or document input, python type is checked first so only the checks
+    relevant to that type are done and an in-memory json is never converted to a string
+    :param source: dict, list, json text, bytes, file or directory path, URL or a readable stream
+    :return: one of the source_type_cls types
+    """
+    value_type = type(source)
 
+    if value_type is dict or value_type is list:
+        return source_type_cls.inline
 
-def is_valid_json(source) -> bool:
-    try:
-        if type(source) is not dict and type(source) is not list:
-            json.loads(source)
-        return True
-    except:
-        return False
+    if value_type is bytes or value_type is bytearray or value_type is memoryview:
+        return source_type_cls.bytes
+
+    if value_type is str:
+        # json text starts with an object or an array, no need to look for such a file
+        if json_text_regex.match(source) is not None:
+            return source_type_cls.json_text
 
+        if url_regex.match(source) is not None:
+            return source_type_cls.url
 
-def get_as_json(source):
+    if isinstance(source, (str, os.PathLike)):
+        if os.path.isfile(source):
+            return source_type_cls.file
+
+        if os.path.isdir(source):
+            return source_type_cls.dir
+
+        return source_type_cls.json_text if value_type is str else source_type_cls.unknown
+
+    if callable(getattr(source, "read", None)):
+        return source_type_cls.stream
+
+    return source_type_cls.unknown
+
+
+def parse_source(source, source_kind: str, decoder: str = None) -> tuple:
+    """
+    parses an inline, json text, bytes or stream input once
+    :param source: schema or document input
+    :param source_kind: type of the input, see source_type
+    :param decoder: json decoder name, see json_decoder config
+    :return: (json value, None) when the source is valid otherwise (None, error)
+    """
+    if source_kind == source_type_cls.stream:
+        source = source.read()
+
+    elif source_kind not in source_type_cls.json_types():
+        return None, ValueError(f"{source_kind} input is not json")
+
+    return parse_json(source, decoder)
+
+
+def parse_json(source, decoder: str = None) -> tuple:
+    """
+    parses the given json text once, a dict or a list is returned as it is
+    :param source: json text as str or bytes, dict or list
+    :param decoder: json decoder name, see json_decoder config, None uses the global config
+    :return: (json value, None) when the source is valid otherwise (None, error), the error tells the position
+    """
     if type(source) is dict or type(source) is list:
-        return source
-    else:
-        return json.loads(source)
+        return source, None
+
+    try:
+        return decoders.loads(source, configs.get(json_decoder) if decoder is None else decoder), None
+    except (ValueError, TypeError, RecursionError) as error:
+        return None, error
 
 
 def dump_log(output_list: list):
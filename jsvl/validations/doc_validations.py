@@ -1,18 +1,19 @@
-import json
-import re
 from abc import abstractmethod
 
 from jsvl.utils.message_list import ml
-from jsvl.utils.util import converted_type, combine, reserved_key, regex_keys, data_type_cls as dt
+from jsvl.utils.util import converted_type, reserved_key, length_data_types, value_data_types, \
+    value_array_data_types, is_same_value, binding_key
 from jsvl.validations.validation import Validation
-import jsvl.models.schema as schema_model
 
 
 class DocValidation(Validation):
 
-    def __init__(self):
-        super().__init__()
-        self.full_path = None
+    # the built-in filters take the path as models.path.Path segments, the other filters get the dotted path string
+    path_segments = False
+
+    @property
+    def full_path(self):
+        return self.context.full_path
 
     def run(self, key, schema, doc, path, index, doc_is_dynamic):
 
@@ -22,8 +23,10 @@ class DocValidation(Validation):
         if schema.get(key).can_bypass:
             return
 
-        self.full_path = combine(path, key)
-        self.validate(key, schema, doc, path, index, doc_is_dynamic)
+        context = self.context
+        context.path = path
+        context.key = key
+        self.validate(key, schema, doc, path if self.path_segments else str(path), index, doc_is_dynamic)
 
     @abstractmethod
     def validate(self, key, schema, doc, path, index, doc_is_dynamic):
@@ -63,10 +66,9 @@ class ValidateDataEquality(DocValidation):
         doc_val = doc.get(key)
 
         if doc_val is not None:
-            expected_type_list = obj.data_type.split("|")
-            actual_type = converted_type(doc_val)
-            if actual_type not in expected_type_list:
-                expected_types = " or ".join(expected_type_list)
+            actual_type = self.context.value_type(doc_val)
+            if actual_type not in obj.data_types:
+                expected_types = " or ".join(obj.data_type.split("|"))
                 self.create_error(ml.data_inequality(self.full_path, expected_types, actual_type))
 
 
@@ -84,8 +86,8 @@ class ValidateDocBinding(DocValidation):
         if binding is None or actual_value is None:
             return
 
-        binder = schema_model.schema_doc.get(reserved_key.binder)
-        expected_value = binder.get(binding).val
+        binder = self.context.schema_doc.get(reserved_key.binder).get(binding)
+        expected_value = binder.val
         expected_type = type(expected_value)
         actual_type = type(actual_value)
 
@@ -93,8 +95,13 @@ class ValidateDocBinding(DocValidation):
             self.__validate_str_binding(expected_value, actual_value, expected_type, actual_type)
 
         elif expected_type is dict:
-            if str(expected_value) != str(actual_value):
-                self.create_error(ml.invalid_binding_object(self.full_path, expected_value))
+            # == runs at C speed, stops on the first difference and ignores the key order, the structural compare
+            # is only needed to tell 1, 1.0 and True apart when the binder holds numbers or booleans
+            is_same = expected_value == actual_value and (
+                    not binder.binding_has_numbers or is_same_value(expected_value, actual_value))
+
+            if not is_same:
+                self.create_error(ml.invalid_binding_object(self.full_path, binder.binding_object_text))
 
         elif expected_type is list:
 
@@ -102,9 +109,8 @@ class ValidateDocBinding(DocValidation):
                 if actual_type is not list or len(actual_value) > 0:
                     self.create_error(ml.empty_array_binding(self.full_path))
 
-            elif str(actual_value) not in [str(item) for item in expected_value]:
-                fields = json.dumps(expected_value, indent=4)
-                self.create_error(ml.invalid_binding_array_item(self.full_path, binding, fields))
+            elif binding_key(actual_value) not in binder.binding_index:
+                self.create_error(ml.invalid_binding_array_item(self.full_path, binding, binder.binding_array_text))
 
     def __validate_str_binding(self, expected_value, actual_value, expected_type, actual_type):
 
@@ -122,17 +128,16 @@ class ValidateDocBinding(DocValidation):
 class ValidateDocRegexBinding(DocValidation):
 
     def validate(self, key, schema, doc, path, index, doc_is_dynamic):
-        regex_pattern = schema.get(key).regex_binding
-        regex_error = schema.get(key).regex_error_message
+        obj = schema.get(key)
+        regex_pattern = obj.regex_pattern
         actual_value = doc.get(key)
 
+        # an invalid pattern is reported by the schema validation, the document is not validated in that case
         if regex_pattern is None or actual_value is None:
             return
 
-        regex_pattern = str(regex_pattern)
-        regex_pattern = regex_pattern if regex_keys.get(regex_pattern) is None else regex_keys.get(regex_pattern)
-
-        if not re.match(regex_pattern, str(actual_value)):
+        regex_error = obj.regex_error_message
+        if not regex_pattern.match(str(actual_value)):
             self.create_error(ml.regex_binding_error(self.full_path, regex_error))
 
 
@@ -172,8 +177,7 @@ class ValidateDocMinMaxLength(DocValidation):
         actual_value = doc.get(key)
         obj = schema.get(key)
 
-        available_types = [dt.string, dt.object_array, dt.string_array, dt.integer_array, dt.float_array, dt.bool_array, dt.array]
-        if converted_type(actual_value) in available_types and obj.data_type in available_types:
+        if obj.has_length_constraint and self.context.value_type(actual_value) in length_data_types:
             actual_length = len(actual_value)
             scope = "character(s)" if type(actual_value) is str else "item(s)"
             if actual_length < obj.min_length:
@@ -189,14 +193,25 @@ class ValidateDocMinMaxValue(DocValidation):
         actual_value = doc.get(key)
         obj = schema.get(key)
 
-        available_types = [dt.integer, dt.float]
-        if converted_type(actual_value) in available_types and obj.data_type in available_types:
+        if obj.has_value_constraint and self.context.value_type(actual_value) in value_data_types:
             if actual_value < obj.min_value:
                 self.create_error(ml.min_value_error(self.full_path, obj.min_value, actual_value))
 
             if obj.max_value is not None and actual_value > obj.max_value:
                 self.create_error(ml.max_value_error(self.full_path, obj.max_value, actual_value))
 
+        # the range of every item is checked at once, min() and max() scan the array in C
+        elif obj.has_item_value_constraint and self.context.value_type(actual_value) in value_array_data_types:
+            if obj.min_value is not None:
+                min_item = min(actual_value)
+                if min_item < obj.min_value:
+                    self.create_error(ml.min_item_value_error(self.full_path, obj.min_value, min_item))
+
+            if obj.max_value is not None:
+                max_item = max(actual_value)
+                if max_item > obj.max_value:
+                    self.create_error(ml.max_item_value_error(self.full_path, obj.max_value, max_item))
+
 
 # create validation set
 doc_validation_set = {
@@ -210,4 +225,7 @@ doc_validation_set = {
     ValidateDocMinMaxValue()
 }
 
+for built_in_validation in doc_validation_set:
+    built_in_validation.path_segments = True
+
 validate_unknown_keys = ValidateUnknownKeys()
@@ -1,8 +1,7 @@
 from abc import abstractmethod
 
 from jsvl.utils.util import reserved_key, data_type_cls, converted_type, is_find_data_type, is_exact_match_data_type, \
-    is_valid_text_case, is_valid_regex, regex_keys
-import jsvl.models.schema as schema_model
+    is_valid_text_case
 from jsvl.utils.message_list import ml
 from jsvl.validations.validation import Validation
 
@@ -52,7 +51,7 @@ class ValidateSchemaBindings(SchemaValidation):
         regex_binding = value.regex_binding
 
         if type(binding) is str:
-            binder = schema_model.schema_doc.get("__binder__")
+            binder = self.context.schema_doc.get("__binder__")
 
             if binder is None:
                 self.create_error(ml.missing_binder_object())
@@ -61,14 +60,8 @@ class ValidateSchemaBindings(SchemaValidation):
             if binder.get(binding) is None:
                 self.create_error(ml.missing_binding(binding))
 
-        if type(regex_binding) is str:
-            regex_binding = self.resolve_pattern(regex_binding)
-            regex_result = is_valid_regex(regex_binding)
-            if regex_result is not None:
-                self.create_error(ml.invalid_regex_binding(f"{path}.{reserved_key.bind_regex}", regex_result))
-
-    def resolve_pattern(self, regex):
-        return regex_keys.get(regex) if regex in regex_keys.keys() else regex
+        if type(regex_binding) is str and value.regex_compile_error is not None:
+            self.create_error(ml.invalid_regex_binding(f"{path}.{reserved_key.bind_regex}", value.regex_compile_error))
 
 
 class ValidateValueType(SchemaValidation):
@@ -158,7 +151,8 @@ class ValidateKeysCombinations(SchemaValidation):
                         self.create_error(ml.key_support_with_string(f"{path}.{string_support_key}"))
 
             # check irrelevant keys when data type is not integer or float
-            if not is_find_data_type(data_type, [data_type_cls.integer, data_type_cls.float]):
+            if not is_find_data_type(data_type, [data_type_cls.integer, data_type_cls.float, data_type_cls.integer_array,
+                                                 data_type_cls.float_array]):
                 number_type_support_keys = [reserved_key.min_value, reserved_key.max_value]
                 for number_support_key in number_type_support_keys:
                     if number_support_key in val.keys():
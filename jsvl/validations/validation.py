@@ -1,30 +1,38 @@
 from abc import ABC
 
+from jsvl.models.context import active_context, ValidationContext
 from jsvl.models.object_set import ObjectSet
 from jsvl.models.result import Error, Warn, Info, Success
 
 
 class Validation(ABC):
 
-    def __init__(self):
-        self.__results = ObjectSet()
+    @property
+    def context(self) -> ValidationContext:
+        return active_context()
 
     def create_error(self, message):
-        self.__results.add(Error(message, self))
+        context = active_context()
+        if context.result_set(self).add(Error(message, self)):
+            context.error_count += 1
 
     def create_warn(self, message):
-        self.__results.add(Warn(message, self))
+        self.__results().add(Warn(message, self))
 
     def create_info(self, message):
-        self.__results.add(Info(message, self))
+        self.__results().add(Info(message, self))
 
     def create_success(self, message):
-        self.__results.add(Success(message, self))
+        self.__results().add(Success(message, self))
 
     def init_log_set(self):
-        self.__results.ini()
+        self.__results().ini()
 
     def get_set(self):
-        return self.__results.item_set()
+        return self.__results().item_set()
 
+    def get_new_set(self):
+        return self.__results().take_new_items()
 
+    def __results(self) -> ObjectSet:
+        return active_context().result_set(self)
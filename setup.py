@@ -23,10 +23,14 @@ setup(
     long_description=README,
     long_description_content_type="text/markdown",
     keywords="python json schema validation",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks*", "tests*")),
     install_requires=[
         'ordered_set',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Environment :: Console",
@@ -44,6 +48,7 @@ setup(
     entry_points={
         "console_scripts": [
             "jsvl = jsvl.cli:run_validation",
+            "jsvlc = jsvl.core.client:main",
         ],
     },
 )
\ No newline at end of file
@@ -0,0 +1,13 @@
+import pytest
+
+import jsvl.config as cfg
+from jsvl.utils import json_decoder
+
+
+@pytest.fixture(autouse=True, params=json_decoder.available_decoders())
+def json_decoder_backend(request, monkeypatch):
+    """
+    every test runs once with each installed json decoder
+    """
+    monkeypatch.setitem(cfg.configs, cfg.json_decoder, request.param)
+    return request.param
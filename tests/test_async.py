@@ -0,0 +1,103 @@
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator, validate, validate_async, validate_many_async
+from jsvl.utils.message_list import ml
+
+
+class AsyncReader:
+    """
+    stand-in of an async stream, e.g. a request body
+    """
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def read(self) -> bytes:
+        AsyncReader.active += 1
+        AsyncReader.max_active = max(AsyncReader.max_active, AsyncReader.active)
+        await asyncio.sleep(0.01)
+        AsyncReader.active -= 1
+        return self.content
+
+
+class TestAsync:
+
+    schema = {
+        "id*": {
+            "__data_type__": "integer"
+        },
+        "tags": {
+            "__data_type__": "string_array"
+        }
+    }
+
+    document = {"id": "1", "tags": ["a"], "name": "x"}
+
+    def test_results_are_same_as_validate(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(cfg.configs, cfg.enable_output_logs, False)
+        doc_file = tmp_path / "order.json"
+        doc_file.write_text(json.dumps(self.document))
+        text = json.dumps(self.document)
+
+        expected = self.__messages(validate(self.schema, self.document)[0])
+
+        for document in [self.document, text, text.encode(), str(doc_file), io.StringIO(text),
+                         AsyncReader(text.encode())]:
+            assert self.__messages(asyncio.run(validate_async(self.schema, document))[0]) == expected
+
+    def test_large_documents_are_validated_in_the_executor(self):
+        validator = Validator(self.schema, {cfg.enable_output_logs: False, cfg.async_offload_size: 64})
+        threads = []
+        execute = validator.execute
+
+        def record_thread(document):
+            threads.append(threading.current_thread())
+            return execute(document)
+
+        validator.execute = record_thread
+        small = json.dumps(self.document)
+        large = json.dumps(dict(self.document, name="x" * 100))
+
+        async def run():
+            await validator.execute_async(small)
+            await validator.execute_async(large)
+
+        asyncio.run(run())
+
+        assert threads[0] is threading.main_thread()
+        assert threads[1] is not threading.main_thread()
+
+    def test_concurrency_limit(self):
+        documents = [AsyncReader(json.dumps({"id": i}).encode()) for i in range(20)]
+        AsyncReader.max_active = 0
+
+        validator = Validator(self.schema, {cfg.enable_output_logs: False})
+        outputs = asyncio.run(validator.execute_many_async(documents, limit=4))
+
+        assert AsyncReader.max_active == 4
+        assert [self.__messages(output) for output in outputs] == [[ml.document_successfully_validated()]] * 20
+
+    def test_process_pool_executor(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(cfg.configs, cfg.enable_output_logs, False)
+        doc_files = []
+        for i in range(4):
+            doc_files.append(tmp_path / f"order_{i}.json")
+            doc_files[-1].write_text(json.dumps({"id": i if i % 2 == 0 else str(i)}))
+
+        with ProcessPoolExecutor(2) as executor:
+            outputs = asyncio.run(validate_many_async(self.schema, [str(file) for file in doc_files],
+                                                      executor=executor))
+
+        assert [ml.document_successfully_validated() in self.__messages(output) for output in outputs] == [
+            True, False, True, False]
+
+    def __messages(self, output) -> list:
+        return [result.message for result in output.document_result]
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import jsvl.config as cfg
+import jsvl.models.context as context_module
+from jsvl.core.validator import Validator, execute
+from jsvl.models.context import ValidationContext
+from jsvl.utils.message_list import ml
+from jsvl.validations.doc_validations import ValidateRequiredFields
+
+
+class TestValidationContext:
+
+    schemas = [
+        {"id*": {"__data_type__": "integer"}, "__binder__": {}},
+        {"name*": {"__min_length__": 3}, "code": {"__bind__": "codes"}, "__binder__": {"codes": ["A", "B"]}},
+        {"items*": {"__data_type__": "object_array", "sku*": {"__bind_regex__": "__numeric__"}}},
+        {"price": {"__data_type__": "float", "__max_value__": 10.0}, "tag": {"__case__": "__upper__"}},
+    ]
+
+    documents = [
+        {"id": "1"},
+        {"name": "Al", "code": "C"},
+        {"items": [{"sku": "12"}, {"sku": "ab"}, {}]},
+        {"price": 11.5, "tag": "low", "extra": True},
+    ]
+
+    def test_results_are_isolated_between_threads(self):
+        expected = [self.__run(index) for index in range(len(self.schemas))]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            indexes = [i % len(self.schemas) for i in range(400)]
+            for index, actual in zip(indexes, executor.map(self.__run, indexes)):
+                assert actual == expected[index]
+
+    def test_compiled_validators_are_isolated_between_threads(self):
+        validators = [Validator(schema, {cfg.enable_output_logs: False}) for schema in self.schemas]
+        expected = [self.__messages(validators[i].validate(self.documents[i]).document_result)
+                    for i in range(len(validators))]
+
+        def run(index):
+            return index, self.__messages(validators[index].validate(self.documents[index]).document_result)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for index, actual in executor.map(run, [i % len(validators) for i in range(400)]):
+                assert actual == expected[index]
+
+    def test_validation_writes_into_active_context(self):
+        validation = ValidateRequiredFields()
+        first = ValidationContext()
+        second = ValidationContext()
+
+        with first:
+            validation.create_error(ml.missing_required_key("id"))
+
+            with second:
+                validation.create_error(ml.missing_required_key("name"))
+
+        assert [result.message for result in first.result_set(validation).item_set()] == [
+            ml.missing_required_key("id")]
+        assert [result.message for result in second.result_set(validation).item_set()] == [
+            ml.missing_required_key("name")]
+
+    def test_value_type_is_classified_once(self, monkeypatch):
+        values = [i for i in range(1000)]
+        calls = []
+        original = context_module.converted_type
+
+        def converted_type(value):
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(context_module, "converted_type", converted_type)
+
+        validator = Validator({"values": {"__data_type__": "integer_array", "__min_length__": 1}},
+                              {cfg.enable_output_logs: False})
+
+        assert validator.is_valid({"values": values})
+        assert len([value for value in calls if value is values]) == 1
+
+    def __run(self, index) -> tuple:
+        out = []
+        execute(self.schemas[index], self.documents[index], out)
+        return self.__messages(out[0].schema_result), self.__messages(out[0].document_result)
+
+    def __messages(self, results) -> list:
+        return [result.message for result in results]
@@ -220,6 +220,78 @@ class TestDocValidation:
 
         self.__assert_result(actual_logs, expected_logs, 6)
 
+    def test_validate_binding_list_items(self):
+        schema = {
+            "__data_type__": "object_array",
+            "value*": {
+                "__bind__": "values"
+            },
+            "__binder__": {
+                "values": [1, "KHI", True, [1, 2], {"floor": 4}]
+            }
+        }
+
+        doc = [{"value": 1}, {"value": "KHI"}, {"value": True}, {"value": [1, 2]}, {"value": {"floor": 4}},
+               {"value": "1"}, {"value": "RWP"}, {"value": [2, 1]}]
+
+        actual_logs = self.__validate(schema, doc, validation=ValidateDocBinding)
+        fields = json.dumps(schema.get(reserved_key.binder).get("values"), indent=4)
+        expected_logs = [
+            ml.invalid_binding_array_item("root[5].value", "values", fields),
+            ml.invalid_binding_array_item("root[6].value", "values", fields),
+            ml.invalid_binding_array_item("root[7].value", "values", fields),
+        ]
+
+        self.__assert_result(actual_logs, expected_logs, 3)
+
+    def test_validate_binding_list_items_by_type(self):
+        schema = {
+            "__data_type__": "object_array",
+            "value*": {
+                "__bind__": "values"
+            },
+            "__binder__": {
+                "values": [1, "2", {"a": 1, "b": [True]}]
+            }
+        }
+
+        doc = [{"value": 1}, {"value": {"b": [True], "a": 1}}, {"value": True}, {"value": 1.0}, {"value": 2},
+               {"value": {"a": 1, "b": [1]}}]
+
+        actual_logs = self.__validate(schema, doc, validation=ValidateDocBinding)
+        fields = json.dumps(schema.get(reserved_key.binder).get("values"), indent=4)
+        expected_logs = [ml.invalid_binding_array_item(f"root[{i}].value", "values", fields) for i in range(2, 6)]
+
+        self.__assert_result(actual_logs, expected_logs, 4)
+
+    def test_validate_binding_objects(self):
+        schema = {
+            "__data_type__": "object_array",
+            "model*": {
+                "__bind__": "structure"
+            },
+            "__binder__": {
+                "structure": {"floor": 4, "rooms": ["a", "b"], "meta": {"lift": True, "name": "A"}}
+            }
+        }
+
+        doc = [
+            {"model": {"meta": {"name": "A", "lift": True}, "rooms": ["a", "b"], "floor": 4}},
+            {"model": {"floor": 4.0, "rooms": ["a", "b"], "meta": {"lift": True, "name": "A"}}},
+            {"model": {"floor": 4, "rooms": ["a", "b"], "meta": {"lift": 1, "name": "A"}}},
+            {"model": {"floor": 4, "rooms": ["b", "a"], "meta": {"lift": True, "name": "A"}}},
+        ]
+
+        actual_logs = self.__validate(schema, doc, validation=ValidateDocBinding)
+        expected = str(schema.get(reserved_key.binder).get("structure"))
+        expected_logs = [
+            ml.invalid_binding_object("root[1].model", expected),
+            ml.invalid_binding_object("root[2].model", expected),
+            ml.invalid_binding_object("root[3].model", expected),
+        ]
+
+        self.__assert_result(actual_logs, expected_logs, 3)
+
     def test_validate_regex_bind(self):
         schema = {
             "id": {
@@ -411,6 +483,37 @@ class TestDocValidation:
 
         self.__assert_result(actual_logs, expected_logs, 2)
 
+    def test_validate_min_max_item_value(self):
+        schema = {
+            "readings": {
+                "__data_type__": "integer_array",
+                "__min_value__": -5,
+                "__max_value__": 10
+            },
+            "ratios": {
+                "__data_type__": "float_array",
+                "__max_value__": 1.5
+            },
+            "counts": {
+                "__data_type__": "integer_array"
+            }
+        }
+
+        doc = {
+            "readings": [1, -7, 12, 3],
+            "ratios": [0.5, 2.5],
+            "counts": [-100, 100]
+        }
+
+        actual_logs = self.__validate(schema, doc, validation=ValidateDocMinMaxValue)
+        expected_logs = [
+            ml.min_item_value_error("readings", -5, -7),
+            ml.max_item_value_error("readings", 10, 12),
+            ml.max_item_value_error("ratios", 1.5, 2.5),
+        ]
+
+        self.__assert_result(actual_logs, expected_logs, 3)
+
     def __assert_result(self, actual_logs: list, expected_logs: list, expected_size: int = -1):
 
         if expected_size > -1:
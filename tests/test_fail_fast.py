@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.models.result import Error
+from jsvl.utils.message_list import ml
+
+
+class TestFailFast:
+
+    schema = {
+        "__data_type__": "object_array",
+        "id*": {
+            "__data_type__": "integer"
+        },
+        "name": {
+            "__min_length__": 3
+        }
+    }
+
+    document = [{"id": i, "name": "valid"} for i in range(50)] + [{"name": "x"}, {"id": "1"}, {}, {}]
+
+    def test_fail_fast(self):
+        output = Validator(self.schema, {cfg.enable_output_logs: False, cfg.fail_fast: True}).execute(self.document)
+        errors = [result.message for result in output.document_result if type(result) is Error]
+
+        assert errors == [ml.missing_required_key("root[50].id")]
+        assert ml.validation_stopped(1) in [result.message for result in output.document_result]
+
+    def test_max_errors(self):
+        output = Validator(self.schema, {cfg.enable_output_logs: False, cfg.max_errors: 3}).execute(self.document)
+        errors = [result for result in output.document_result if type(result) is Error]
+
+        assert len(errors) == 3
+
+    @pytest.mark.parametrize("options, count", [({cfg.fail_fast: True}, 1), ({cfg.max_errors: 2}, 2)])
+    def test_unknown_keys_of_one_object(self, options, count):
+        output = Validator({"x": {}}, {cfg.enable_output_logs: False, **options}).execute({"a": 1, "b": 2, "c": 3})
+        errors = [result.message for result in output.document_result if type(result) is Error]
+
+        assert errors == [ml.unknown_key(key) for key in "abc"][:count]
+        assert ml.validation_stopped(count) in [result.message for result in output.document_result]
+
+    def test_max_errors_in_ndjson(self, tmp_path):
+        doc_file = tmp_path / "events.ndjson"
+        doc_file.write_text("\n".join(json.dumps(item) for item in self.document))
+
+        options = {cfg.enable_output_logs: False, cfg.max_errors: 2, cfg.ndjson: True}
+        output = Validator({"id*": {"__data_type__": "integer"}, "name": {}}, options).execute(str(doc_file))
+        errors = [result.message for result in output.document_result if type(result) is Error]
+
+        assert errors == [ml.ndjson_line(51, ml.missing_required_key("id")),
+                          ml.ndjson_line(52, ml.data_inequality("id", "integer", "string"))]
+
+    @pytest.mark.parametrize("options, count", [({cfg.fail_fast: True}, 1), ({cfg.max_errors: 2}, 2)])
+    def test_invalid_lines_in_ndjson(self, tmp_path, options, count):
+        doc_file = tmp_path / "events.ndjson"
+        doc_file.write_text("{\n[1,\nnot json\n" + json.dumps({"id": "1"}) + "\n")
+
+        options = {cfg.enable_output_logs: False, cfg.ndjson: True, **options}
+        validator = Validator({"id*": {"__data_type__": "integer"}}, options)
+        messages = [result.message for result in validator.execute(str(doc_file)).document_result]
+
+        assert len([message for message in messages if message.startswith("Line ")]) == count
+        assert messages[-1] == ml.validation_stopped(count)
+        assert not validator.is_valid(str(doc_file))
+
+    def test_is_valid(self):
+        validator = Validator(self.schema, {cfg.enable_output_logs: False})
+
+        assert validator.is_valid(self.document[:50])
+        assert not validator.is_valid(self.document)
+        assert not validator.is_valid("not a json")
+        assert not Validator({"id": {"__data_type__": "number"}}, {cfg.enable_output_logs: False}).is_valid({"id": 1})
+
+    @pytest.mark.parametrize("options", [{cfg.fail_fast: True}, {cfg.max_errors: 2}])
+    @pytest.mark.parametrize("schema, document", [
+        ({"__data_type__": "array", "id": {"__data_type__": "integer"}}, [{"x": 1}, 1]),
+        ({"__data_type__": "array", "id": {"__data_type__": "integer"}}, [{"x": 1}, {"y": 2}, {"z": 3}, "a"]),
+        ({"__data_type__": "object_array", "id*": {"__data_type__": "integer"}}, [{"x": 1}, {"y": 2}, {"id": 3}]),
+    ])
+    def test_stream_results_are_same(self, tmp_path, options, schema, document):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_text(json.dumps(document))
+        options = {cfg.enable_output_logs: False, **options}
+
+        expected = Validator(schema, options)
+        actual = Validator(schema, {**options, cfg.stream: True})
+
+        assert [result.message for result in actual.execute(str(doc_file)).document_result] == [
+            result.message for result in expected.execute(document).document_result]
+        assert actual.is_valid(str(doc_file)) is expected.is_valid(document)
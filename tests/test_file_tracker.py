@@ -0,0 +1,89 @@
+import os
+
+import jsvl.utils.file_tracker as file_tracker_module
+from jsvl.utils.file_tracker import FileTracker
+
+
+def age(*paths):
+    # moves the mtime out of the racy window so the tracker trusts the signature
+    for path in paths:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+
+
+def test_changed_and_removed_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    files = [tmp_path / "order.json", tmp_path / "sub" / "user.json"]
+    for file in files:
+        file.write_text("{}")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / ".hidden" / "order.json").write_text("{}")
+
+    tracker = FileTracker(str(tmp_path))
+
+    assert tracker.poll() == ({str(file) for file in files}, set())
+    assert tracker.poll() == (set(), set())
+
+    files[0].write_text('{"id": 1}')
+    (tmp_path / "sub" / "item.json").write_text("{}")
+    os.unlink(files[1])
+
+    assert tracker.poll() == ({str(files[0]), str(tmp_path / "sub" / "item.json")}, {str(files[1])})
+    assert tracker.poll() == (set(), set())
+
+
+def test_same_content_is_not_a_change(tmp_path):
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text('{"id": 1}')
+    age(doc_file)
+    tracker = FileTracker(str(doc_file))
+    tracker.poll()
+
+    doc_file.write_text('{"id": 1}')
+    assert tracker.poll() == (set(), set())
+
+    doc_file.write_text('{"id": 2}')
+    assert tracker.poll() == ({str(doc_file)}, set())
+
+
+def test_unchanged_tree_is_only_stat(tmp_path, monkeypatch):
+    (tmp_path / "sub").mkdir()
+    for i in range(10):
+        (tmp_path / "sub" / f"order_{i}.json").write_text("{}")
+    age(tmp_path, tmp_path / "sub", *(tmp_path / "sub").iterdir())
+
+    tracker = FileTracker(str(tmp_path))
+    tracker.poll()
+
+    listed = []
+    hashed = []
+    scandir = os.scandir
+    monkeypatch.setattr(file_tracker_module.os, "scandir", lambda path: listed.append(path) or scandir(path))
+    monkeypatch.setattr(file_tracker_module, "open", lambda path, mode: hashed.append(path) or open(path, mode),
+                        raising=False)
+
+    assert tracker.poll() == (set(), set())
+    assert listed == [] and hashed == []
+
+    (tmp_path / "sub" / "order_0.json").write_text('{"id": 1}')
+    (tmp_path / "sub" / "order_10.json").write_text("{}")
+
+    assert tracker.poll() == ({str(tmp_path / "sub" / "order_0.json"), str(tmp_path / "sub" / "order_10.json")},
+                              set())
+    assert listed == [str(tmp_path / "sub")]
+    assert sorted(hashed) == [str(tmp_path / "sub" / "order_0.json"), str(tmp_path / "sub" / "order_10.json")]
+
+
+def test_racily_clean_file_is_checked_again(tmp_path):
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text('{"id": 1}')
+    tracker = FileTracker(str(doc_file))
+    tracker.poll()
+
+    # modified again within the same mtime and size, only the content tells the change
+    stat = os.stat(doc_file)
+    doc_file.write_text('{"id": 2}')
+    os.utime(doc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert tracker.poll() == ({str(doc_file)}, set())
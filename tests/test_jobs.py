@@ -0,0 +1,89 @@
+import json
+import multiprocessing
+
+import jsvl.config as cfg
+from jsvl.core.validator import execute
+from jsvl.utils.message_list import ml
+from jsvl.validations.doc_validations import doc_validation_set, DocValidation
+
+
+class NoUserKey(DocValidation):
+
+    def validate(self, key, schema, doc, path, index, doc_is_dynamic):
+        if key == "name":
+            self.create_error(f"{key} is checked by a custom filter")
+
+
+class TestJobs:
+
+    def test_parallel_directory_validation(self, tmp_path):
+        schema_dir, doc_dir = self.__create_files(tmp_path)
+
+        serial = self.__execute(str(schema_dir), str(doc_dir), 1)
+        parallel = self.__execute(str(schema_dir), str(doc_dir), 3)
+
+        assert parallel == serial
+        assert ml.no_schema_found(f"a_order{cfg.configs.get(cfg.schema_file_postfix)}") in serial[0]
+        assert ml.no_schema_found(f"extra{cfg.configs.get(cfg.schema_file_postfix)}") in serial[0]
+        assert ml.document_successfully_validated() in serial[1]
+        assert ml.missing_required_key("name") in serial[2]
+
+    def test_parallel_validation_with_single_schema(self, tmp_path):
+        schema_dir, doc_dir = self.__create_files(tmp_path)
+        schema = str(schema_dir / "order_schema.json")
+
+        serial = self.__execute(schema, str(doc_dir), 1)
+        parallel = self.__execute(schema, str(doc_dir), 2)
+
+        assert parallel == serial
+        assert len(serial) == 5
+
+        # documents are always validated in sorted file order
+        for messages, name in zip(serial[1:], ["a_order.json", "extra.json", "order.json", "user.json"]):
+            assert ml.doc_file_loaded(str(doc_dir / name)) in messages
+
+    def test_custom_filters_in_spawned_workers(self, tmp_path):
+        schema_dir, doc_dir = self.__create_files(tmp_path)
+        validation = NoUserKey()
+        doc_validation_set.add(validation)
+        start_method = multiprocessing.get_start_method(allow_none=True)
+        multiprocessing.set_start_method("spawn", force=True)
+
+        try:
+            serial = self.__execute(str(schema_dir), str(doc_dir), 1)
+            parallel = self.__execute(str(schema_dir), str(doc_dir), 2)
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+            doc_validation_set.discard(validation)
+
+        # the filters are kept in a set, a spawned worker runs them in another order
+        assert [sorted(messages) for messages in parallel] == [sorted(messages) for messages in serial]
+        assert "name is checked by a custom filter" in serial[2]
+
+    def __create_files(self, tmp_path):
+        schema_dir = tmp_path / "schemas"
+        doc_dir = tmp_path / "docs"
+        schema_dir.mkdir()
+        doc_dir.mkdir()
+
+        (schema_dir / "order_schema.json").write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+        (schema_dir / "user_schema.json").write_text(json.dumps({"name*": {}}))
+
+        (doc_dir / "order.json").write_text(json.dumps({"id": 1}))
+        (doc_dir / "a_order.json").write_text(json.dumps({"id": 2}))
+        (doc_dir / "user.json").write_text(json.dumps({"id": 1}))
+        (doc_dir / "extra.json").write_text(json.dumps({"name": "x"}))
+
+        return schema_dir, doc_dir
+
+    def __execute(self, schema, document, jobs) -> list:
+        default_jobs = cfg.configs.get(cfg.jobs)
+        cfg.configs[cfg.jobs] = jobs
+
+        try:
+            out = []
+            execute(schema, document, out)
+        finally:
+            cfg.configs[cfg.jobs] = default_jobs
+
+        return [[result.message for result in [*output.schema_result, *output.document_result]] for output in out]
@@ -0,0 +1,69 @@
+import importlib
+
+import pytest
+
+import jsvl.config as cfg
+from jsvl.core.arg_parser import setup_arg_parser
+from jsvl.core.validator import Validator
+from jsvl.utils import json_decoder
+
+
+@pytest.fixture
+def missing_decoders(monkeypatch):
+    missing = set()
+    import_module = importlib.import_module
+
+    def find_module(name):
+        if name in missing:
+            raise ImportError(name)
+        return import_module(name)
+
+    json_decoder.resolve.cache_clear()
+    monkeypatch.setattr(importlib, "import_module", find_module)
+    yield missing
+    json_decoder.resolve.cache_clear()
+
+
+def test_auto_picks_the_fastest_installed_decoder(missing_decoders):
+    assert json_decoder.resolve()[0] == json_decoder.available_decoders()[0]
+
+    missing_decoders.update({"orjson", "ujson"})
+    json_decoder.resolve.cache_clear()
+
+    assert json_decoder.resolve()[0] == "json"
+    assert json_decoder.available_decoders() == ["json"]
+
+
+def test_missing_or_unknown_decoder_falls_back_to_json(missing_decoders):
+    missing_decoders.add("orjson")
+
+    assert json_decoder.resolve("orjson")[0] == "json"
+    assert json_decoder.resolve("simdjson")[0] == "json"
+    assert json_decoder.loads('{"a": [1, 2.5]}', "orjson") == {"a": [1, 2.5]}
+
+
+def test_every_decoder_reads_text_and_bytes(json_decoder_backend):
+    for source in ['{"a": "é"}', '{"a": "é"}'.encode(), bytearray('{"a": "é"}'.encode()),
+                   memoryview('{"a": "é"}'.encode())]:
+        assert json_decoder.loads(source, json_decoder_backend) == {"a": "é"}
+
+    with pytest.raises(ValueError):
+        json_decoder.loads(b'{"a": 1,}', json_decoder_backend)
+
+
+def test_default_decoder_keeps_big_integers_and_nan(tmp_path):
+    decoder = setup_arg_parser().parse_args(["-s", "{}"]).json_decoder
+    options = {cfg.enable_output_logs: False, cfg.json_decoder: decoder}
+    schema = {"id*": {"__data_type__": "integer"}, "score": {"__data_type__": "float"}}
+    doc_file = tmp_path / "order.json"
+
+    assert decoder == "json"
+
+    doc_file.write_text('{"id": 18446744073709551616}')
+    assert Validator(schema, options).is_valid(str(doc_file))
+
+    doc_file.write_text('{"id": 1, "score": NaN}')
+    assert Validator(schema, options).is_valid(str(doc_file))
+
+    doc_file.write_text('{"id": 1, "score": Infinity}')
+    assert Validator(schema, options).is_valid(str(doc_file))
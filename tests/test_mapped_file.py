@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+import jsvl.config as cfg
+import jsvl.utils.mapped_file as mapped_file_module
+import jsvl.utils.util as util_module
+from jsvl.core.validator import Validator
+from jsvl.models.result import Error
+from jsvl.utils.mapped_file import MappedFile, file_lines
+from jsvl.utils.util import parse_file
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 16, 1 << 20])
+def test_lines(tmp_path, chunk_size):
+    doc_file = tmp_path / "events.ndjson"
+    doc_file.write_bytes(b'{"id": 1}\r\n\n  \n{"name": "\xc3\xa9"}')
+
+    with MappedFile(doc_file) as mapped_file:
+        assert list(mapped_file.lines(chunk_size=chunk_size)) == [
+            (1, b'{"id": 1}\r'), (2, b""), (3, b"  "), (4, b'{"name": "\xc3\xa9"}')]
+        assert list(mapped_file.lines(True, chunk_size))[-1] == (4, '{"name": "é"}')
+
+    doc_file.write_bytes(b'{"id": 1}\n\n')
+
+    with MappedFile(doc_file) as mapped_file:
+        assert list(mapped_file.lines(chunk_size=chunk_size)) == [(1, b'{"id": 1}'), (2, b"")]
+
+
+def test_consumed_pages_are_released(tmp_path, monkeypatch):
+    monkeypatch.setattr(mapped_file_module, "release_size", 1)
+    doc_file = tmp_path / "events.ndjson"
+    records = [{"id": i, "name": "x" * 100} for i in range(1000)]
+    doc_file.write_text("\n".join(json.dumps(record) for record in records))
+
+    with MappedFile(doc_file) as mapped_file:
+        assert [json.loads(line) for _, line in mapped_file.lines(chunk_size=1000)] == records
+        assert mapped_file.released > 0
+
+
+def test_empty_file(tmp_path):
+    doc_file = tmp_path / "empty.json"
+    doc_file.write_text("")
+
+    with MappedFile(doc_file) as mapped_file:
+        assert list(mapped_file.lines()) == []
+
+    assert parse_file(doc_file)[1] is not None
+
+
+@pytest.mark.parametrize("use_memory_map", [False, True])
+def test_parse_file(tmp_path, json_decoder_backend, use_memory_map):
+    doc_file = tmp_path / "order.json"
+    document = {"id": 1, "name": "é", "tags": ["a", "b"], "price": 2.5}
+    doc_file.write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+
+    assert parse_file(doc_file, json_decoder_backend, use_memory_map) == (document, None)
+
+    doc_file.write_text('{"id": 1,}')
+    assert parse_file(doc_file, json_decoder_backend, use_memory_map)[1] is not None
+
+
+def test_file_lines_are_same_with_and_without_memory_map(tmp_path):
+    doc_file = tmp_path / "events.ndjson"
+    doc_file.write_bytes(b'{"id": 1}\r\n\n  \n{"name": "\xc3\xa9"}')
+
+    for text in [False, True]:
+        assert list(file_lines(doc_file, text)) == list(file_lines(doc_file, text, True))
+
+    assert list(file_lines(doc_file, True))[-1] == (4, '{"name": "é"}')
+
+
+@pytest.mark.parametrize("use_memory_map", [False, True])
+def test_files_which_are_not_utf_8(tmp_path, json_decoder_backend, use_memory_map):
+    doc_file = tmp_path / "order.json"
+    doc_file.write_bytes(b"\xff")
+    options = {cfg.enable_output_logs: False, cfg.memory_map: use_memory_map}
+
+    assert parse_file(doc_file, json_decoder_backend, use_memory_map)[1] is not None
+
+    output = Validator({"id": {}}, options).execute(str(doc_file))
+    assert [result.message for result in output.document_result][-1].startswith(
+        f"Document: {doc_file} is not a valid json file")
+
+    events_file = tmp_path / "events.ndjson"
+    events_file.write_bytes(b'{"id": 1}\n\xff\n{"id": 3}\n')
+
+    for text in [False, True]:
+        assert [line for _, line in file_lines(events_file, text, use_memory_map)][1] == b"\xff"
+
+    output = Validator({"id": {"__data_type__": "integer"}}, {**options, cfg.ndjson: True}).execute(str(events_file))
+    errors = [result.message for result in output.document_result if type(result) is Error]
+    assert len(errors) == 1 and errors[0].startswith("Line 2: is not a valid json")
+
+
+class NotMapped(MappedFile):
+
+    def __enter__(self):
+        raise AssertionError(f"{self.file_path} is mapped")
+
+
+def test_files_are_not_mapped_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(util_module, "MappedFile", NotMapped)
+    monkeypatch.setattr(mapped_file_module, "MappedFile", NotMapped)
+    schema = {"id*": {"__data_type__": "integer"}}
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text('{"id": 1}')
+    events_file = tmp_path / "events.ndjson"
+    events_file.write_text('{"id": 1}\n{"id": 2}\n')
+
+    assert Validator(schema, {cfg.enable_output_logs: False}).is_valid(str(doc_file))
+    assert Validator(schema, {cfg.enable_output_logs: False, cfg.ndjson: True}).is_valid(str(events_file))
+
+    with pytest.raises(AssertionError):
+        Validator(schema, {cfg.enable_output_logs: False, cfg.ndjson: True, cfg.memory_map: True}).execute(
+            str(events_file))
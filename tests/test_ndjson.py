@@ -0,0 +1,57 @@
+import json
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator, execute
+from jsvl.models.result import Error
+from jsvl.utils.message_list import ml
+
+
+class TestNdjson:
+
+    schema = {
+        "id*": {
+            "__data_type__": "integer"
+        },
+        "name": {}
+    }
+
+    def test_validate_ndjson_file(self, tmp_path):
+        doc_file = tmp_path / "events.ndjson"
+        doc_file.write_text("\n".join([
+            json.dumps({"id": 1, "name": "first"}),
+            json.dumps({"name": "second"}),
+            "",
+            "{bad json",
+            json.dumps({"id": "4", "extra": True}),
+        ]))
+
+        default_ndjson = cfg.configs.get(cfg.ndjson)
+        cfg.configs[cfg.ndjson] = True
+
+        try:
+            out = []
+            execute(self.schema, str(doc_file), out)
+        finally:
+            cfg.configs[cfg.ndjson] = default_ndjson
+
+        logs = [result.message for result in out[0].document_result]
+
+        assert ml.ndjson_line(2, ml.missing_required_key("id")) in logs
+        assert ml.ndjson_line(5, ml.data_inequality("id", "integer", "string")) in logs
+        assert ml.ndjson_line(5, ml.unknown_key("extra")) in logs
+        assert any(log.startswith("Line 4: is not a valid json") for log in logs)
+        assert len(logs) == 4
+
+    def test_validator_with_ndjson_option(self, tmp_path):
+        doc_file = tmp_path / "events.jsonl"
+        doc_file.write_text("\n".join(json.dumps({"id": i}) for i in range(100)))
+
+        validator = Validator(self.schema, {cfg.enable_output_logs: False, cfg.ndjson: True})
+        output = validator.validate(str(doc_file))
+
+        assert [result.message for result in output.document_result] == [ml.document_successfully_validated()]
+
+        doc_file.write_text("\n")
+        output = validator.validate(str(doc_file))
+
+        assert [type(result) for result in output.document_result] == [Error]
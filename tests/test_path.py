@@ -0,0 +1,76 @@
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.models.path import Path, root_path
+from jsvl.models.result import Error
+from jsvl.utils.message_list import ml
+from jsvl.validations.doc_validations import doc_validation_set, DocValidation
+
+
+class KeyPaths(DocValidation):
+
+    def validate(self, key, schema, doc, path, index, doc_is_dynamic):
+        if key == "name":
+            self.create_error(f"{type(path).__name__}:{path}")
+
+
+class TestPath:
+
+    options = {cfg.enable_output_logs: False}
+
+    def test_segments_are_joined(self):
+        assert str(Path()) == ""
+        assert str(Path().child("model")) == "model"
+        assert str(Path().child("model").child("floor")) == "model.floor"
+        assert str(Path().child("orders").item(1).child("sku")) == "orders[1].sku"
+        assert str(Path().child("matrix").item(0).item(2)) == "matrix[0][2]"
+        assert repr(Path().child("model").item(0)) == "Path('model[0]')"
+
+    def test_segments_are_shared(self):
+        orders = Path().child("orders")
+        first, second = orders.item(0), orders.item(1)
+
+        assert first.parent is orders and second.parent is orders
+        assert str(first.child("sku")) == "orders[0].sku"
+        assert str(orders) == "orders"
+
+    def test_index_and_key_segments(self):
+        # an index 0 and a key 0 are segments too, they are not taken as missing
+        assert str(Path().child("items").item(0)) == "items[0]"
+        assert str(Path().child(0).child("id")) == "0.id"
+
+    def test_root_path(self):
+        assert str(root_path()) == ""
+        assert str(root_path(3)) == ""
+        assert str(root_path(3, doc_is_dynamic=True)) == "root[3]"
+        assert str(root_path(3, doc_is_dynamic=True).child("id")) == "root[3].id"
+
+    def test_keys_containing_root(self):
+        schema = {
+            "__data_type__": "object_array",
+            "chroot*": {"__data_type__": "object", "rootfs*": {"__data_type__": "string"}},
+            "root": {"__data_type__": "integer"},
+        }
+        document = [{"chroot": {"rootfs": "a"}}, {"chroot": {}, "root": "1", "root_object_path": {"roots": 1}}]
+        output = Validator(schema, self.options).execute(document)
+        errors = [result.message for result in output.document_result if type(result) is Error]
+
+        assert errors == [ml.unknown_key("root[1].root_object_path"),
+                          ml.missing_required_key("root[1].chroot.rootfs"),
+                          ml.data_inequality("root[1].root", "integer", "string")]
+
+        output = Validator({"id": {}}, self.options).execute({"id": "1", "root_object_path_copy": 1})
+
+        assert [result.message for result in output.document_result if type(result) is Error] == [
+            ml.unknown_key("root_object_path_copy")]
+
+    def test_custom_filters_get_the_dotted_path(self):
+        validation = KeyPaths()
+        doc_validation_set.add(validation)
+
+        try:
+            schema = {"__data_type__": "object_array", "users": {"__data_type__": "object_array", "name": {}}}
+            output = Validator(schema, self.options).execute([{"users": [{"name": "a"}]}])
+        finally:
+            doc_validation_set.discard(validation)
+
+        assert [result.message for result in output.document_result if type(result) is Error] == ["str:root[0].users[0]"]
@@ -0,0 +1,97 @@
+import json
+import os
+
+import jsvl.config as cfg
+import jsvl.core.validator as validator_module
+from jsvl.core.validator import Validator, execute, compiled_schemas
+from jsvl.models.lru_cache import LRUCache
+from jsvl.utils.message_list import ml
+
+
+class TestSchemaCache:
+
+    def test_schema_file_is_compiled_once(self, tmp_path, monkeypatch):
+        calls = self.__count_compilations(monkeypatch)
+        schema_file = tmp_path / "order_schema.json"
+        schema_file.write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+
+        first = Validator(str(schema_file), {cfg.enable_output_logs: False})
+        second = Validator(str(tmp_path / "." / "order_schema.json"), {cfg.enable_output_logs: False})
+
+        assert len(calls) == 1
+        assert second.schema_doc is first.schema_doc
+        assert self.__messages(second.schema_result)[0] == ml.schema_file_loaded(
+            str(tmp_path / "." / "order_schema.json"))
+        assert self.__messages(second.schema_result)[1:] == self.__messages(first.schema_result)[1:]
+        assert not second.is_valid({"id": "1"})
+
+    def test_changed_schema_file_is_compiled_again(self, tmp_path, monkeypatch):
+        calls = self.__count_compilations(monkeypatch)
+        schema_file = tmp_path / "order_schema.json"
+        schema_file.write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+
+        assert not Validator(str(schema_file)).is_valid({"id": "1"})
+
+        schema_file.write_text(json.dumps({"id*": {"__data_type__": "string"}}))
+        stat = os.stat(schema_file)
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert Validator(str(schema_file)).is_valid({"id": "1"})
+        assert len(calls) == 2
+
+    def test_compile_configs_are_part_of_the_key(self, tmp_path, monkeypatch):
+        calls = self.__count_compilations(monkeypatch)
+        schema_file = tmp_path / "user_schema.json"
+        schema_file.write_text(json.dumps({"name": {}}))
+
+        assert Validator(str(schema_file)).is_valid({"name": "Al"})
+        assert not Validator(str(schema_file), {cfg.min_length: 3}).is_valid({"name": "Al"})
+        assert Validator(str(schema_file), {cfg.jobs: 4}).is_valid({"name": "Al"})
+        assert len(calls) == 2
+
+    def test_directory_schemas_are_compiled_once(self, tmp_path, monkeypatch):
+        calls = self.__count_compilations(monkeypatch)
+        schema_dir = tmp_path / "schemas"
+        doc_dir = tmp_path / "docs"
+        schema_dir.mkdir()
+        doc_dir.mkdir()
+
+        (schema_dir / "order_schema.json").write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+        (doc_dir / "order.json").write_text(json.dumps({"id": 1}))
+        for i in range(5):
+            (doc_dir / f"sub_{i}").mkdir()
+            (doc_dir / f"sub_{i}" / "order.json").write_text(json.dumps({"id": str(i)}))
+
+        for _ in range(2):
+            out = []
+            execute(str(schema_dir), str(doc_dir), out)
+            assert len(out) == 7
+
+        assert len(calls) == 1
+
+    def test_lru_cache(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def __count_compilations(self, monkeypatch) -> list:
+        calls = []
+        original = validator_module.compile_schema
+
+        def compile_schema(schema, ctx):
+            calls.append(schema)
+            return original(schema, ctx)
+
+        compiled_schemas.clear()
+        monkeypatch.setattr(validator_module, "compile_schema", compile_schema)
+        return calls
+
+    def __messages(self, results) -> list:
+        return [result.message for result in results]
@@ -0,0 +1,95 @@
+import json
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.models.schema import Schema, SchemaDoc
+from jsvl.utils.util import reserved_key
+
+
+def snapshot(schema: Schema) -> dict:
+    return {name: getattr(schema, name) for name in Schema.__slots__}
+
+
+class TestSchemaModel:
+
+    binder = {
+        "structure": {"floor": 4, "rooms": ["a", "b"]},
+        "names": {"first": "a"},
+        "locations": ["x", "y"],
+    }
+
+    def test_fields_are_compiled(self):
+        field = Schema("orders", {
+            "__data_type__": "object_array",
+            "__min_length__": 1,
+            "sku*": {"__data_type__": "string|integer"},
+            "count": {"__data_type__": "integer", "__min_value__": 1},
+            "sizes": {"__data_type__": "float_array", "__max_value__": 9.5},
+            "tags": {"__data_type__": "string_array"},
+            "code": {"__bind_regex__": "[A-Z]+"},
+        })
+
+        assert field.data_types == frozenset(["object_array"])
+        assert field.has_length_constraint and not field.has_value_constraint
+        assert field.child_keys == ["sku*", "count", "sizes", "tags", "code"]
+        assert field.child_key_set == frozenset(field.child_keys)
+
+        assert field.get("sku*").data_types == frozenset(["string", "integer"])
+        assert not field.get("sku*").has_length_constraint and not field.get("sku*").has_value_constraint
+        assert field.get("count").has_value_constraint and not field.get("count").has_item_value_constraint
+        assert field.get("sizes").has_item_value_constraint
+        assert not field.get("tags").has_item_value_constraint
+        assert field.get("code").regex_pattern.fullmatch("AB") and field.get("code").regex_compile_error is None
+        assert Schema("code", {"__bind_regex__": "["}).regex_compile_error is not None
+
+        # a field without a data type or without children
+        empty = Schema("note", {})
+        assert empty.data_types == frozenset() and empty.child_keys == [] and empty.child_key_set == frozenset()
+
+    def test_val_is_dict(self):
+        assert Schema("model", {"floor": {}}).val_is_dict() is True
+        assert Schema("locations", ["x", "y"]).val_is_dict() is False
+        assert Schema("name", "a").val_is_dict() is False
+
+        # only a dict holds child schemas, the traversal never descends below a list or a scalar
+        assert Schema("locations", ["x", "y"]).child_keys == []
+        assert Schema("name", "a").child_keys == []
+
+    def test_root_keys_are_compiled(self):
+        schema = {"__data_type__": "object_array", "id*": {"__data_type__": "integer"}, "name": {},
+                  reserved_key.binder: self.binder}
+        schema_doc = Validator(schema, {cfg.enable_output_logs: False}).schema_doc
+
+        assert type(schema_doc) is SchemaDoc
+        assert schema_doc.child_keys == ["id", "name"]
+        assert SchemaDoc().child_keys == []
+
+    def test_binders_are_compiled(self):
+        binder = Schema(reserved_key.binder, self.binder)
+
+        assert binder.get("structure").binding_has_numbers is True
+        assert binder.get("structure").binding_object_text == str(self.binder["structure"])
+        assert binder.get("names").binding_has_numbers is False
+        assert binder.get("locations").binding_array_text == json.dumps(self.binder["locations"], indent=4)
+        assert binder.get("locations").binding_index == frozenset(['"x"', '"y"'])
+
+        # only the children of __binder__ are binders
+        field = Schema("model", {"__bind__": "structure", "floor": {"__data_type__": "integer"}})
+        assert field.binding_object_text is None and field.binding_has_numbers is False
+        assert field.get("floor").binding_object_text is None
+        assert Schema("locations", ["x", "y"]).binding_index is None
+
+    def test_compiled_binders_are_not_written_by_the_validation(self):
+        schema = {
+            "model": {"__bind__": "structure"},
+            "location": {"__bind__": "locations"},
+            reserved_key.binder: self.binder,
+        }
+        validator = Validator(schema, {cfg.enable_output_logs: False})
+        binders = validator.schema_doc.get(reserved_key.binder).child_schema
+        before = {key: snapshot(binder) for key, binder in binders.items()}
+
+        assert not validator.is_valid({"model": {"floor": 4.0, "rooms": ["a", "b"]}, "location": "z"})
+        assert not validator.is_valid({"model": {"floor": 5}})
+
+        assert {key: snapshot(binder) for key, binder in binders.items()} == before
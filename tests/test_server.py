@@ -0,0 +1,194 @@
+import json
+import threading
+
+import pytest
+
+import jsvl.config as cfg
+import jsvl.core.server as server_module
+import jsvl.core.validator as validator_module
+from jsvl.core import client
+from jsvl.core.server import create_server, server_validators, output_as_dict
+from jsvl.core.validator import Validator, compiled_schemas, has_error
+from jsvl.utils.message_list import ml
+
+schema = {
+    "id*": {
+        "__data_type__": "integer"
+    },
+    "tags": {
+        "__data_type__": "string_array"
+    }
+}
+
+
+def start(server) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+
+    if server.executor is not None:
+        server.executor.shutdown()
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    monkeypatch.setitem(cfg.configs, cfg.enable_output_logs, False)
+    server = create_server(port=0)
+    start(server)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    stop(server)
+
+
+@pytest.fixture
+def unix_server(tmp_path, monkeypatch):
+    monkeypatch.setitem(cfg.configs, cfg.enable_output_logs, False)
+    socket_path = str(tmp_path / "jsvl.sock")
+    server = create_server(socket_path)
+    start(server)
+    yield f"unix:{socket_path}"
+    stop(server)
+
+
+def count_compilations(monkeypatch) -> list:
+    calls = []
+    original = validator_module.compile_schema
+
+    def compile_schema(schema, ctx):
+        calls.append(schema)
+        return original(schema, ctx)
+
+    compiled_schemas.clear()
+    server_validators.clear()
+    monkeypatch.setattr(validator_module, "compile_schema", compile_schema)
+    return calls
+
+
+@pytest.mark.parametrize("address", ["http_server", "unix_server"])
+def test_results_are_same_as_validator(address, request, tmp_path):
+    address = request.getfixturevalue(address)
+    schema_file = tmp_path / "order_schema.json"
+    schema_file.write_text(json.dumps(schema))
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text(json.dumps({"id": "1", "tags": [1]}))
+
+    for schema_source, document in [(schema, {"id": 1}), (json.dumps(schema), '{"id": "1"}'),
+                                     (str(schema_file), str(doc_file))]:
+        expected = Validator(schema_source, {cfg.enable_output_logs: False}).execute(document)
+        response = client.request_validation(address, schema_source, document)
+
+        assert response["outputs"] == [output_as_dict(expected)]
+        assert response["valid"] is not (has_error(expected.schema_result) or has_error(expected.document_result))
+
+
+def test_schemas_stay_compiled(http_server, tmp_path, monkeypatch):
+    calls = count_compilations(monkeypatch)
+    schema_file = tmp_path / "order_schema.json"
+    schema_file.write_text(json.dumps(schema))
+
+    for i in range(3):
+        assert client.request_validation(http_server, schema, {"id": i})["valid"]
+        assert not client.request_validation(http_server, str(schema_file), {"id": str(i)})["valid"]
+
+    assert len(calls) == 2
+
+
+def test_directory_and_schema_only_requests(unix_server, tmp_path):
+    (tmp_path / "schemas").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "schemas" / "order_schema.json").write_text(json.dumps(schema))
+    (tmp_path / "docs" / "order.json").write_text(json.dumps({"id": 1}))
+
+    response = client.request_validation(unix_server, str(tmp_path / "schemas"), str(tmp_path / "docs"))
+    assert response["valid"] and response["outputs"][-1]["document_result"][-1]["type"] == "success"
+
+    response = client.request_validation(unix_server, {"id*": {"__data_type__": "unknown"}})
+    assert not response["valid"] and response["outputs"][0]["document_result"] == []
+
+
+def test_bad_requests(http_server):
+    with pytest.raises(ValueError):
+        client.request_validation(http_server, None)
+
+
+def test_concurrent_requests(http_server):
+    results = []
+
+    def send(i):
+        results.append(client.request_validation(http_server, schema, {"id": i if i % 2 == 0 else str(i)})["valid"])
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False] * 8 + [True] * 8
+
+
+def test_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setitem(cfg.configs, cfg.enable_output_logs, False)
+    server = create_server(str(tmp_path / "jsvl.sock"), workers=2)
+    start(server)
+
+    try:
+        address = f"unix:{tmp_path / 'jsvl.sock'}"
+        assert [client.request_validation(address, schema, {"id": i})["valid"] for i in [1, "2"]] == [True, False]
+    finally:
+        stop(server)
+
+
+def test_client_exit_codes(unix_server, tmp_path, capsys):
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text(json.dumps({"id": 1}))
+
+    assert client.main(["--server", unix_server, "-s", json.dumps(schema), "-d", str(doc_file)]) == 0
+    assert client.main(["--server", unix_server, "-s", json.dumps(schema), "-d", '{"id": "1"}']) == 1
+    assert client.main(["--server", f"unix:{tmp_path / 'none.sock'}", "-s", json.dumps(schema)]) == 2
+    assert "Document validated." in capsys.readouterr().out
+
+
+def test_requests_to_other_hosts_are_rejected(http_server):
+    port = int(http_server.rpartition(":")[2])
+    body = json.dumps({"schema": schema, "document": {"id": 1}}).encode()
+
+    def send(host: str) -> bytes:
+        with client.connect(http_server) as sock:
+            sock.sendall(f"POST /validate HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode() + body)
+            return sock.recv(1 << 16).split(b"\r\n", 1)[0]
+
+    assert send("evil.example:8765") == b"HTTP/1.1 403 Forbidden"
+    assert send("127.0.0.1.evil.example") == b"HTTP/1.1 403 Forbidden"
+    assert send(f"localhost:{port}") == b"HTTP/1.1 200 OK"
+    assert send(f"127.0.0.1:{port}") == b"HTTP/1.1 200 OK"
+
+
+def test_failed_validations_are_answered(http_server, unix_server, tmp_path, monkeypatch):
+    def execute(schema, document, out):
+        raise OSError("documents can't be read")
+
+    monkeypatch.setattr(server_module, "execute", execute)
+
+    for address in [http_server, unix_server]:
+        response = client.request_validation(address, str(tmp_path), str(tmp_path))
+        assert response == {"valid": False, "error": "documents can't be read", "outputs": []}
+
+
+def test_inline_schemas_keep_their_key_order(http_server):
+    server_validators.clear()
+    first = {"name*": {"__data_type__": "string"}, "id*": {"__data_type__": "integer"}}
+    second = dict(reversed(first.items()))
+    errors = {"name*": ml.data_inequality("name", "string", "integer"),
+              "id*": ml.data_inequality("id", "integer", "string")}
+
+    for inline_schema in [first, second]:
+        response = client.request_validation(http_server, inline_schema, {"id": "1", "name": 1})
+        messages = [result["message"] for result in response["outputs"][0]["document_result"]
+                    if result["type"] == "error"]
+
+        assert messages == [errors[key] for key in inline_schema]
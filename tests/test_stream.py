@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.utils.json_stream import iter_array_items
+
+
+class SplitText(io.StringIO):
+    """
+    text file whose first read stops at the given position, the rest is read as asked
+    """
+
+    def __init__(self, text: str, split: int):
+        super().__init__(text)
+        self.split = split
+
+    def read(self, size=-1):
+        if self.split is not None:
+            size, self.split = self.split, None
+        return super().read(size)
+
+
+class TestStream:
+
+    schema = {
+        "__min_length__": 2,
+        "__max_length__": 3,
+        "__data_type__": "object_array",
+        "id*": {
+            "__data_type__": "integer"
+        },
+        "tags": {
+            "__data_type__": "string_array"
+        }
+    }
+
+    documents = [
+        [{"id": 1, "tags": ["a"]}, {"id": "2"}, {"name": "x"}, {"id": 4}],
+        [{"id": 1}, {"id": 2}],
+        [{"id": 1}, 2, {"id": "3"}],
+        [{"id": 1}],
+        ["a", "b"],
+        [1, 2.5],
+        [[1], [2]],
+        [],
+        {"id": "1"},
+    ]
+
+    @pytest.mark.parametrize("document", documents)
+    def test_stream_results_are_same(self, tmp_path, document):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_text(json.dumps(document, indent=2))
+
+        expected = Validator(self.schema, {cfg.enable_output_logs: False}).execute(document)
+        actual = Validator(self.schema, {cfg.enable_output_logs: False, cfg.stream: True}).execute(str(doc_file))
+
+        assert self.__messages(actual.document_result) == self.__messages(expected.document_result)
+
+    def test_invalid_stream_document(self, tmp_path):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_text('[{"id": 1}, {"id": 2}')
+
+        output = Validator(self.schema, {cfg.enable_output_logs: False, cfg.stream: True}).execute(str(doc_file))
+
+        assert self.__messages(output.document_result)[-1] == (
+            f"Document: {doc_file} is not a valid json file, Unterminated array at the end of the document.")
+
+    @pytest.mark.parametrize("content", [b'\xff[{"id": 1}]', b'[{"id": 1}, {"id": "\xff"}]'])
+    def test_stream_document_which_is_not_utf_8(self, tmp_path, content):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_bytes(content)
+
+        output = Validator(self.schema, {cfg.enable_output_logs: False, cfg.stream: True}).execute(str(doc_file))
+
+        assert self.__messages(output.document_result)[-1].startswith(f"Document: {doc_file} is not a valid json file")
+
+    @pytest.mark.parametrize("text", ['[{"id": 1}] trailing garbage', '[{"id": 1}, {"id": 2}][{"id": 3}]'])
+    def test_content_after_the_stream_document(self, tmp_path, text):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_text(text)
+
+        output = Validator(self.schema, {cfg.enable_output_logs: False, cfg.stream: True}).execute(str(doc_file))
+
+        assert self.__messages(output.document_result)[-1].startswith(f"Document: {doc_file} is not a valid json file")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+    def test_iter_array_items(self, chunk_size):
+        items = [12345, -1.5e10, "a,]b", {"x": [1, {"y": "]"}]}, [], True, None]
+        text = f" \n{json.dumps(items)} "
+
+        assert list(iter_array_items(io.StringIO(text), chunk_size)) == items
+
+    numbers = "[123.5, 1.5e10, 7, -0.25E-3, 2e+8, 10]"
+
+    @pytest.mark.parametrize("split", range(1, len(numbers)))
+    def test_numbers_split_between_chunks(self, split):
+        file = SplitText(self.numbers, split)
+
+        assert list(iter_array_items(file, len(self.numbers))) == json.loads(self.numbers)
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 10])
+    def test_float_array_file(self, tmp_path, chunk_size):
+        doc_file = tmp_path / "document.json"
+        doc_file.write_text("[123.5, 1.5e10, 7]")
+
+        with open(doc_file) as file:
+            assert list(iter_array_items(file, chunk_size)) == [123.5, 1.5e10, 7]
+
+    @pytest.mark.parametrize("text", ["[1,", "[1 2]", "[1,]", "{}", "[", "[,1]",
+                                      "[1] trailing garbage", "[1][2]"])
+    def test_iter_invalid_array_items(self, text):
+        with pytest.raises(ValueError):
+            list(iter_array_items(io.StringIO(text), 2))
+
+    def __messages(self, results) -> list:
+        return [result.message for result in results]
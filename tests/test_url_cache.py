@@ -0,0 +1,144 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator
+from jsvl.utils.message_list import ml
+from jsvl.utils.url_cache import UrlCache, UrlNotCached
+
+
+class SchemaServer:
+    """
+    local stand-in of a schema host, it answers conditional requests with 304 and counts the requests
+    """
+
+    def __init__(self):
+        self.content = json.dumps({"id*": {"__data_type__": "integer"}}).encode()
+        self.version = 1
+        self.delay = 0
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                etag = f'"v{server.version}"'
+                server.requests.append(self.headers.get("If-None-Match"))
+                time.sleep(server.delay)
+
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(server.content)))
+                self.end_headers()
+                self.wfile.write(server.content)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/order_schema.json"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def change(self, schema: dict):
+        self.content = json.dumps(schema).encode()
+        self.version += 1
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    schema_server = SchemaServer()
+    yield schema_server
+    schema_server.stop()
+
+
+def test_cached_content_is_used_until_the_ttl_expires(server, tmp_path):
+    cache = UrlCache()
+
+    assert cache.fetch(server.url, str(tmp_path), 60) == server.content
+    assert cache.fetch(server.url, str(tmp_path), 60) == server.content
+    assert server.requests == [None]
+
+    # a new process finds the content on disk
+    assert UrlCache().fetch(server.url, str(tmp_path), 60) == server.content
+    assert len(server.requests) == 1
+
+
+def test_expired_content_is_revalidated(server, tmp_path):
+    cache = UrlCache()
+    content = server.content
+
+    assert cache.fetch(server.url, str(tmp_path), 0) == content
+    assert cache.fetch(server.url, str(tmp_path), 0) == content
+    assert server.requests == [None, '"v1"']
+
+    server.change({"id*": {"__data_type__": "string"}})
+
+    assert cache.fetch(server.url, str(tmp_path), 0) == server.content
+    assert cache.fetch(server.url, str(tmp_path), 0) == server.content
+    assert server.requests == [None, '"v1"', '"v1"', '"v2"']
+
+
+def test_offline(server, tmp_path):
+    cache = UrlCache()
+
+    with pytest.raises(UrlNotCached):
+        cache.fetch(server.url, str(tmp_path), 0, True)
+
+    cache.fetch(server.url, str(tmp_path), 0)
+    server.change({})
+
+    assert cache.fetch(server.url, str(tmp_path), 0, True) != server.content
+    assert len(server.requests) == 1
+
+
+def test_stale_content_is_used_when_the_server_is_down(server, tmp_path):
+    cache = UrlCache()
+    content = cache.fetch(server.url, str(tmp_path), 0)
+    server.stop()
+
+    assert cache.fetch(server.url, str(tmp_path), 0) == content
+
+    with pytest.raises(OSError):
+        cache.fetch(server.url, None, 0)
+
+
+def test_concurrent_fetches_share_one_request(server, tmp_path):
+    cache = UrlCache()
+    server.delay = 0.2
+
+    with ThreadPoolExecutor(8) as executor:
+        contents = list(executor.map(lambda _: cache.fetch(server.url, str(tmp_path), 60), range(8)))
+
+    assert contents == [server.content] * 8
+    assert len(server.requests) == 1
+
+
+def test_validator_with_url_schema(server, tmp_path):
+    options = {cfg.enable_output_logs: False, cfg.url_cache_dir: str(tmp_path), cfg.url_cache_ttl: 60}
+
+    for _ in range(3):
+        validator = Validator(server.url, options)
+        assert not validator.is_valid({"id": "1"})
+
+    assert len(server.requests) == 1
+
+    server.stop()
+    validator = Validator("http://127.0.0.1:1/order_schema.json", {**options, cfg.offline: True})
+
+    assert str(list(validator.schema_result)[-1].message) == ml.url_not_cached(
+        "http://127.0.0.1:1/order_schema.json")
@@ -1,4 +1,11 @@
-from jsvl.utils.util import converted_type
+import io
+import re
+
+from jsvl.models.object_set import ObjectSet
+from jsvl.models.result import Error
+from jsvl.models.schema import Schema
+from jsvl.utils.util import converted_type, compile_regex, regex_keys, is_same_value, \
+    has_number_values, parse_json, source_type, source_type_cls, parse_source
 
 
 def test_converted_type():
@@ -18,3 +25,95 @@ def test_converted_type():
     assert converted_type(["", 1, 0.2, {}, False]) == "array"
     assert converted_type(["", "", 0.2, {}, False]) == "array"
     assert converted_type([[]]) == "array"
+
+
+def test_object_set():
+    object_set = ObjectSet()
+
+    for message in ["b", "a", "b", "c", "a"]:
+        object_set.add(Error(message))
+
+    assert [result.message for result in object_set.item_set()] == ["b", "a", "c"]
+    assert [result.message for result in object_set.take_new_items()] == ["b", "a", "c"]
+
+    object_set.add(Error("d"))
+    object_set.add(Error("a"))
+
+    assert [result.message for result in object_set.take_new_items()] == ["d"]
+    assert len(object_set.take_new_items()) == 0
+
+
+def test_compile_regex():
+    assert compile_regex("__email__").pattern == regex_keys["__email__"]
+    assert compile_regex("^[a-z]+$") is compile_regex("^[a-z]+$")
+
+    first = Schema("root", {"a": {"__bind_regex__": "^x+$"}, "b": {"__bind_regex__": "^x+$"}})
+    second = Schema("root", {"c": {"__bind_regex__": "^x+$"}})
+    assert first.get("a").regex_pattern is first.get("b").regex_pattern is second.get("c").regex_pattern
+
+    invalid = Schema("root", {"a": {"__bind_regex__": "[a-z"}})
+    assert invalid.get("a").regex_pattern is None
+    assert isinstance(invalid.get("a").regex_compile_error, re.error)
+
+
+def test_is_same_value():
+    assert is_same_value({"a": 1, "b": {"c": [1, 2]}}, {"b": {"c": [1, 2]}, "a": 1})
+    assert not is_same_value({"a": 1}, {"a": 1.0})
+    assert not is_same_value({"a": 1}, {"a": True})
+    assert not is_same_value({"a": 1}, {"a": 1, "b": 2})
+    assert not is_same_value({"a": 1, "b": 2}, {"a": 1, "c": 2})
+    assert not is_same_value({"c": [1, 2]}, {"c": [2, 1]})
+    assert not is_same_value({"a": 1}, "{'a': 1}")
+
+
+def test_has_number_values():
+    assert not has_number_values({"a": "1", "b": [None, {"c": "x"}]})
+    assert has_number_values({"a": "1", "b": [None, {"c": 1}]})
+    assert has_number_values({"a": [False]})
+    assert has_number_values({"a": 0.5})
+
+
+def test_parse_json():
+    document = {"a": 1}
+    assert parse_json(document) == (document, None)
+    assert parse_json('[1, "a"]') == ([1, "a"], None)
+
+    value, error = parse_json('{"a": 1,}', "json")
+    assert value is None
+    assert (error.lineno, error.colno, error.pos) == (1, 9, 8)
+
+    assert parse_json(None)[1] is not None
+    assert parse_json("path/to/file.json")[1] is not None
+
+
+def test_source_type(tmp_path):
+    doc_file = tmp_path / "order.json"
+    doc_file.write_text('{"id": 1}')
+
+    assert source_type({"id": 1}) == source_type_cls.inline
+    assert source_type([{"id": 1}]) == source_type_cls.inline
+    assert source_type(' \n{"id": 1}') == source_type_cls.json_text
+    assert source_type("1") == source_type_cls.json_text
+    assert source_type(b'{"id": 1}') == source_type_cls.bytes
+    assert source_type(str(doc_file)) == source_type_cls.file
+    assert doc_file.exists() and source_type(doc_file) == source_type_cls.file
+    assert source_type(tmp_path) == source_type_cls.dir
+    assert source_type("https://www.example.com/schema.json") == source_type_cls.url
+    assert source_type(io.StringIO('{"id": 1}')) == source_type_cls.stream
+    assert source_type(1) == source_type_cls.unknown
+
+    assert parse_source(memoryview(b'[1]'), source_type_cls.bytes) == ([1], None)
+    assert parse_source(io.BytesIO(b'{"id": 1}'), source_type_cls.stream) == ({"id": 1}, None)
+    assert parse_source(str(doc_file), source_type_cls.file)[1] is not None
+
+
+def test_source_type_of_inline_json_skips_path_checks(monkeypatch):
+    checked = []
+    monkeypatch.setattr("os.path.isfile", lambda path: checked.append(path))
+    monkeypatch.setattr("os.path.isdir", lambda path: checked.append(path))
+
+    assert source_type({"id": 1}) == source_type_cls.inline
+    assert source_type('{"id": 1}') == source_type_cls.json_text
+    assert source_type('\t\r\n [1]') == source_type_cls.json_text
+    assert source_type(" " * (1 << 20) + "[" + "1," * (1 << 20) + "1]") == source_type_cls.json_text
+    assert checked == []
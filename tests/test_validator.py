@@ -0,0 +1,231 @@
+import io
+import json
+
+import jsvl.config as cfg
+from jsvl.core.validator import Validator, validate, execute
+from jsvl.models.result import Error
+from jsvl.utils import json_decoder
+from jsvl.utils.message_list import ml
+
+
+class TestValidator:
+
+    schema = {
+        "id*": {
+            "__data_type__": "integer"
+        },
+        "name": {
+            "__min_length__": 3
+        },
+        "tags": {
+            "__data_type__": "string_array"
+        }
+    }
+
+    def test_validate_many_documents(self):
+        validator = Validator(self.schema, {cfg.enable_output_logs: False})
+
+        documents = [
+            {"id": 1, "name": "Owais", "tags": ["a"]},
+            {"name": "Al"},
+            {"id": "2", "tags": [1]},
+            {"id": 3},
+        ]
+
+        for document in documents:
+            expected_logs = self.__messages(validate(self.schema.copy(), document)[0].document_result)
+            actual_logs = self.__messages(validator.validate(document).document_result)
+
+            assert actual_logs == expected_logs
+
+    def test_results_are_not_shared(self):
+        validator = Validator(self.schema, {cfg.enable_output_logs: False})
+
+        first = validator.validate({"name": "Al"})
+        second = validator.validate({"id": 1})
+
+        assert ml.missing_required_key("id") in self.__messages(first.document_result)
+        assert ml.missing_required_key("id") not in self.__messages(second.document_result)
+        assert ml.document_successfully_validated() in self.__messages(second.document_result)
+
+    def test_schema_is_not_modified(self):
+        schema = {"id": {}}
+        Validator(schema, {cfg.enable_output_logs: False})
+
+        assert schema == {"id": {}}
+
+    def test_invalid_schema(self):
+        validator = Validator({"id": {"__data_type__": "number"}}, {cfg.enable_output_logs: False})
+        output = validator.validate({"id": 1})
+
+        assert not validator.is_schema_valid()
+        assert any(type(result) is Error for result in output.schema_result)
+        assert len(output.document_result) == 0
+
+    def test_options_override_defaults(self):
+        validator = Validator({"name": {}}, {cfg.enable_output_logs: False, cfg.min_length: 5})
+        output = validator.validate({"name": "Owais Ali"})
+
+        assert ml.document_successfully_validated() in self.__messages(output.document_result)
+        assert ml.min_length_error("name", 5, 3, "character(s)") in self.__messages(
+            validator.validate({"name": "Ali"}).document_result)
+
+    def test_fields_and_unknown_keys_in_one_traversal(self):
+        schema = {
+            "id*": {"__data_type__": "integer"},
+            "~meta": {"__data_type__": "object", "owner": {"__data_type__": "string"}},
+            "profile": {
+                "__data_type__": "object",
+                "name*": {"__min_length__": 3},
+                "address": {"__data_type__": "object", "city": {"__case__": "__upper__"}}
+            },
+            "orders": {
+                "__data_type__": "object_array",
+                "sku*": {"__bind_regex__": "__numeric__"},
+                "qty": {"__data_type__": "integer", "__min_value__": 1}
+            },
+            "tags": {"__data_type__": "string_array"},
+            "model": {"__bind__": "structure"},
+            "__binder__": {"structure": {"floor": 4}}
+        }
+
+        documents = [
+            {
+                "id": 1,
+                "meta": {"owner": 5, "extra": {"deep": 1}},
+                "profile": {"name": "Al", "nick": "a", "address": {"city": "khi", "zip": 1}},
+                "orders": [{"sku": "12", "qty": 0, "note": "x"}, {"qty": 2}, "bad", {"sku": "ab", "gift": {"wrap": 1}}],
+                "tags": ["a", "b"],
+                "model": {"floor": 4},
+                "unknown": {"child": {"grand": 1}}
+            },
+            {"id": "2", "profile": {"address": [{"city": "LHR", "x": 1}]}, "orders": [], "extra": 1},
+        ]
+
+        # same results as the former separate traversals for the fields and for the unknown keys
+        expected_logs = [
+            ml.data_inequality("root[0].meta.owner", "string", "integer"),
+            ml.unknown_key("root[0].model.floor"),
+            ml.data_inequality("root[0].orders", "object_array", "array"),
+            ml.unknown_key("root[0].orders[0].note"),
+            ml.min_value_error("root[0].orders[0].qty", 1, 0),
+            ml.missing_required_key("root[0].orders[1].sku"),
+            ml.unknown_key("root[0].orders[3].gift"),
+            ml.regex_binding_error("root[0].orders[3].sku", None),
+            ml.uppercase_error("root[0].profile.address.city"),
+            ml.unknown_key("root[0].profile.address.zip"),
+            ml.min_length_error("root[0].profile.name", 3, 2, "character(s)"),
+            ml.unknown_key("root[0].profile.nick"),
+            ml.unknown_key("root[0].unknown"),
+            ml.unknown_key("root[1].extra"),
+            ml.data_inequality("root[1].id", "integer", "string"),
+            ml.data_inequality("root[1].orders", "object_array", "array"),
+            ml.data_inequality("root[1].profile.address", "object", "object_array"),
+            ml.unknown_key("root[1].profile.address[0].x"),
+            ml.missing_required_key("root[1].profile.name"),
+        ]
+
+        output = Validator(schema, {cfg.enable_output_logs: False}).validate(documents)
+
+        assert sorted(self.__messages(output.document_result)) == sorted(expected_logs)
+
+    def test_directory_documents_are_paired_by_schema_file_name(self, tmp_path):
+        schema_dir = tmp_path / "schemas"
+        doc_dir = tmp_path / "docs"
+        (schema_dir / "nested").mkdir(parents=True)
+        (schema_dir / "order_schema.json.d").mkdir()
+        doc_dir.mkdir()
+
+        (schema_dir / "order_schema.json").write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+        (schema_dir / "nested" / "order_schema.json").write_text(json.dumps({"id*": {"__data_type__": "string"}}))
+        (schema_dir / "order_schema.json.d" / "user_schema.json").write_text(json.dumps({"name*": {}}))
+        (schema_dir / "a_order_schema.json").write_text(json.dumps({"code*": {}}))
+
+        (doc_dir / "order.json").write_text(json.dumps({"id": 1}))
+        (doc_dir / "user.json").write_text(json.dumps({"name": "Al"}))
+        (doc_dir / "a_order.json").write_text(json.dumps({"id": 1}))
+        (doc_dir / "item.json").write_text(json.dumps({"id": 1}))
+
+        out = []
+        execute(str(schema_dir), str(doc_dir), out)
+        messages = [self.__messages(output.schema_result) + self.__messages(output.document_result) for output in out]
+
+        postfix = cfg.configs.get(cfg.schema_file_postfix)
+        assert ml.duplicate_schema_file(str(schema_dir / "order_schema.json"),
+                                        str(schema_dir / "nested" / "order_schema.json")) in messages[0]
+        assert ml.no_schema_found(f"item{postfix}") in messages[0]
+
+        # a_order.json, order.json and user.json in sorted order
+        assert ml.missing_required_key("code") in messages[1]
+        assert ml.data_inequality("id", "string", "integer") in messages[2]
+        assert ml.document_successfully_validated() in messages[3]
+
+    def test_directory_documents_with_a_schema_file(self, tmp_path):
+        schema_file = tmp_path / "order_schema.json"
+        doc_dir = tmp_path / "docs"
+        doc_dir.mkdir()
+        (doc_dir / "order.json").write_text(json.dumps({"id": "1"}))
+        (doc_dir / "user.json").write_text(json.dumps({"id": 1}))
+
+        schema_file.write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+        out = []
+        execute(str(schema_file), str(doc_dir), out)
+
+        assert [ml.data_inequality("id", "integer", "string") in self.__messages(output.document_result)
+                for output in out[1:]] == [True, False]
+
+        # every document is paired with the schema file, which should hold an object
+        schema_file.write_text(json.dumps([{"id*": {"__data_type__": "integer"}}]))
+        out = []
+        execute(str(schema_file), str(doc_dir), out)
+
+        assert len(out) == 1 and ml.schema_root_object() in self.__messages(out[0].schema_result)
+
+    def test_inputs_are_parsed_once(self, tmp_path, monkeypatch):
+        schema_file = tmp_path / "order_schema.json"
+        doc_file = tmp_path / "order.json"
+        schema_file.write_text(json.dumps({"id*": {"__data_type__": "integer"}, "tags": {}}))
+        doc_file.write_text(json.dumps({"id": "1", "tags": "a"}))
+
+        parsed = []
+        loads = json_decoder.loads
+
+        def count_loads(source, *args, **kwargs):
+            parsed.append(source if type(source) is str else bytes(source).decode())
+            return loads(source, *args, **kwargs)
+
+        monkeypatch.setattr(json_decoder, "loads", count_loads)
+
+        for schema, document in [(str(schema_file), str(doc_file)), (schema_file.read_text(), doc_file.read_text())]:
+            parsed.clear()
+            output = validate(schema, document)[0]
+
+            assert ml.data_inequality("id", "integer", "string") in self.__messages(output.document_result)
+            assert len([source for source in parsed if "__data_type__" in source]) == 1
+            assert len([source for source in parsed if '"tags": "a"' in source]) == 1
+
+    def test_invalid_document_file_reports_the_position(self, tmp_path):
+        doc_file = tmp_path / "order.json"
+        doc_file.write_text('{"id": 1,\n}')
+
+        output = Validator({"id": {}}, {cfg.enable_output_logs: False, cfg.json_decoder: "json"}).validate(
+            str(doc_file))
+        error = "Expecting property name enclosed in double quotes: line 2 column 1 (char 10)"
+
+        assert self.__messages(output.document_result) == [ml.invalid_doc_file(str(doc_file), error)]
+
+    def test_input_sources(self, tmp_path):
+        schema = {"id*": {"__data_type__": "integer"}}
+        doc_file = tmp_path / "order.json"
+        doc_file.write_text(json.dumps({"id": "1"}))
+        expected = ml.data_inequality("id", "integer", "string")
+
+        for document in [{"id": "1"}, '{"id": "1"}', b'{"id": "1"}', doc_file, io.BytesIO(b'{"id": "1"}')]:
+            assert expected in self.__messages(validate(schema, document)[0].document_result)
+            assert expected in self.__messages(Validator(schema, {cfg.enable_output_logs: False}).validate(
+                document if not isinstance(document, io.BytesIO) else io.BytesIO(document.getvalue())).document_result)
+
+        assert ml.invalid_provided_document() in self.__messages(validate(schema, 1)[0].document_result)
+
+    def __messages(self, results) -> list:
+        return [result.message for result in results]
@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+import jsvl.config as cfg
+from jsvl.core.watcher import Watcher
+from jsvl.utils.message_list import ml
+
+
+class TestWatcher:
+
+    options = {cfg.enable_output_logs: False}
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "docs" / "sub").mkdir(parents=True)
+        (tmp_path / "schemas" / "order_schema.json").write_text(json.dumps({"id*": {"__data_type__": "integer"}}))
+        (tmp_path / "schemas" / "user_schema.json").write_text(json.dumps({"name*": {"__data_type__": "string"}}))
+        (tmp_path / "docs" / "order.json").write_text(json.dumps({"id": 1}))
+        (tmp_path / "docs" / "order_2.json").write_text(json.dumps({"id": 2}))
+        (tmp_path / "docs" / "sub" / "user.json").write_text(json.dumps({"name": "a"}))
+        return tmp_path
+
+    def test_only_changed_documents_are_validated(self, tree):
+        watcher = Watcher(str(tree / "schemas"), str(tree / "docs"), self.options)
+
+        assert self.__validated(watcher.poll()) == [str(tree / "docs" / "order.json"),
+                                                    str(tree / "docs" / "sub" / "user.json")]
+        assert watcher.poll() == []
+
+        (tree / "docs" / "order.json").write_text(json.dumps({"id": "1"}))
+        (tree / "docs" / "sub" / "user.json").write_text(json.dumps({"name": "a"}))
+
+        out = watcher.poll()
+        assert self.__validated(out) == [str(tree / "docs" / "order.json")]
+        assert ml.data_inequality("id", "integer", "string") in self.__messages(out)
+
+    def test_documents_of_a_changed_schema_are_validated(self, tree):
+        watcher = Watcher(str(tree / "schemas"), str(tree / "docs"), self.options)
+        watcher.poll()
+
+        (tree / "schemas" / "user_schema.json").write_text(json.dumps({"name*": {"__data_type__": "integer"}}))
+
+        out = watcher.poll()
+        assert self.__validated(out) == [str(tree / "docs" / "sub" / "user.json")]
+        assert ml.data_inequality("name", "integer", "string") in self.__messages(out)
+
+        # a new schema file pairs the documents waiting for it
+        (tree / "schemas" / "order_2_schema.json").write_text(json.dumps({"id*": {"__data_type__": "string"}}))
+
+        assert self.__validated(watcher.poll()) == [str(tree / "docs" / "order_2.json")]
+
+    def test_schema_file(self, tree):
+        schema_file = tree / "schemas" / "order_schema.json"
+        watcher = Watcher(str(schema_file), str(tree / "docs"), self.options)
+
+        assert len(self.__validated(watcher.poll())) == 3
+
+        schema_file.write_text(json.dumps({"id": {"__data_type__": "integer"}}))
+
+        assert len(self.__validated(watcher.poll())) == 3
+
+    @pytest.mark.parametrize("schema_dir", [True, False])
+    def test_schema_changed_within_the_same_mtime_and_size(self, tree, schema_dir):
+        schema_file = tree / "schemas" / "order_schema.json"
+        watcher = Watcher(str(tree / "schemas") if schema_dir else str(schema_file), str(tree / "docs"), self.options)
+        assert ml.data_inequality("id", "integer", "string") not in self.__messages(watcher.poll())
+
+        # an edit in the racy window, the schema keeps its mtime and size
+        stat = os.stat(schema_file)
+        schema_file.write_text(schema_file.read_text().replace('"integer"', '"string" '))
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(schema_file).st_size == stat.st_size
+
+        out = watcher.poll()
+        assert str(tree / "docs" / "order.json") in self.__validated(out)
+        assert ml.data_inequality("id", "string", "integer") in self.__messages(out)
+
+    def test_removed_documents_are_reported(self, tree):
+        watcher = Watcher({"id*": {"__data_type__": "integer"}}, str(tree / "docs"), self.options)
+        watcher.poll()
+
+        (tree / "docs" / "order.json").unlink()
+
+        out = watcher.poll()
+        assert self.__messages(out) == [ml.file_removed(str(tree / "docs" / "order.json"))]
+
+    def test_document_should_be_a_path(self):
+        with pytest.raises(ValueError):
+            Watcher({"id*": {"__data_type__": "integer"}}, {"id": 1}, self.options)
+
+    def __validated(self, out) -> list:
+        return [result.message.split("Loaded document from: ")[1][:-1] for output in out
+                for result in output.schema_result if str(result.message).startswith("Loaded document from: ")]
+
+    def __messages(self, out) -> list:
+        return [result.message for output in out for result in list(output.schema_result) + list(output.document_result)]